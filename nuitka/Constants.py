@@ -22,6 +22,8 @@ This contains tools to compare, classify and test constants.
 
 import math
 
+from types import CodeType
+
 # pylint: disable=W0622
 from .__past__ import long, unicode, iterItems
 # pylint: enable=W0622
@@ -98,6 +100,11 @@ def compareConstants(a, b):
     if type( a ) is range:
         return str( a ) == str( b )
 
+    # Code objects compare equal regardless of their filename, but for
+    # tracebacks, that does matter.
+    if type( a ) is CodeType:
+        return a == b and a.co_filename == b.co_filename
+
     # The NaN values of float and complex may let this fail, even if the
     # constants are built in the same way.
     return a == b
@@ -133,7 +140,7 @@ def isConstant(constant):
                 return False
         else:
             return True
-    elif constant_type in (tuple, list):
+    elif constant_type in (tuple, list, frozenset):
         for element_value in constant:
             if not isConstant(element_value):
                 return False
@@ -159,7 +166,7 @@ def isMutable(constant):
     constant_type = type( constant )
 
     if constant_type in ( str, unicode, complex, int, long, bool, float,
-                          NoneType, range, bytes ):
+                          NoneType, range, bytes, frozenset ):
         return False
     elif constant_type in ( dict, list, set ):
         return True
@@ -41,6 +41,8 @@ from .build import SconsInterface
 
 from .codegen import CodeGeneration, ConstantCodes
 
+from .__past__ import iterItems
+
 from .optimizations import Optimization
 from .finalizations import Finalization
 
@@ -77,6 +79,23 @@ def createNodeTree(filename):
     )
     ModuleRegistry.addRootModule(main_module)
 
+    # In shared runtime mode, the other given modules are compiled along with
+    # it, each one to an extension module of its own.
+    if Options.shallUseSharedRuntime():
+        for extra_filename in Options.getPositionalArgs()[1:]:
+            extra_module = Building.buildModuleTree(
+                filename = extra_filename,
+                package  = None,
+                is_top   = True,
+                is_main  = False
+            )
+            ModuleRegistry.addRootModule(extra_module)
+
+            Utils.deleteFile(
+                path       = getResultFullpath(extra_module),
+                must_exist = False
+            )
+
     # First remove old object files and old generated files, old binary or
     # module, and standalone mode program directory if any, they can only do
     # harm.
@@ -282,6 +301,11 @@ def makeSourceDirectory(main_module):
 
     module_hpps = []
 
+    # For shared runtime mode, the contexts of the modules given, and the ones
+    # that become part of the runtime.
+    module_contexts = {}
+    runtime_contexts = []
+
     for module in sorted(modules, key = lambda x : x.getFullName()):
         if module.isPythonModule():
             cpp_filename, hpp_filename = module_filenames[module]
@@ -292,10 +316,16 @@ def makeSourceDirectory(main_module):
                   module         = module,
                   module_name    = module.getFullName(),
                   other_modules  = other_modules
-                                     if module is main_module else
+                                     if module is main_module and \
+                                        not Options.shallUseSharedRuntime() else
                                    ()
             )
 
+            if module in ModuleRegistry.getRootModules():
+                module_contexts[module_context] = cpp_filename
+            else:
+                runtime_contexts.append(module_context)
+
             # The main of an executable module gets a bit different code.
             if module is main_module and not Options.shallMakeModule():
                 source_code = CodeGeneration.generateMainCode(
@@ -353,11 +383,29 @@ def makeSourceDirectory(main_module):
         )
     )
 
-    writeSourceCode(
-        filename    = Utils.joinpath( source_dir, "__constants.cpp" ),
-        source_code = CodeGeneration.generateConstantsDefinitionCode(
+    if Options.shallUseSharedRuntime():
+        constants_code, module_constants_codes = \
+          CodeGeneration.generateSharedRuntimeConstantsCode(
+            context          = global_context,
+            module_contexts  = list(module_contexts.keys()),
+            runtime_contexts = runtime_contexts
+        )
+
+        for module_context, module_constants_code in \
+              iterItems(module_constants_codes):
+            writeSourceCode(
+                filename    = module_contexts[module_context][:-4] + \
+                              "@constants.cpp",
+                source_code = module_constants_code
+            )
+    else:
+        constants_code = CodeGeneration.generateConstantsDefinitionCode(
             context = global_context
         )
+
+    writeSourceCode(
+        filename    = Utils.joinpath( source_dir, "__constants.cpp" ),
+        source_code = constants_code
     )
 
     helper_decl_code, helper_impl_code = CodeGeneration.generateHelpersCode()
@@ -439,6 +487,25 @@ def runScons(main_module, quiet):
     if Options.isStandaloneMode():
         options["standalone_mode"] = "true"
 
+    if Options.shallUseSharedRuntime():
+        options["shared_runtime"] = "true"
+
+    if Options.isTraceStartup():
+        options["trace_startup"] = "true"
+
+    if Options.isStacklessGenerators():
+        options["stackless_generators"] = "true"
+
+    if Options.getCallFreeLoopTicks() is not None:
+        options["call_free_loop_ticks"] = str(
+            Options.getCallFreeLoopTicks()
+        )
+
+    if Options.getGeneratorStackSize():
+        options["generator_stack_size"] = str(
+            Options.getGeneratorStackSize() * 1024
+        )
+
     if getFrozenModuleCount():
         options["frozen_modules"] = str(
             getFrozenModuleCount()
@@ -718,13 +785,14 @@ def main():
         # Modules should not be executable, but Scons creates them like it, fix
         # it up here.
         if Utils.getOS() != "Windows" and Options.shallMakeModule():
-            subprocess.call(
-                (
-                    "chmod",
-                    "-x",
-                    getResultFullpath(main_module)
+            for module in ModuleRegistry.getRootModules():
+                subprocess.call(
+                    (
+                        "chmod",
+                        "-x",
+                        getResultFullpath(module)
+                    )
                 )
-            )
 
         # Execute the module immediately if option was given.
         if Options.shallExecuteImmediately():
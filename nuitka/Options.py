@@ -62,6 +62,19 @@ parser.add_option(
 Create an extension module executable instead of a program. Defaults to off."""
 )
 
+parser.add_option(
+    "--shared-runtime",
+    action  = "store_true",
+    dest    = "shared_runtime",
+    default = False,
+    help    = """\
+In module mode, compile all given modules together, each into an extension
+module of its own. These then share the "libnuitka-runtime" library created
+next to them, which contains the Nuitka run time and the constants used by
+more than one of them. Imports are not followed in this mode. Defaults to
+off."""
+)
+
 parser.add_option(
     "--standalone", "--portable",
     action  = "store_true",
@@ -267,6 +280,43 @@ Statements shall have their line numbers set. Disable this for less precise
 exceptions and slightly faster code. Not recommended. Defaults to off."""
 )
 
+codegen_group.add_option(
+    "--code-gen-error-lines",
+    action  = "store_true",
+    dest    = "error_lines",
+    default = False,
+    help    = """\
+Set the line numbers of statements only when leaving them with an exception,
+instead of before executing them. Tracebacks remain precise, but frames of
+running code, e.g. as seen by "inspect.stack()", may show outdated lines.
+Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--stackless-generators",
+    action  = "store_true",
+    dest    = "stackless_generators",
+    default = False,
+    help    = """\
+Compile generators to resumable functions that keep their state in the heap
+and return at each yield, instead of running them on their own machine stack
+with context switches. Uses less memory per generator and makes yields
+cheaper. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--call-free-loop-ticks",
+    action  = "store",
+    dest    = "call_free_loop_ticks",
+    metavar = "N",
+    type    = "int",
+    default = None,
+    help    = """\
+Number of iterations of loops without calls, that count as one tick towards
+considering a thread switch. Only loops of nothing but variable assignments and
+identity checks are known to make no calls. Defaults to 16."""
+)
+
 codegen_group.add_option(
     "--no-optimization",
     action  = "store_true",
@@ -307,6 +357,19 @@ Defaults to off."""
 
 parser.add_option_group( outputdir_group )
 
+parser.add_option(
+    "--generator-stack-size",
+    action  = "store",
+    dest    = "generator_stack_size",
+    metavar = "KB",
+    type    = "int",
+    default = None,
+    help    = """\
+Stack size of compiled generators in KB. On other platforms than Windows, the
+"NUITKA_GENERATOR_STACK_SIZE" environment variable can override it at run
+time. Defaults to 1024."""
+)
+
 parser.add_option(
     "--windows-disable-console",
     action  = "store_true",
@@ -352,6 +415,18 @@ Traced execution output, output the line of code before executing it.
 Defaults to off."""
 )
 
+debug_group.add_option(
+    "--trace-startup",
+    action  = "store_true",
+    dest    = "trace_startup",
+    default = False,
+    help    = """\
+Compile in recording of a startup timeline, covering interpreter setup,
+constants creation, and the initialization of each module. It is active when
+the environment variable "NUITKA_STARTUP_TRACE" gives a filename, to which it
+is written at exit in the Chrome trace event format. Defaults to off."""
+)
+
 debug_group.add_option(
     "--c++-only",
     action  = "store_true",
@@ -521,6 +596,15 @@ if options.is_standalone:
     options.recurse_all = True
     options.recurse_stdlib = True
 
+# Shared runtime mode builds one extension module per given module, these
+# cannot load each other from inside, so recursion is not possible.
+if options.shared_runtime:
+    if options.executable:
+        sys.exit("""
+Error, '--shared-runtime' requires '--module' to be given too.""")
+
+    options.recurse_none = True
+
 def shallTraceExecution():
     return options.trace_execution
 
@@ -539,9 +623,15 @@ def shallOnlyExecCppCall():
 def shallHaveStatementLines():
     return options.statement_lines
 
+def shallSetLinesOnErrorsOnly():
+    return options.error_lines
+
 def shallMakeModule():
     return not options.executable
 
+def shallUseSharedRuntime():
+    return options.shared_runtime
+
 def shallFollowStandardLibrary():
     return options.recurse_stdlib
 
@@ -662,6 +752,18 @@ def isRemoveBuildDir():
 def getIntendedPythonVersion():
     return options.python_version
 
+def getGeneratorStackSize():
+    return options.generator_stack_size
+
+def isStacklessGenerators():
+    return options.stackless_generators
+
+def getCallFreeLoopTicks():
+    return options.call_free_loop_ticks
+
+def isTraceStartup():
+    return options.trace_startup
+
 def isExperimental():
     return hasattr( options, "experimental" ) and options.experimental
 
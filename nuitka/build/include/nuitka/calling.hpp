@@ -72,14 +72,12 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION( PyObject *function_object,
 extern PyObject *CALL_FUNCTION_NO_ARGS( PyObject *called );
 
 // Function call variants with positional arguments tuple.
-NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_POSARGS( PyObject *function_object, PyObject *positional_args )
-{
-    return CALL_FUNCTION(
-        function_object,
-        positional_args,
-        NULL
-    );
-}
+extern PyObject *CALL_FUNCTION_WITH_POSARGS( PyObject *called, PyObject *positional_args );
+
+// Function call with star list and/or star dict arguments, any of the
+// arguments other than "called" may be NULL. The "named_args" must be a dict
+// owned by the caller only, as the star dict is merged into it.
+extern PyObject *CALL_FUNCTION_COMPLEX( PyObject *called, PyObject *positional_args, PyObject *named_args, PyObject *list_star_arg, PyObject *dict_star_arg );
 
 
 NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_KEYARGS( PyObject *function_object, PyObject *named_args )
@@ -29,6 +29,46 @@
 // Cleanup function to be called when the function object is released.
 typedef void (*releaser)( void * );
 
+// Counters of the free lists used for compiled function and generator objects,
+// their contexts, and shared variable storages, to check how effective they
+// are.
+struct Nuitka_FreeListCounts
+{
+    // Currently held for reuse.
+    int size;
+
+    // Allocations served from the free list, and ones that were not.
+    unsigned long reused;
+    unsigned long allocated;
+};
+
+extern Nuitka_FreeListCounts function_free_list_counts;
+extern Nuitka_FreeListCounts generator_free_list_counts;
+extern Nuitka_FreeListCounts context_free_list_counts;
+extern Nuitka_FreeListCounts shared_storage_free_list_counts;
+
+// Arranges for output of the free list counters at exit, if the
+// "NUITKA_FREE_LIST_STATS" environment variable is set.
+extern void initFreeListStats( void );
+
+// The contexts of functions and generators are allocated from free lists by
+// their size, as they are created and released with these objects.
+extern void *Nuitka_Context_Allocate( size_t size );
+extern void Nuitka_Context_Release( void *context, size_t size );
+
+struct Nuitka_ContextBase
+{
+    static void *operator new( size_t size )
+    {
+        return Nuitka_Context_Allocate( size );
+    }
+
+    static void operator delete( void *context, size_t size )
+    {
+        Nuitka_Context_Release( context, size );
+    }
+};
+
 struct Nuitka_FunctionObject;
 
 // Standard Python entry point, accepting argument tuple and keyword dict.
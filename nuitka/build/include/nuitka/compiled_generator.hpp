@@ -30,7 +30,9 @@
 
 // *** Nuitka_Generator type begin
 
+#ifndef _NUITKA_STACKLESS_GENERATORS
 #include "fibers.hpp"
+#endif
 
 // Status of the generator object.
 enum Generator_Status {
@@ -46,8 +48,13 @@ typedef struct {
 
     PyObject *m_name;
 
+#ifndef _NUITKA_STACKLESS_GENERATORS
     Fiber m_yielder_context;
     Fiber m_caller_context;
+#else
+    // The yield to continue after when resumed, zero for the start.
+    int m_resume_point;
+#endif
 
     void *m_context;
     releaser m_cleanup;
@@ -89,6 +96,42 @@ static inline PyObject *Nuitka_Generator_GetName( PyObject *object )
 }
 
 
+#ifdef _NUITKA_STACKLESS_GENERATORS
+
+// For stackless generators, a yield is split in two. The generated code gives
+// the value here and returns from the generator function, and where it is
+// resumed, the sent value or a thrown exception is picked up.
+static inline void YIELD_SUSPEND( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    assertObject( value );
+
+    generator->m_yielded = value;
+}
+
+static inline PyObject *YIELD_RESUME( Nuitka_GeneratorObject *generator )
+{
+    // Check for thrown exception.
+    if (unlikely( generator->m_exception_type ))
+    {
+        PyErr_Restore(
+            generator->m_exception_type,
+            generator->m_exception_value,
+            (PyObject *)generator->m_exception_tb
+        );
+
+        generator->m_exception_type = NULL;
+        generator->m_exception_value = NULL;
+        generator->m_exception_tb = NULL;
+
+        return NULL;
+    }
+
+    assertObject( generator->m_yielded );
+    return generator->m_yielded;
+}
+
+#else
+
 static inline PyObject *YIELD( Nuitka_GeneratorObject *generator, PyObject *value )
 {
     assertObject( value );
@@ -118,15 +161,14 @@ static inline PyObject *YIELD( Nuitka_GeneratorObject *generator, PyObject *valu
     return generator->m_yielded;
 }
 
+#endif
+
 #if PYTHON_VERSION >= 300
-static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyObject *value )
+// When yielding from an exception handler in Python3, the exception preserved
+// to the frame is restored, while the current one is put there, and when
+// returning from the yield, the other way around.
+static inline void SWAP_GENERATOR_FRAME_EXCEPTION()
 {
-    assertObject( value );
-
-    generator->m_yielded = value;
-
-    // When yielding from an exception handler in Python3, the exception
-    // preserved to the frame is restore, while the current one is put there.
     PyThreadState *thread_state = PyThreadState_GET();
 
     PyObject *saved_exception_type = thread_state->exc_type;
@@ -140,25 +182,38 @@ static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyO
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
 
-    // Return to the calling context.
-    swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
+#ifdef _NUITKA_STACKLESS_GENERATORS
+
+static inline void YIELD_IN_HANDLER_SUSPEND( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    YIELD_SUSPEND( generator, value );
 
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
+    SWAP_GENERATOR_FRAME_EXCEPTION();
+}
 
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
+static inline PyObject *YIELD_IN_HANDLER_RESUME( Nuitka_GeneratorObject *generator )
+{
+    SWAP_GENERATOR_FRAME_EXCEPTION();
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+    return YIELD_RESUME( generator );
+}
 
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
+#else
+
+static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    assertObject( value );
+
+    generator->m_yielded = value;
+
+    SWAP_GENERATOR_FRAME_EXCEPTION();
+
+    // Return to the calling context.
+    swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
+
+    SWAP_GENERATOR_FRAME_EXCEPTION();
 
     // Check for thrown exception.
     if (unlikely( generator->m_exception_type ))
@@ -178,6 +233,8 @@ static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyO
 
     return generator->m_yielded;
 }
+
+#endif
 #endif
 
 #if PYTHON_VERSION >= 330
@@ -203,126 +260,153 @@ static void RAISE_GENERATOR_EXCEPTION( Nuitka_GeneratorObject *generator )
 extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
 extern PyObject *PyGen_Send( PyGenObject *gen, PyObject *arg );
 
-static inline PyObject *YIELD_FROM( Nuitka_GeneratorObject *generator, PyObject *value )
+// One step of a "yield from", giving the value sent in "m_yielded" or the
+// exception thrown into the generator to the sub-generator. Returns true if
+// the sub-generator produced a value to yield, which is then in "m_yielded",
+// and false when done, with the expression value, or NULL for an exception, in
+// "result".
+static inline bool YIELD_FROM_STEP( Nuitka_GeneratorObject *generator, PyObject *value, PyObject **result )
 {
     // This is the value, propagated back and forth the sub-generator and the
     // yield from consumer.
-    PyObject *send_value = Py_None;
+    PyObject *send_value = generator->m_yielded;
+    assertObject( send_value );
 
-    while( 1 )
+    // Send iteration value to the sub-generator, which may be a CPython
+    // generator object, something with an iterator next, or a send method,
+    // where the later is only required if values other than "None" need to
+    // be passed in.
+    PyObject *retval;
+
+    // Exception, was thrown into us, need to send that to sub-generator.
+    if ( generator->m_exception_type )
     {
-        // Send iteration value to the sub-generator, which may be a CPython
-        // generator object, something with an iterator next, or a send method,
-        // where the later is only required if values other than "None" need to
-        // be passed in.
-        PyObject *retval;
-
-        // Exception, was thrown into us, need to send that to sub-generator.
-        if ( generator->m_exception_type )
+        // The yielding generator is being closed, but we also are tasked to
+        // immediately close the currently running sub-generator.
+        if ( PyErr_GivenExceptionMatches( generator->m_exception_type, PyExc_GeneratorExit ) )
         {
-            // The yielding generator is being closed, but we also are tasked to
-            // immediately close the currently running sub-generator.
-            if ( PyErr_GivenExceptionMatches( generator->m_exception_type, PyExc_GeneratorExit ) )
+            PyObject *close_method = PyObject_GetAttrString( value, (char *)"close" );
+
+            if ( close_method )
             {
-                PyObject *close_method = PyObject_GetAttrString( value, (char *)"close" );
+                PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
+                Py_DECREF( close_method );
 
-                if ( close_method )
+                if (unlikely( close_value == NULL ))
                 {
-                    PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
-                    Py_DECREF( close_method );
-
-                    if (unlikely( close_value == NULL ))
-                    {
-                        return NULL;
-                    }
-
-                    Py_DECREF( close_value );
+                    *result = NULL;
+                    return false;
                 }
 
-                RAISE_GENERATOR_EXCEPTION( generator );
-                return NULL;
+                Py_DECREF( close_value );
             }
 
-            PyObject *throw_method = PyObject_GetAttrString( value, (char *)"throw" );
+            RAISE_GENERATOR_EXCEPTION( generator );
 
-            if ( throw_method )
-            {
-                retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
-                Py_DECREF( throw_method );
+            *result = NULL;
+            return false;
+        }
 
-                if (unlikely( send_value == NULL ))
-                {
-                    if ( PyErr_ExceptionMatches( PyExc_StopIteration ) )
-                    {
-                        return ERROR_GET_STOP_ITERATION_VALUE();
-                    }
+        PyObject *throw_method = PyObject_GetAttrString( value, (char *)"throw" );
 
-                    return NULL;
-                }
+        if ( throw_method )
+        {
+            retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
+            Py_DECREF( throw_method );
 
+            // The sub-generator was given the exception, whatever it did with
+            // it, it's no longer pending for us.
+            generator->m_exception_type = NULL;
+            generator->m_exception_value = NULL;
+            generator->m_exception_tb = NULL;
 
-                generator->m_exception_type = NULL;
-                generator->m_exception_value = NULL;
-                generator->m_exception_tb = NULL;
-            }
-            else if ( PyErr_ExceptionMatches( PyExc_AttributeError ) )
+            if (unlikely( retval == NULL ))
             {
-                PyErr_Clear();
+                if ( PyErr_ExceptionMatches( PyExc_StopIteration ) )
+                {
+                    *result = ERROR_GET_STOP_ITERATION_VALUE();
+                    return false;
+                }
 
-                RAISE_GENERATOR_EXCEPTION( generator );
-                return NULL;
+                *result = NULL;
+                return false;
             }
-            else
-            {
-                return NULL;
-            }
-
         }
-        else if ( PyGen_CheckExact( value ) )
+        else if ( PyErr_ExceptionMatches( PyExc_AttributeError ) )
         {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
+            PyErr_Clear();
+
+            RAISE_GENERATOR_EXCEPTION( generator );
+
+            *result = NULL;
+            return false;
         }
-        else if ( send_value == Py_None )
+        else
         {
-            retval = Py_TYPE( value )->tp_iternext( value );
+            *result = NULL;
+            return false;
         }
-        else
+
+    }
+    else if ( PyGen_CheckExact( value ) )
+    {
+        retval = PyGen_Send( (PyGenObject *)value, Py_None );
+    }
+    else if ( send_value == Py_None )
+    {
+        retval = Py_TYPE( value )->tp_iternext( value );
+    }
+    else
+    {
+        retval = PyObject_CallMethod( value, (char *)"send", (char *)"O", send_value );
+    }
+
+    // Check the sub-generator result
+    if ( retval == NULL )
+    {
+        if ( !ERROR_OCCURED() )
         {
-            retval = PyObject_CallMethod( value, (char *)"send", (char *)"O", send_value );
+            *result = INCREASE_REFCOUNT( Py_None );
+            return false;
         }
 
-        // Check the sub-generator result
-        if ( retval == NULL )
+        // The sub-generator has given an exception. In case of
+        // StopIteration, we need to check the value, as it is going to be
+        // the expression value of this "yield from", and we are done. All
+        // other errors, we need to raise.
+        if (likely( PyErr_ExceptionMatches( PyExc_StopIteration ) ))
         {
-            if ( !ERROR_OCCURED() )
-            {
-                return INCREASE_REFCOUNT( Py_None ) ;
-            }
+            *result = ERROR_GET_STOP_ITERATION_VALUE();
+            return false;
+        }
 
-            // The sub-generator has given an exception. In case of
-            // StopIteration, we need to check the value, as it is going to be
-            // the expression value of this "yield from", and we are done. All
-            // other errors, we need to raise.
-            if (likely( PyErr_ExceptionMatches( PyExc_StopIteration ) ))
-            {
-                return ERROR_GET_STOP_ITERATION_VALUE();
-            }
+        *result = NULL;
+        return false;
+    }
+    else
+    {
+        generator->m_yielded = retval;
 
-            return NULL;
-        }
-        else
-        {
-            generator->m_yielded = retval;
+        return true;
+    }
+}
 
-            // Return to the calling context.
-            swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
+#ifndef _NUITKA_STACKLESS_GENERATORS
+static inline PyObject *YIELD_FROM( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    PyObject *result;
 
-            send_value = generator->m_yielded;
+    generator->m_yielded = Py_None;
 
-            assertObject( send_value );
-        }
+    while ( YIELD_FROM_STEP( generator, value, &result ) )
+    {
+        // Return to the calling context.
+        swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
     }
+
+    return result;
 }
+#endif
 
 #endif
 
@@ -42,4 +42,18 @@ extern "C" void prepareFiber( Fiber *to, void *code, unsigned long arg );
 
 extern "C" void releaseFiber( Fiber *to );
 
+// The stack size for generators, may be given at compile time, and for the
+// stacks allocated by us, at run time with "NUITKA_GENERATOR_STACK_SIZE" in
+// KB too.
+#ifndef _NUITKA_GENERATOR_STACK_SIZE
+#define _NUITKA_GENERATOR_STACK_SIZE (1024*1024)
+#endif
+
+#if !defined( _WIN32 )
+// Stacks with a guard page below them, recycled through a bounded pool. The
+// usable size is returned through the pointer.
+extern "C" void *allocateFiberStack( size_t *size );
+extern "C" void releaseFiberStack( void *stack );
+#endif
+
 #endif
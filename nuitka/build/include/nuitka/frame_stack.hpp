@@ -18,13 +18,6 @@
 #ifndef __NUITKA_FRAME_STACK_H__
 #define __NUITKA_FRAME_STACK_H__
 
-#define MAKE_OR_REUSE_FRAME( cache_identifier, code_identifier, module_identifier ) \
-    if ( isFrameUnusable( cache_identifier ) )                                \
-    {                                                                         \
-        Py_XDECREF( cache_identifier );                                       \
-        cache_identifier = MAKE_FRAME( code_identifier, module_identifier );  \
-    }                                                                         \
-
 inline static void assertCodeObject( PyCodeObject *code_object )
 {
     assertObject( (PyObject *)code_object );
@@ -58,7 +51,7 @@ NUITKA_MAY_BE_UNUSED static bool isFrameUnusable( PyFrameObject *frame_object )
         // Still in use
         Py_REFCNT( frame_object ) > 1 ||
 #if PYTHON_VERSION < 340
-        // Last used by another thread (TODO: Could just set it when re-using)
+        // Last used by another thread, the pool prefers frames of the thread.
         frame_object->f_tstate != PyThreadState_GET() ||
 #endif
         // Was detached from (TODO: When detaching, can't we just have another
@@ -66,6 +59,39 @@ NUITKA_MAY_BE_UNUSED static bool isFrameUnusable( PyFrameObject *frame_object )
         frame_object->f_back != NULL;
 }
 
+// The number of frames kept for a code object, to be used by recursive calls
+// and calls from several threads.
+#ifndef _NUITKA_FRAME_POOL_SIZE
+#define _NUITKA_FRAME_POOL_SIZE 16
+#endif
+
+// Frames are cached per code object, so that a function call doesn't have to
+// create one. Slots are filled in order, and never emptied again.
+struct Nuitka_FramePool
+{
+    PyFrameObject *m_frames[ _NUITKA_FRAME_POOL_SIZE ];
+
+    // When all frames are in use, the one to give up next.
+    int m_replace;
+};
+
+extern PyFrameObject *acquirePooledFrame( Nuitka_FramePool *pool, PyCodeObject *code, PyObject *module );
+
+// Get a frame for the code object from the pool, which is owned by the pool,
+// quickly for the first frame, which serves all calls that don't recurse, and
+// through the pool for the other cases.
+NUITKA_MAY_BE_UNUSED static inline PyFrameObject *MAKE_OR_REUSE_FRAME( Nuitka_FramePool *pool, PyCodeObject *code, PyObject *module )
+{
+    PyFrameObject *frame_object = pool->m_frames[ 0 ];
+
+    if (likely( !isFrameUnusable( frame_object ) ))
+    {
+        return frame_object;
+    }
+
+    return acquirePooledFrame( pool, code, module );
+}
+
 NUITKA_MAY_BE_UNUSED inline static void popFrameStack( void )
 {
     PyThreadState *tstate = PyThreadState_GET();
@@ -385,6 +385,465 @@ NUITKA_MAY_BE_UNUSED static bool SET_ATTRIBUTE( PyObject *target, PyObject *attr
     return true;
 }
 
+// Inline caches for attribute lookups and assignments at one place of the
+// code. Entries are for a type and its version tag, which CPython changes
+// whenever the type or one of its bases is modified. They hold the attribute
+// found in the type, and the slot the attribute had in the instance dictionary
+// of the last object, which is used when the dictionary has the same size and
+// that slot still holds the attribute. For the split dictionaries of Python 3.3
+// or higher, there are none, and the code generation does not use them.
+
+#ifndef _NUITKA_ATTRIBUTE_CACHE_SIZE
+#define _NUITKA_ATTRIBUTE_CACHE_SIZE 2
+#endif
+
+struct Nuitka_AttributeCacheEntry
+{
+    // The type and its version tag, type is NULL for unused entries.
+    PyTypeObject *m_type;
+    unsigned int m_version_tag;
+
+    // Found in the type, borrowed and valid for the version tag only, may
+    // be NULL.
+    PyObject *m_descr;
+
+    // Slot of the attribute in dictionaries with that mask.
+    Py_ssize_t m_dict_mask;
+    Py_ssize_t m_dict_slot;
+};
+
+struct Nuitka_AttributeCache
+{
+    Nuitka_AttributeCacheEntry m_entries[ _NUITKA_ATTRIBUTE_CACHE_SIZE ];
+
+    // Entry to replace next, if all are in use.
+    int m_replace;
+
+#ifdef _NUITKA_ATTRIBUTE_CACHE_STATS
+    char *m_name;
+    unsigned long m_hits;
+    unsigned long m_misses;
+
+    Nuitka_AttributeCache *m_next;
+#endif
+};
+
+#ifdef _NUITKA_ATTRIBUTE_CACHE_STATS
+// Registers the cache for output of hit and miss counts at exit, if the
+// "NUITKA_ATTRIBUTE_CACHE_STATS" environment variable is set.
+extern void registerAttributeCache( Nuitka_AttributeCache *cache, PyObject *attr_name );
+
+#define NUITKA_ATTRIBUTE_CACHE_HIT( cache ) cache->m_hits += 1
+#define NUITKA_ATTRIBUTE_CACHE_MISS( cache, attr_name ) if ( cache->m_misses++ == 0 ) registerAttributeCache( cache, attr_name )
+#else
+#define NUITKA_ATTRIBUTE_CACHE_HIT( cache )
+#define NUITKA_ATTRIBUTE_CACHE_MISS( cache, attr_name )
+#endif
+
+#if PYTHON_VERSION < 330
+
+// Find the entry for the type, making one if necessary, NULL if the type has
+// no valid version tag and cannot be cached.
+static Nuitka_AttributeCacheEntry *GET_ATTRIBUTE_CACHE_ENTRY( Nuitka_AttributeCache *cache, PyTypeObject *type, PyObject *attr_name )
+{
+    if ( PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) )
+    {
+        for ( int i = 0; i < _NUITKA_ATTRIBUTE_CACHE_SIZE; i++ )
+        {
+            Nuitka_AttributeCacheEntry *entry = &cache->m_entries[ i ];
+
+            if ( entry->m_type == type && entry->m_version_tag == type->tp_version_tag )
+            {
+                NUITKA_ATTRIBUTE_CACHE_HIT( cache );
+
+                return entry;
+            }
+        }
+    }
+
+    NUITKA_ATTRIBUTE_CACHE_MISS( cache, attr_name );
+
+    // This also gives the type a version tag, if it can have one.
+    PyObject *descr = _PyType_Lookup( type, attr_name );
+
+    if ( !PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) )
+    {
+        return NULL;
+    }
+
+    // Prefer an entry of the same type, or an unused one.
+    Nuitka_AttributeCacheEntry *entry = NULL;
+
+    for ( int i = 0; i < _NUITKA_ATTRIBUTE_CACHE_SIZE; i++ )
+    {
+        if ( cache->m_entries[ i ].m_type == type || cache->m_entries[ i ].m_type == NULL )
+        {
+            entry = &cache->m_entries[ i ];
+            break;
+        }
+    }
+
+    if ( entry == NULL )
+    {
+        entry = &cache->m_entries[ cache->m_replace ];
+        cache->m_replace = ( cache->m_replace + 1 ) % _NUITKA_ATTRIBUTE_CACHE_SIZE;
+    }
+
+    entry->m_type = type;
+    entry->m_version_tag = type->tp_version_tag;
+    entry->m_descr = descr;
+    entry->m_dict_mask = -1;
+    entry->m_dict_slot = 0;
+
+    return entry;
+}
+
+// Find the dictionary entry of the attribute, through the cached slot if it
+// still holds it.
+NUITKA_MAY_BE_UNUSED static inline PyDictEntry *GET_ATTRIBUTE_DICT_ENTRY_CACHED( PyDictObject *dict, PyObject *attr_name, Nuitka_AttributeCacheEntry *entry )
+{
+    if ( dict->ma_mask == entry->m_dict_mask )
+    {
+        PyDictEntry *dict_entry = &dict->ma_table[ entry->m_dict_slot ];
+
+        if (likely( dict_entry->me_key == attr_name && dict_entry->me_value != NULL ))
+        {
+            return dict_entry;
+        }
+    }
+
+    PyDictEntry *dict_entry = GET_STRING_DICT_ENTRY( dict, (Nuitka_StringObject *)attr_name );
+
+    // Keys not identical to ours, e.g. not interned, cannot be checked.
+    if ( dict_entry->me_value != NULL && dict_entry->me_key == attr_name )
+    {
+        entry->m_dict_mask = dict->ma_mask;
+        entry->m_dict_slot = dict_entry - dict->ma_table;
+    }
+
+    return dict_entry;
+}
+
+// The dictionary of an object, if it's in a place where it can be looked at
+// quickly and of exact type, otherwise NULL with "slow" set.
+NUITKA_MAY_BE_UNUSED static inline PyDictObject *GET_INSTANCE_DICT_QUICK( PyObject *object, PyTypeObject *type, bool *slow )
+{
+    Py_ssize_t dict_offset = type->tp_dictoffset;
+
+    if ( dict_offset == 0 )
+    {
+        return NULL;
+    }
+
+    PyObject *dict = dict_offset > 0 ? *(PyObject **)( (char *)object + dict_offset ) : NULL;
+
+    if (unlikely( dict_offset < 0 || ( dict != NULL && !PyDict_CheckExact( dict ) ) ))
+    {
+        *slow = true;
+        return NULL;
+    }
+
+    return (PyDictObject *)dict;
+}
+
+NUITKA_MAY_BE_UNUSED static inline bool _HAS_DESCRIPTOR_SLOTS( PyObject *descr )
+{
+#if PYTHON_VERSION < 300
+    return PyType_HasFeature( Py_TYPE( descr ), Py_TPFLAGS_HAVE_CLASS );
+#else
+    return true;
+#endif
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_CACHED( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+    assertObject( source );
+    assertObject( attr_name );
+
+    PyTypeObject *type = Py_TYPE( source );
+
+#if PYTHON_VERSION < 300
+    if ( type == &PyInstance_Type )
+    {
+        PyDictObject *dict = (PyDictObject *)( (PyInstanceObject *)source )->in_dict;
+
+        // Old style classes have no version tags, only the instance dictionary
+        // is looked at through the cache.
+        if ( PyDict_CheckExact( dict ) )
+        {
+            PyObject *result = GET_ATTRIBUTE_DICT_ENTRY_CACHED( dict, attr_name, &cache->m_entries[0] )->me_value;
+
+            if ( result != NULL )
+            {
+                return INCREASE_REFCOUNT( result );
+            }
+        }
+
+        return LOOKUP_INSTANCE( source, attr_name );
+    }
+#endif
+
+    if ( type->tp_getattro != PyObject_GenericGetAttr )
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    Nuitka_AttributeCacheEntry *entry = GET_ATTRIBUTE_CACHE_ENTRY( cache, type, attr_name );
+
+    if ( entry == NULL )
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    // Follows "PyObject_GenericGetAttr", data descriptors take precedence over
+    // the instance dictionary.
+    PyObject *descr = entry->m_descr;
+    descrgetfunc func = NULL;
+
+    if ( descr != NULL && _HAS_DESCRIPTOR_SLOTS( descr ) )
+    {
+        func = Py_TYPE( descr )->tp_descr_get;
+
+        if ( func != NULL && PyDescr_IsData( descr ) )
+        {
+            Py_INCREF( descr );
+            PyObject *result = func( descr, source, (PyObject *)type );
+            Py_DECREF( descr );
+
+            return result;
+        }
+    }
+
+    bool slow = false;
+    PyDictObject *dict = GET_INSTANCE_DICT_QUICK( source, type, &slow );
+
+    if (unlikely( slow ))
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    if ( dict != NULL )
+    {
+        PyObject *result = GET_ATTRIBUTE_DICT_ENTRY_CACHED( dict, attr_name, entry )->me_value;
+
+        if ( result != NULL )
+        {
+            return INCREASE_REFCOUNT( result );
+        }
+    }
+
+    if ( func != NULL )
+    {
+        Py_INCREF( descr );
+        PyObject *result = func( descr, source, (PyObject *)type );
+        Py_DECREF( descr );
+
+        return result;
+    }
+
+    if ( descr != NULL )
+    {
+        return INCREASE_REFCOUNT( descr );
+    }
+
+    // Let the full lookup give the error.
+    return LOOKUP_ATTRIBUTE( source, attr_name );
+}
+
+// The type of method descriptors, not part of the API for all Python versions.
+extern PyTypeObject *Nuitka_MethodDescr_Type;
+
+// Functions that can be called with the object as the first argument, in the
+// same way as the method they would be bound to.
+NUITKA_MAY_BE_UNUSED static inline bool _IS_UNBOUND_METHOD_CALLABLE( PyObject *descr )
+{
+    return Nuitka_Function_Check( descr ) || PyFunction_Check( descr ) || Py_TYPE( descr ) == Nuitka_MethodDescr_Type;
+}
+
+#if PYTHON_VERSION < 300
+static PyObject *LOOKUP_INSTANCE_METHOD( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache, PyObject **self_out )
+{
+    PyInstanceObject *source_instance = (PyInstanceObject *)source;
+
+    // The instance dictionary first, as "LOOKUP_INSTANCE" does.
+    if ( PyDict_CheckExact( source_instance->in_dict ) )
+    {
+        PyObject *result = GET_ATTRIBUTE_DICT_ENTRY_CACHED( (PyDictObject *)source_instance->in_dict, attr_name, &cache->m_entries[0] )->me_value;
+
+        if ( result != NULL )
+        {
+            return INCREASE_REFCOUNT( result );
+        }
+    }
+    else
+    {
+        return LOOKUP_INSTANCE( source, attr_name );
+    }
+
+    PyObject *result = FIND_ATTRIBUTE_IN_CLASS( source_instance->in_class, attr_name );
+
+    if ( result != NULL && _IS_UNBOUND_METHOD_CALLABLE( result ) )
+    {
+        *self_out = source;
+
+        return INCREASE_REFCOUNT( result );
+    }
+
+    // Everything else, including errors and "__getattr__", is left to the
+    // full lookup.
+    return LOOKUP_INSTANCE( source, attr_name );
+}
+#endif
+
+// Look up an attribute to call it. For functions found in the type, these
+// are returned as they are, with the object to pass as first argument in
+// "self_out", which avoids making a bound method object. Otherwise the value
+// of the attribute is returned and "self_out" is not changed.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_METHOD_CACHED( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache, PyObject **self_out )
+{
+    assertObject( source );
+    assertObject( attr_name );
+
+    PyTypeObject *type = Py_TYPE( source );
+
+#if PYTHON_VERSION < 300
+    if ( type == &PyInstance_Type )
+    {
+        return LOOKUP_INSTANCE_METHOD( source, attr_name, cache, self_out );
+    }
+#endif
+
+    if ( type->tp_getattro != PyObject_GenericGetAttr )
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    Nuitka_AttributeCacheEntry *entry = GET_ATTRIBUTE_CACHE_ENTRY( cache, type, attr_name );
+
+    if ( entry == NULL )
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    PyObject *descr = entry->m_descr;
+
+    // Only functions are not data descriptors and need not be bound, when the
+    // instance dictionary doesn't have the name.
+    if ( descr == NULL || !_IS_UNBOUND_METHOD_CALLABLE( descr ) )
+    {
+        return LOOKUP_ATTRIBUTE_CACHED( source, attr_name, cache );
+    }
+
+    bool slow = false;
+    PyDictObject *dict = GET_INSTANCE_DICT_QUICK( source, type, &slow );
+
+    if (unlikely( slow ))
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    if ( dict != NULL )
+    {
+        PyObject *result = GET_ATTRIBUTE_DICT_ENTRY_CACHED( dict, attr_name, entry )->me_value;
+
+        if ( result != NULL )
+        {
+            return INCREASE_REFCOUNT( result );
+        }
+    }
+
+    *self_out = source;
+
+    return INCREASE_REFCOUNT( descr );
+}
+
+NUITKA_MAY_BE_UNUSED static bool SET_ATTRIBUTE_CACHED( PyObject *target, PyObject *attr_name, PyObject *value, Nuitka_AttributeCache *cache )
+{
+    assertObject( target );
+    assertObject( attr_name );
+    assertObject( value );
+
+    PyTypeObject *type = Py_TYPE( target );
+    PyDictObject *dict;
+    Nuitka_AttributeCacheEntry *entry;
+
+#if PYTHON_VERSION < 300
+    if ( type == &PyInstance_Type )
+    {
+        PyInstanceObject *target_instance = (PyInstanceObject *)target;
+
+        if ( target_instance->in_class->cl_setattr != NULL || !PyDict_CheckExact( target_instance->in_dict ) )
+        {
+            return SET_INSTANCE( target, attr_name, value );
+        }
+
+        dict = (PyDictObject *)target_instance->in_dict;
+        entry = &cache->m_entries[0];
+    }
+    else
+#endif
+    {
+        if ( type->tp_setattro != PyObject_GenericSetAttr )
+        {
+            return SET_ATTRIBUTE( target, attr_name, value );
+        }
+
+        entry = GET_ATTRIBUTE_CACHE_ENTRY( cache, type, attr_name );
+
+        if ( entry == NULL )
+        {
+            return SET_ATTRIBUTE( target, attr_name, value );
+        }
+
+        // Follows "PyObject_GenericSetAttr", data descriptors are used first.
+        PyObject *descr = entry->m_descr;
+
+        if ( descr != NULL && _HAS_DESCRIPTOR_SLOTS( descr ) )
+        {
+            descrsetfunc func = Py_TYPE( descr )->tp_descr_set;
+
+            if ( func != NULL )
+            {
+                Py_INCREF( descr );
+                int status = func( descr, target, value );
+                Py_DECREF( descr );
+
+                return status != -1;
+            }
+        }
+
+        bool slow = false;
+        dict = GET_INSTANCE_DICT_QUICK( target, type, &slow );
+
+        // Dictionaries still to be created and errors are left to the full
+        // assignment.
+        if ( dict == NULL )
+        {
+            return SET_ATTRIBUTE( target, attr_name, value );
+        }
+    }
+
+    PyDictEntry *dict_entry = GET_ATTRIBUTE_DICT_ENTRY_CACHED( dict, attr_name, entry );
+    PyObject *old = dict_entry->me_value;
+
+    if ( old != NULL )
+    {
+        dict_entry->me_value = INCREASE_REFCOUNT( value );
+        Py_DECREF( old );
+
+        return true;
+    }
+
+    if (unlikely( PyDict_SetItem( (PyObject *)dict, attr_name, value ) == -1 ))
+    {
+        return false;
+    }
+
+    return true;
+}
+
+#endif
+
 NUITKA_MAY_BE_UNUSED static bool SET_ATTRIBUTE_DICT_SLOT( PyObject *target, PyObject *value )
 {
     assertObject( target );
@@ -84,6 +84,78 @@ static PyObject *GET_STRING_DICT_VALUE( PyDictObject *dict, Nuitka_StringObject
     return GET_STRING_DICT_ENTRY( dict, key )->me_value;
 }
 
+// Cache of the entries of a module variable, in the module dictionary or in
+// the built-in dictionary, for one place of access. An entry is only used while
+// the dictionary still has the same table, and it still holds the key and a
+// value, so changes to the dictionaries from anywhere are noticed. The mask is
+// compared too, as a freed table may be re-allocated at the same address with
+// another size, and the entry must then not be used.
+struct Nuitka_ModuleVariableCache
+{
+    PyDictEntry *m_module_table;
+    Py_ssize_t m_module_mask;
+    PyDictEntry *m_module_entry;
+
+    PyDictEntry *m_builtin_table;
+    Py_ssize_t m_builtin_mask;
+    PyDictEntry *m_builtin_entry;
+};
+
+NUITKA_MAY_BE_UNUSED static inline bool _IS_CACHED_DICT_ENTRY_VALID( PyDictObject *dict, PyDictEntry *table, Py_ssize_t mask, PyDictEntry *entry, Nuitka_StringObject *key )
+{
+    return dict->ma_table == table && dict->ma_mask == mask && entry->me_key == (PyObject *)key && entry->me_value != NULL;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_MODULE_VARIABLE_VALUE_CACHED( Nuitka_ModuleVariableCache *cache, PyDictObject *module_dict, PyDictObject *builtin_dict, Nuitka_StringObject *key )
+{
+    if (likely( _IS_CACHED_DICT_ENTRY_VALID( module_dict, cache->m_module_table, cache->m_module_mask, cache->m_module_entry, key ) ))
+    {
+        return cache->m_module_entry->me_value;
+    }
+
+    // For a cached built-in value, the module dictionary must not have the
+    // key, which is certain if the first slot probed for it is empty.
+    if ( _IS_CACHED_DICT_ENTRY_VALID( builtin_dict, cache->m_builtin_table, cache->m_builtin_mask, cache->m_builtin_entry, key ) )
+    {
+#if PYTHON_VERSION < 300
+        long hash = key->ob_shash;
+#else
+        long hash = key->hash;
+#endif
+
+        if (likely( module_dict->ma_table[ (size_t)hash & module_dict->ma_mask ].me_key == NULL ))
+        {
+            return cache->m_builtin_entry->me_value;
+        }
+    }
+
+    PyDictEntry *entry = GET_STRING_DICT_ENTRY( module_dict, key );
+
+    if ( entry->me_value != NULL )
+    {
+        // Keys not identical to ours, e.g. not interned, cannot be checked.
+        if ( entry->me_key == (PyObject *)key )
+        {
+            cache->m_module_table = module_dict->ma_table;
+            cache->m_module_mask = module_dict->ma_mask;
+            cache->m_module_entry = entry;
+        }
+
+        return entry->me_value;
+    }
+
+    entry = GET_STRING_DICT_ENTRY( builtin_dict, key );
+
+    if ( entry->me_value != NULL && entry->me_key == (PyObject *)key )
+    {
+        cache->m_builtin_table = builtin_dict->ma_table;
+        cache->m_builtin_mask = builtin_dict->ma_mask;
+        cache->m_builtin_entry = entry;
+    }
+
+    return entry->me_value;
+}
+
 #else
 
 // Quick dictionary lookup for a string value.
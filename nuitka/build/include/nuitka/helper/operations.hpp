@@ -58,11 +58,186 @@ NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION( binary_api api, PyObject
     return result;
 }
 
+// Exact integer and float operands are computed with C "long" and "double"
+// values, and only the result is made an object. Anything else, and results
+// that overflow, are left to the generic code.
+enum Nuitka_CNumberKind
+{
+    NUITKA_C_NUMBER_NONE,
+    NUITKA_C_NUMBER_LONG,
+    NUITKA_C_NUMBER_DOUBLE
+};
+
+NUITKA_MAY_BE_UNUSED static inline Nuitka_CNumberKind _UNBOX_NUMBER( PyObject *operand, long *lvalue, double *dvalue )
+{
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( operand ) )
+    {
+        *lvalue = PyInt_AS_LONG( operand );
+        return NUITKA_C_NUMBER_LONG;
+    }
+#else
+    // Only values of one digit at most, these always fit.
+    if ( PyLong_CheckExact( operand ) && Py_SIZE( operand ) >= -1 && Py_SIZE( operand ) <= 1 )
+    {
+        *lvalue = PyLong_AsLong( operand );
+        return NUITKA_C_NUMBER_LONG;
+    }
+#endif
+
+    if ( PyFloat_CheckExact( operand ) )
+    {
+        *dvalue = PyFloat_AS_DOUBLE( operand );
+        return NUITKA_C_NUMBER_DOUBLE;
+    }
+
+    return NUITKA_C_NUMBER_NONE;
+}
+
+NUITKA_MAY_BE_UNUSED static inline PyObject *_BOX_LONG( long value )
+{
+#if PYTHON_VERSION < 300
+    return PyInt_FromLong( value );
+#else
+    return PyLong_FromLong( value );
+#endif
+}
+
+// Values of half the bits of "long" at most, their product always fits.
+#define NUITKA_LONG_HALF_LIMIT ( 1L << ( sizeof( long ) * 4 - 1 ) )
+
+// These return false, if the generic code is needed, otherwise the result,
+// which is NULL for errors.
+NUITKA_MAY_BE_UNUSED static inline bool _BINARY_OPERATION_ADD_UNBOXED( PyObject *operand1, PyObject *operand2, PyObject **result )
+{
+    long lvalue1, lvalue2;
+    double dvalue1, dvalue2;
+
+    Nuitka_CNumberKind kind1 = _UNBOX_NUMBER( operand1, &lvalue1, &dvalue1 );
+
+    if ( kind1 == NUITKA_C_NUMBER_NONE )
+    {
+        return false;
+    }
+
+    Nuitka_CNumberKind kind2 = _UNBOX_NUMBER( operand2, &lvalue2, &dvalue2 );
+
+    if ( kind2 == NUITKA_C_NUMBER_NONE )
+    {
+        return false;
+    }
+
+    if ( kind1 == NUITKA_C_NUMBER_LONG && kind2 == NUITKA_C_NUMBER_LONG )
+    {
+        long value = (long)( (unsigned long)lvalue1 + lvalue2 );
+
+        // Same check as CPython does, the sign cannot differ from both.
+        if (unlikely( ( value ^ lvalue1 ) < 0 && ( value ^ lvalue2 ) < 0 ))
+        {
+            return false;
+        }
+
+        *result = _BOX_LONG( value );
+        return true;
+    }
+
+    if ( kind1 == NUITKA_C_NUMBER_LONG ) dvalue1 = (double)lvalue1;
+    if ( kind2 == NUITKA_C_NUMBER_LONG ) dvalue2 = (double)lvalue2;
+
+    *result = PyFloat_FromDouble( dvalue1 + dvalue2 );
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static inline bool _BINARY_OPERATION_SUB_UNBOXED( PyObject *operand1, PyObject *operand2, PyObject **result )
+{
+    long lvalue1, lvalue2;
+    double dvalue1, dvalue2;
+
+    Nuitka_CNumberKind kind1 = _UNBOX_NUMBER( operand1, &lvalue1, &dvalue1 );
+
+    if ( kind1 == NUITKA_C_NUMBER_NONE )
+    {
+        return false;
+    }
+
+    Nuitka_CNumberKind kind2 = _UNBOX_NUMBER( operand2, &lvalue2, &dvalue2 );
+
+    if ( kind2 == NUITKA_C_NUMBER_NONE )
+    {
+        return false;
+    }
+
+    if ( kind1 == NUITKA_C_NUMBER_LONG && kind2 == NUITKA_C_NUMBER_LONG )
+    {
+        long value = (long)( (unsigned long)lvalue1 - lvalue2 );
+
+        if (unlikely( ( value ^ lvalue1 ) < 0 && ( value ^ ~lvalue2 ) < 0 ))
+        {
+            return false;
+        }
+
+        *result = _BOX_LONG( value );
+        return true;
+    }
+
+    if ( kind1 == NUITKA_C_NUMBER_LONG ) dvalue1 = (double)lvalue1;
+    if ( kind2 == NUITKA_C_NUMBER_LONG ) dvalue2 = (double)lvalue2;
+
+    *result = PyFloat_FromDouble( dvalue1 - dvalue2 );
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static inline bool _BINARY_OPERATION_MUL_UNBOXED( PyObject *operand1, PyObject *operand2, PyObject **result )
+{
+    long lvalue1, lvalue2;
+    double dvalue1, dvalue2;
+
+    Nuitka_CNumberKind kind1 = _UNBOX_NUMBER( operand1, &lvalue1, &dvalue1 );
+
+    if ( kind1 == NUITKA_C_NUMBER_NONE )
+    {
+        return false;
+    }
+
+    Nuitka_CNumberKind kind2 = _UNBOX_NUMBER( operand2, &lvalue2, &dvalue2 );
+
+    if ( kind2 == NUITKA_C_NUMBER_NONE )
+    {
+        return false;
+    }
+
+    if ( kind1 == NUITKA_C_NUMBER_LONG && kind2 == NUITKA_C_NUMBER_LONG )
+    {
+        // Larger values may overflow, let the generic code check that.
+        if (unlikely( lvalue1 >= NUITKA_LONG_HALF_LIMIT || lvalue1 <= -NUITKA_LONG_HALF_LIMIT ||
+                      lvalue2 >= NUITKA_LONG_HALF_LIMIT || lvalue2 <= -NUITKA_LONG_HALF_LIMIT ))
+        {
+            return false;
+        }
+
+        *result = _BOX_LONG( lvalue1 * lvalue2 );
+        return true;
+    }
+
+    if ( kind1 == NUITKA_C_NUMBER_LONG ) dvalue1 = (double)lvalue1;
+    if ( kind2 == NUITKA_C_NUMBER_LONG ) dvalue2 = (double)lvalue2;
+
+    *result = PyFloat_FromDouble( dvalue1 * dvalue2 );
+    return true;
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD( PyObject *operand1, PyObject *operand2 )
 {
     assertObject( operand1 );
     assertObject( operand2 );
 
+    PyObject *unboxed_result;
+
+    if ( _BINARY_OPERATION_ADD_UNBOXED( operand1, operand2, &unboxed_result ) )
+    {
+        return unboxed_result;
+    }
+
     binaryfunc slot1 = NULL;
     binaryfunc slot2 = NULL;
 
@@ -344,6 +519,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL( PyObject *operand1,
     assertObject( operand1 );
     assertObject( operand2 );
 
+    PyObject *unboxed_result;
+
+    if ( _BINARY_OPERATION_MUL_UNBOXED( operand1, operand2, &unboxed_result ) )
+    {
+        return unboxed_result;
+    }
+
     binaryfunc slot1 = NULL;
     binaryfunc slot2 = NULL;
 
@@ -490,6 +672,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB( PyObject *operand1,
     assertObject( operand1 );
     assertObject( operand2 );
 
+    PyObject *unboxed_result;
+
+    if ( _BINARY_OPERATION_SUB_UNBOXED( operand1, operand2, &unboxed_result ) )
+    {
+        return unboxed_result;
+    }
+
     binaryfunc slot1 = NULL;
     binaryfunc slot2 = NULL;
 
@@ -908,4 +1097,52 @@ NUITKA_MAY_BE_UNUSED static PyObject *POWER_OPERATION_INPLACE( PyObject *operand
     return result;
 }
 
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_INPLACE( PyObject *operand1, PyObject *operand2 )
+{
+    assertObject( operand1 );
+    assertObject( operand2 );
+
+    // Integers and floats have no in-place operations of their own.
+    PyObject *result;
+
+    if ( _BINARY_OPERATION_ADD_UNBOXED( operand1, operand2, &result ) )
+    {
+        return result;
+    }
+
+    return PyNumber_InPlaceAdd( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_INPLACE( PyObject *operand1, PyObject *operand2 )
+{
+    assertObject( operand1 );
+    assertObject( operand2 );
+
+    // Integers and floats have no in-place operations of their own.
+    PyObject *result;
+
+    if ( _BINARY_OPERATION_SUB_UNBOXED( operand1, operand2, &result ) )
+    {
+        return result;
+    }
+
+    return PyNumber_InPlaceSubtract( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INPLACE( PyObject *operand1, PyObject *operand2 )
+{
+    assertObject( operand1 );
+    assertObject( operand2 );
+
+    // Integers and floats have no in-place operations of their own.
+    PyObject *result;
+
+    if ( _BINARY_OPERATION_MUL_UNBOXED( operand1, operand2, &result ) )
+    {
+        return result;
+    }
+
+    return PyNumber_InPlaceMultiply( operand1, operand2 );
+}
+
 #endif
@@ -451,10 +451,50 @@ NUITKA_MAY_BE_UNUSED static PyObject *MAKE_ITERATOR( PyObject *iterated )
     }
 }
 
+// Iterator for loops over "range" and "xrange" with values that fit into C
+// "long", it creates no list and only the int object of the current value.
+struct Nuitka_RangeIteratorObject
+{
+    PyObject_HEAD
+
+    long m_start;
+    long m_step;
+
+    unsigned long m_length;
+    unsigned long m_index;
+};
+
+extern PyTypeObject Nuitka_RangeIterator_Type;
+
+NUITKA_MAY_BE_UNUSED static PyObject *RANGE_ITERATOR_NEXT( Nuitka_RangeIteratorObject *iterator )
+{
+    if ( iterator->m_index < iterator->m_length )
+    {
+        // Computed unsigned, the result is between start and end and fits.
+        long value = (long)( (unsigned long)iterator->m_start + iterator->m_index * (unsigned long)iterator->m_step );
+        iterator->m_index += 1;
+
+#if PYTHON_VERSION < 300
+        return PyInt_FromLong( value );
+#else
+        return PyLong_FromLong( value );
+#endif
+    }
+
+    return NULL;
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *ITERATOR_NEXT( PyObject *iterator )
 {
     assertObject( iterator );
 
+    // Loops over ranges are the most common, these give no exception when
+    // exhausted.
+    if ( Py_TYPE( iterator ) == &Nuitka_RangeIterator_Type )
+    {
+        return RANGE_ITERATOR_NEXT( (Nuitka_RangeIteratorObject *)iterator );
+    }
+
     iternextfunc iternext = Py_TYPE( iterator )->tp_iternext;
 
     if (unlikely( iternext == NULL ))
@@ -563,9 +603,56 @@ NUITKA_MAY_BE_UNUSED static PyObject *BUILTIN_NEXT2( PyObject *iterator, PyObjec
 }
 
 
+// For unpacking, exact tuples and lists are not iterated, but indexed, they
+// are then used instead of an iterator by the functions below.
+NUITKA_MAY_BE_UNUSED static PyObject *MAKE_UNPACK_ITERATOR( PyObject *iterated )
+{
+    if ( PyTuple_CheckExact( iterated ) || PyList_CheckExact( iterated ) )
+    {
+        return INCREASE_REFCOUNT( iterated );
+    }
+
+    return MAKE_ITERATOR( iterated );
+}
+
+NUITKA_MAY_BE_UNUSED static void _RAISE_UNPACK_NEED_MORE( int seq_size_so_far )
+{
+    if ( seq_size_so_far == 1 )
+    {
+        PyErr_Format( PyExc_ValueError, "need more than 1 value to unpack" );
+    }
+    else
+    {
+        PyErr_Format( PyExc_ValueError, "need more than %d values to unpack", seq_size_so_far );
+    }
+}
+
 NUITKA_MAY_BE_UNUSED static inline PyObject *UNPACK_NEXT( PyObject *iterator, int seq_size_so_far )
 {
-    assertObject( iterator ); assert( PyIter_Check( iterator ) );
+    assertObject( iterator );
+
+    if ( PyTuple_CheckExact( iterator ) )
+    {
+        if (likely( seq_size_so_far < PyTuple_GET_SIZE( iterator ) ))
+        {
+            return INCREASE_REFCOUNT( PyTuple_GET_ITEM( iterator, seq_size_so_far ) );
+        }
+
+        _RAISE_UNPACK_NEED_MORE( seq_size_so_far );
+        return NULL;
+    }
+    else if ( PyList_CheckExact( iterator ) )
+    {
+        if (likely( seq_size_so_far < PyList_GET_SIZE( iterator ) ))
+        {
+            return INCREASE_REFCOUNT( PyList_GET_ITEM( iterator, seq_size_so_far ) );
+        }
+
+        _RAISE_UNPACK_NEED_MORE( seq_size_so_far );
+        return NULL;
+    }
+
+    assert( PyIter_Check( iterator ) );
 
     PyObject *result = (*Py_TYPE( iterator )->tp_iternext)( iterator );
 
@@ -577,14 +664,7 @@ NUITKA_MAY_BE_UNUSED static inline PyObject *UNPACK_NEXT( PyObject *iterator, in
         if (unlikely( !ERROR_OCCURED() || PyErr_ExceptionMatches( PyExc_StopIteration ) ))
 #endif
         {
-            if ( seq_size_so_far == 1 )
-            {
-                PyErr_Format( PyExc_ValueError, "need more than 1 value to unpack" );
-            }
-            else
-            {
-                PyErr_Format( PyExc_ValueError, "need more than %d values to unpack", seq_size_so_far );
-            }
+            _RAISE_UNPACK_NEED_MORE( seq_size_so_far );
         }
 
         return NULL;
@@ -595,6 +675,51 @@ NUITKA_MAY_BE_UNUSED static inline PyObject *UNPACK_NEXT( PyObject *iterator, in
     return result;
 }
 
+NUITKA_MAY_BE_UNUSED static inline bool UNPACK_ITERATOR_CHECK( PyObject *iterator, int count )
+{
+    assertObject( iterator );
+
+    if ( PyTuple_CheckExact( iterator ) || PyList_CheckExact( iterator ) )
+    {
+        if (likely( Py_SIZE( iterator ) == count ))
+        {
+            return true;
+        }
+    }
+    else
+    {
+        assert( PyIter_Check( iterator ) );
+
+        PyObject *attempt = (*Py_TYPE( iterator )->tp_iternext)( iterator );
+
+        if (likely( attempt == NULL ))
+        {
+            if ( ERROR_OCCURED() )
+            {
+                if (likely( PyErr_ExceptionMatches( PyExc_StopIteration ) ))
+                {
+                    PyErr_Clear();
+                }
+                else
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+
+        Py_DECREF( attempt );
+    }
+
+#if PYTHON_VERSION < 300
+    PyErr_Format( PyExc_ValueError, "too many values to unpack" );
+#else
+    PyErr_Format( PyExc_ValueError, "too many values to unpack (expected %d)", count );
+#endif
+    return false;
+}
+
 NUITKA_MAY_BE_UNUSED static inline PyObject *UNPACK_PARAMETER_NEXT( PyObject *iterator, int seq_size_so_far )
 {
     assertObject( iterator );
@@ -660,6 +785,48 @@ NUITKA_MAY_BE_UNUSED static inline bool UNPACK_PARAMETER_ITERATOR_CHECK( PyObjec
     }
 }
 
+// For parameter parsing, keyword argument names that are exact strings can be
+// dispatched by their length, returns -1 for all other keys.
+NUITKA_MAY_BE_UNUSED static inline Py_ssize_t GET_KEYWORD_NAME_LENGTH( PyObject *key )
+{
+#if PYTHON_VERSION < 300
+    if ( PyString_CheckExact( key ) )
+    {
+        return PyString_GET_SIZE( key );
+    }
+#elif PYTHON_VERSION < 330
+    if ( PyUnicode_CheckExact( key ) )
+    {
+        return PyUnicode_GET_SIZE( key );
+    }
+#else
+    if ( PyUnicode_CheckExact( key ) && PyUnicode_IS_READY( key ) )
+    {
+        return PyUnicode_GET_LENGTH( key );
+    }
+#endif
+
+    return -1;
+}
+
+// Compare an exact string keyword argument name with a parameter name of the
+// same length.
+NUITKA_MAY_BE_UNUSED static inline bool KEYWORD_NAME_EQ( PyObject *name, PyObject *key, Py_ssize_t length )
+{
+#if PYTHON_VERSION < 300
+    return memcmp( PyString_AS_STRING( name ), PyString_AS_STRING( key ), length ) == 0;
+#elif PYTHON_VERSION < 330
+    return memcmp( PyUnicode_AS_UNICODE( name ), PyUnicode_AS_UNICODE( key ), length * sizeof( Py_UNICODE ) ) == 0;
+#else
+    if (unlikely( PyUnicode_KIND( name ) != PyUnicode_KIND( key ) ))
+    {
+        return PyUnicode_Compare( name, key ) == 0;
+    }
+
+    return memcmp( PyUnicode_DATA( name ), PyUnicode_DATA( key ), length * PyUnicode_KIND( key ) ) == 0;
+#endif
+}
+
 
 NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_VARS( PyObject *source )
 {
@@ -743,6 +910,9 @@ extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObj
 extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize );
 #endif
 
+// Copy a code object, for "compile" of source code precompiled already.
+extern PyObject *COPY_CODE( PyObject *code_object );
+
 
 // For quicker builtin open() functionality.
 extern PyObject *BUILTIN_OPEN( PyObject *file_name, PyObject *mode, PyObject *buffering );
@@ -782,6 +952,14 @@ extern PyObject *BUILTIN_RANGE( PyObject *boundary );
 
 extern PyObject *BUILTIN_XRANGE( PyObject *low, PyObject *high, PyObject *step );
 
+// For iter() of range() and xrange() as done by loops, these avoid making the
+// list or the xrange object when possible.
+extern PyObject *BUILTIN_RANGE3_ITERATOR( PyObject *low, PyObject *high, PyObject *step );
+extern PyObject *BUILTIN_RANGE2_ITERATOR( PyObject *low, PyObject *high );
+extern PyObject *BUILTIN_RANGE_ITERATOR( PyObject *boundary );
+
+extern PyObject *BUILTIN_XRANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step );
+
 // For built-in builtin len() functionality.
 extern PyObject *BUILTIN_LEN( PyObject *boundary );
 
@@ -819,6 +997,7 @@ extern PyObject *UNSTREAM_UNICODE( unsigned char const *buffer, Py_ssize_t size
 extern PyObject *UNSTREAM_BYTES( unsigned char const *buffer, Py_ssize_t size );
 #endif
 extern PyObject *UNSTREAM_FLOAT( unsigned char const *buffer );
+extern PyObject *UNSTREAM_CODE( unsigned char const *buffer, Py_ssize_t size );
 
 extern void enhancePythonTypes( void );
 
@@ -39,6 +39,7 @@
 #include "methodobject.h"
 #include "frameobject.h"
 #include "pydebug.h"
+#include "marshal.h"
 
 #if PYTHON_VERSION < 300
 #undef initproc
@@ -163,6 +164,8 @@ NUITKA_MAY_BE_UNUSED static PyObject *_eval_locals_tmp;
 #define NUITKA_CROSS_MODULE
 #define NUITKA_LOCAL_MODULE static
 
+#include "nuitka/startup_trace.hpp"
+
 #include "nuitka/helpers.hpp"
 
 #include "nuitka/compiled_function.hpp"
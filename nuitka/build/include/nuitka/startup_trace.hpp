@@ -0,0 +1,48 @@
+//     Copyright 2014, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_STARTUP_TRACE_H__
+#define __NUITKA_STARTUP_TRACE_H__
+
+// Recording of a startup timeline, compiled in with "--trace-startup" only,
+// and then active only if the "NUITKA_STARTUP_TRACE" environment variable
+// gives a filename. At exit, the events are written there in the Chrome
+// trace event format, which e.g. "chrome://tracing" can display, with self
+// and cumulative times from the nesting of begin and end events.
+
+// Nothing here may use the Python C/API, as some events happen before the
+// interpreter is initialized. Names must be static strings, they are not
+// copied.
+
+#ifdef _NUITKA_STARTUP_TRACE
+
+extern void traceStartupEvent( char const *category, char const *name, char phase );
+extern bool isStartupTraceActive( void );
+
+#define NUITKA_STARTUP_TRACE_BEGIN( category, name ) traceStartupEvent( category, name, 'B' )
+#define NUITKA_STARTUP_TRACE_END( category, name ) traceStartupEvent( category, name, 'E' )
+#define NUITKA_STARTUP_TRACE_ACTIVE() isStartupTraceActive()
+
+#else
+
+#define NUITKA_STARTUP_TRACE_BEGIN( category, name )
+#define NUITKA_STARTUP_TRACE_END( category, name )
+#define NUITKA_STARTUP_TRACE_ACTIVE() false
+
+#endif
+
+#endif
@@ -26,6 +26,85 @@ extern volatile int _Py_Ticker;
 #define _Py_CheckInterval 20
 #endif
 
+// Iterations of loops that make no calls, which count as one tick only. Can be
+// given at build time.
+#ifndef _NUITKA_CALL_FREE_LOOP_TICKS
+#define _NUITKA_CALL_FREE_LOOP_TICKS 16
+#endif
+
+// Only used while holding the GIL, so threads can share it.
+extern int _Nuitka_CallFreeLoopTicker;
+
+// Check if there are other threads, which might wait for the GIL. Threads not
+// created by Python get a thread state before acquiring it too.
+NUITKA_MAY_BE_UNUSED static inline bool HAS_OTHER_THREADS( PyThreadState *tstate )
+{
+    PyInterpreterState *interp = tstate->interp;
+
+    if ( interp->tstate_head != tstate || tstate->next != NULL )
+    {
+        return true;
+    }
+
+    // Sub-interpreters share the GIL.
+    return PyInterpreterState_Head() != interp || PyInterpreterState_Next( interp ) != NULL;
+}
+
+// Release and acquire the GIL, so a thread waiting for it can run. Returns if
+// another thread did run meanwhile.
+NUITKA_MAY_BE_UNUSED static inline bool HAND_OFF_GIL( PyThreadState *tstate )
+{
+    int ticker = _Py_Ticker;
+
+    PyEval_SaveThread();
+    PyEval_AcquireThread( tstate );
+
+    // Python code run by other threads counts down the shared ticker.
+    return _Py_Ticker != ticker;
+}
+
+#if PYTHON_VERSION < 300
+// CPython 2 doesn't tell if a thread waits for the GIL, handing it off is the
+// only way to find out. After hand-offs that no other thread took, the next
+// ones are made at doubled intervals, up to this many check intervals.
+#define _NUITKA_GIL_HAND_OFF_MAX_SKIP 16
+
+// Only used while holding the GIL, so threads can share them.
+extern int _Nuitka_GILHandOffInterval;
+extern int _Nuitka_GILHandOffSkip;
+
+NUITKA_MAY_BE_UNUSED static inline void CONSIDER_GIL_HAND_OFF( PyThreadState *tstate )
+{
+    if ( _Nuitka_GILHandOffSkip > 0 )
+    {
+        _Nuitka_GILHandOffSkip -= 1;
+        return;
+    }
+
+    if ( HAND_OFF_GIL( tstate ) )
+    {
+        _Nuitka_GILHandOffInterval = 0;
+    }
+    else if ( _Nuitka_GILHandOffInterval == 0 )
+    {
+        _Nuitka_GILHandOffInterval = 1;
+    }
+    else if ( _Nuitka_GILHandOffInterval < _NUITKA_GIL_HAND_OFF_MAX_SKIP )
+    {
+        _Nuitka_GILHandOffInterval *= 2;
+    }
+
+    _Nuitka_GILHandOffSkip = _Nuitka_GILHandOffInterval;
+}
+#else
+// The GIL of CPython 3 only forces a switch to a thread that has been waiting
+// for it a while, and asked for it, which tells if one actually waits.
+NUITKA_MAY_BE_UNUSED static inline void CONSIDER_GIL_HAND_OFF( PyThreadState *tstate )
+{
+    HAND_OFF_GIL( tstate );
+}
+#endif
+
 NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING( void )
 {
     // Decrease ticker
@@ -43,13 +122,10 @@ NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING( void )
         PyThreadState *tstate = PyThreadState_GET();
         assert( tstate );
 
-        if ( PyEval_ThreadsInitialized() )
+        // Without other threads, none can be waiting for the GIL.
+        if ( PyEval_ThreadsInitialized() && HAS_OTHER_THREADS( tstate ) )
         {
-            // Release and acquire the GIL, it's very inefficient, because we
-            // don't even know if it makes sense to do it. A controlling thread
-            // should be used to determine if it's needed at all.
-            PyEval_SaveThread();
-            PyEval_AcquireThread( tstate );
+            CONSIDER_GIL_HAND_OFF( tstate );
         }
 
         if (unlikely( tstate->async_exc != NULL ))
@@ -66,4 +142,17 @@ NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING( void )
     return true;
 }
 
+// For loops that make no calls, their iterations are cheap, and count less.
+NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING_CALL_FREE( void )
+{
+    if (likely( --_Nuitka_CallFreeLoopTicker >= 0 ))
+    {
+        return true;
+    }
+
+    _Nuitka_CallFreeLoopTicker = _NUITKA_CALL_FREE_LOOP_TICKS;
+
+    return CONSIDER_THREADING();
+}
+
 #endif
@@ -18,7 +18,25 @@
 #ifndef __NUITKA_VARIABLES_SHARED_H__
 #define __NUITKA_VARIABLES_SHARED_H__
 
-class PyObjectSharedStorage
+// Shared storages are created for every shared variable on every call of a
+// function that creates closures, so they are allocated from a free list.
+extern void *Nuitka_SharedStorage_Allocate( size_t size );
+extern void Nuitka_SharedStorage_Release( void *storage );
+
+struct Nuitka_SharedStorageBase
+{
+    static void *operator new( size_t size )
+    {
+        return Nuitka_SharedStorage_Allocate( size );
+    }
+
+    static void operator delete( void *storage )
+    {
+        Nuitka_SharedStorage_Release( storage );
+    }
+};
+
+class PyObjectSharedStorage : public Nuitka_SharedStorageBase
 {
 public:
     explicit PyObjectSharedStorage( PyObject *object )
@@ -111,7 +129,7 @@ protected:
     PyObjectClosureVariable( const PyObjectClosureVariable & ) {  assert( false ); }
 };
 
-class PyObjectSharedTempStorage
+class PyObjectSharedTempStorage : public Nuitka_SharedStorageBase
 {
 public:
     explicit PyObjectSharedTempStorage( PyObject *object )
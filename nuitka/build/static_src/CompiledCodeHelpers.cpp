@@ -28,6 +28,33 @@
 
 extern PyObject *const_str_plain_compile;
 
+PyObject *COPY_CODE( PyObject *code_object )
+{
+    // Code objects are immutable, but "compile" gives a new one each time,
+    // so this makes one with the same values.
+    PyCodeObject *code = (PyCodeObject *)code_object;
+
+    return (PyObject *)PyCode_New(
+        code->co_argcount,
+#if PYTHON_VERSION >= 300
+        code->co_kwonlyargcount,
+#endif
+        code->co_nlocals,
+        code->co_stacksize,
+        code->co_flags,
+        code->co_code,
+        code->co_consts,
+        code->co_names,
+        code->co_varnames,
+        code->co_freevars,
+        code->co_cellvars,
+        code->co_filename,
+        code->co_name,
+        code->co_firstlineno,
+        code->co_lnotab
+    );
+}
+
 static PythonBuiltin _python_builtin_compile( &const_str_plain_compile );
 
 #if PYTHON_VERSION < 300
@@ -799,6 +826,234 @@ PyObject *BUILTIN_XRANGE( PyObject *low, PyObject *high, PyObject *step )
 }
 #endif
 
+static PyObject *Nuitka_RangeIterator_tp_iternext( Nuitka_RangeIteratorObject *iterator )
+{
+    return RANGE_ITERATOR_NEXT( iterator );
+}
+
+static void Nuitka_RangeIterator_tp_dealloc( Nuitka_RangeIteratorObject *iterator )
+{
+    PyObject_Del( iterator );
+}
+
+PyTypeObject Nuitka_RangeIterator_Type =
+{
+    PyVarObject_HEAD_INIT(&PyType_Type, 0)
+    "rangeiterator",                                  // tp_name
+    sizeof(Nuitka_RangeIteratorObject),               // tp_basicsize
+    0,                                                // tp_itemsize
+    (destructor)Nuitka_RangeIterator_tp_dealloc,      // tp_dealloc
+    0,                                                // tp_print
+    0,                                                // tp_getattr
+    0,                                                // tp_setattr
+    0,                                                // tp_compare
+    0,                                                // tp_repr
+    0,                                                // tp_as_number
+    0,                                                // tp_as_sequence
+    0,                                                // tp_as_mapping
+    0,                                                // tp_hash
+    0,                                                // tp_call
+    0,                                                // tp_str
+    PyObject_GenericGetAttr,                          // tp_getattro
+    0,                                                // tp_setattro
+    0,                                                // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                               // tp_flags
+    0,                                                // tp_doc
+    0,                                                // tp_traverse
+    0,                                                // tp_clear
+    0,                                                // tp_richcompare
+    0,                                                // tp_weaklistoffset
+    PyObject_SelfIter,                                // tp_iter
+    (iternextfunc)Nuitka_RangeIterator_tp_iternext,   // tp_iternext
+};
+
+// Get the value of a range argument, if it's an exact int that fits into C
+// "long", otherwise the normal range code has to deal with it.
+static bool GET_RANGE_ITERATOR_ARG( PyObject *value, long *result )
+{
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( value ) )
+    {
+        *result = PyInt_AS_LONG( value );
+        return true;
+    }
+#else
+    if ( PyLong_CheckExact( value ) )
+    {
+        int overflow;
+        *result = PyLong_AsLongAndOverflow( value, &overflow );
+
+        return overflow == 0;
+    }
+#endif
+
+    return false;
+}
+
+// Make the iterator, or return NULL without an error set, if the number of
+// values doesn't fit.
+static PyObject *MAKE_RANGE_ITERATOR( long start, long end, long step )
+{
+    assert( step != 0 );
+
+    // Same as CPython computes it, unsigned to avoid overflows.
+    unsigned long length = 0;
+
+    if ( step > 0 && start < end )
+    {
+        length = 1 + ( (unsigned long)end - (unsigned long)start - 1 ) / step;
+    }
+    else if ( step < 0 && start > end )
+    {
+        length = 1 + ( (unsigned long)start - (unsigned long)end - 1 ) / ( 0UL - step );
+    }
+
+    if (unlikely( length > (unsigned long)LONG_MAX ))
+    {
+        return NULL;
+    }
+
+    Nuitka_RangeIteratorObject *result = PyObject_New( Nuitka_RangeIteratorObject, &Nuitka_RangeIterator_Type );
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    result->m_start = start;
+    result->m_step = step;
+    result->m_length = length;
+    result->m_index = 0;
+
+    return (PyObject *)result;
+}
+
+PyObject *BUILTIN_RANGE3_ITERATOR( PyObject *low, PyObject *high, PyObject *step )
+{
+    long start, end, step_long;
+
+    if ( GET_RANGE_ITERATOR_ARG( low, &start ) && GET_RANGE_ITERATOR_ARG( high, &end ) && GET_RANGE_ITERATOR_ARG( step, &step_long ) && step_long != 0 )
+    {
+        PyObject *result = MAKE_RANGE_ITERATOR( start, end, step_long );
+
+        if ( result != NULL || ERROR_OCCURED() )
+        {
+            return result;
+        }
+    }
+
+    // Errors and large values are for the normal code.
+    PyObject *range = BUILTIN_RANGE3( low, high, step );
+
+    if (unlikely( range == NULL ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = MAKE_ITERATOR( range );
+    Py_DECREF( range );
+
+    return result;
+}
+
+PyObject *BUILTIN_RANGE2_ITERATOR( PyObject *low, PyObject *high )
+{
+    long start, end;
+
+    if ( GET_RANGE_ITERATOR_ARG( low, &start ) && GET_RANGE_ITERATOR_ARG( high, &end ) )
+    {
+        PyObject *result = MAKE_RANGE_ITERATOR( start, end, 1 );
+
+        if ( result != NULL || ERROR_OCCURED() )
+        {
+            return result;
+        }
+    }
+
+    PyObject *range = BUILTIN_RANGE2( low, high );
+
+    if (unlikely( range == NULL ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = MAKE_ITERATOR( range );
+    Py_DECREF( range );
+
+    return result;
+}
+
+PyObject *BUILTIN_RANGE_ITERATOR( PyObject *boundary )
+{
+    long end;
+
+    if ( GET_RANGE_ITERATOR_ARG( boundary, &end ) )
+    {
+        PyObject *result = MAKE_RANGE_ITERATOR( 0, end, 1 );
+
+        if ( result != NULL || ERROR_OCCURED() )
+        {
+            return result;
+        }
+    }
+
+    PyObject *range = BUILTIN_RANGE( boundary );
+
+    if (unlikely( range == NULL ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = MAKE_ITERATOR( range );
+    Py_DECREF( range );
+
+    return result;
+}
+
+#if PYTHON_VERSION < 300
+PyObject *BUILTIN_XRANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step )
+{
+    long start = 0, end, step_long = 1;
+    bool quick;
+
+    if ( high == NULL )
+    {
+        quick = GET_RANGE_ITERATOR_ARG( low, &end );
+    }
+    else
+    {
+        quick = GET_RANGE_ITERATOR_ARG( low, &start ) && GET_RANGE_ITERATOR_ARG( high, &end );
+
+        if ( quick && step != NULL )
+        {
+            quick = GET_RANGE_ITERATOR_ARG( step, &step_long ) && step_long != 0;
+        }
+    }
+
+    if ( quick )
+    {
+        PyObject *result = MAKE_RANGE_ITERATOR( start, end, step_long );
+
+        if ( result != NULL || ERROR_OCCURED() )
+        {
+            return result;
+        }
+    }
+
+    PyObject *range = BUILTIN_XRANGE( low, high, step );
+
+    if (unlikely( range == NULL ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = MAKE_ITERATOR( range );
+    Py_DECREF( range );
+
+    return result;
+}
+#endif
+
 PyObject *BUILTIN_LEN( PyObject *value )
 {
     assertObject( value );
@@ -1286,6 +1541,23 @@ PyObject *UNSTREAM_FLOAT( unsigned char const *buffer )
     return result;
 }
 
+PyObject *UNSTREAM_CODE( unsigned char const *buffer, Py_ssize_t size )
+{
+    // Code objects precompiled for "exec", "eval", and "compile" of constant
+    // source code, these are marshalled, as that is what marshal is for.
+    PyObject *result = PyMarshal_ReadObjectFromString( (char *)buffer, size );
+
+    if (unlikely( result == NULL ))
+    {
+        PyErr_Print();
+    }
+
+    assertObject( result );
+    assert( PyCode_Check( result ) );
+
+    return result;
+}
+
 #if PYTHON_VERSION >= 300
 PyObject *UNSTREAM_BYTES( unsigned char const *buffer, Py_ssize_t size )
 {
@@ -1883,6 +2155,8 @@ int Nuitka_BuiltinModule_SetAttr( PyModuleObject *module, PyObject *name, PyObje
     return PyObject_GenericSetAttr( (PyObject *)module, name, value );
 }
 
+PyTypeObject *Nuitka_MethodDescr_Type = NULL;
+
 void _initBuiltinModule()
 {
 #if _NUITKA_MODULE
@@ -1935,6 +2209,10 @@ void _initBuiltinModule()
     // Replace type of builtin module to take over.
     ((PyObject *)builtin_module)->ob_type = &Nuitka_BuiltinModule_Type;
     assert( PyModule_Check( builtin_module ) == 1 );
+
+    // Get a hand at the type of method descriptors through a method of a
+    // builtin type, it's not exported by all Python versions.
+    Nuitka_MethodDescr_Type = Py_TYPE( PyDict_GetItemString( PyList_Type.tp_dict, "append" ) );
 }
 
 
@@ -2095,6 +2373,397 @@ PyObject *CALL_FUNCTION_NO_ARGS( PyObject *called )
     );
 }
 
+PyObject *CALL_FUNCTION_WITH_POSARGS( PyObject *called, PyObject *positional_args )
+{
+    assertObject( called );
+    assertObject( positional_args );
+    assert( PyTuple_Check( positional_args ) );
+
+    // For compiled functions, the items of the tuple can be given to the
+    // argument parser directly, avoiding the "tp_call" slot.
+    if ( Nuitka_Function_Check( called ) )
+    {
+        if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+        {
+            return NULL;
+        }
+
+        Nuitka_FunctionObject *function = (Nuitka_FunctionObject *)called;
+        PyObject *result;
+
+        if ( function->m_direct_arg_parser )
+        {
+            result = function->m_direct_arg_parser(
+                function,
+                &PyTuple_GET_ITEM( positional_args, 0 ),
+                int( PyTuple_GET_SIZE( positional_args ) )
+            );
+        }
+        else
+        {
+            result = function->m_code(
+                function,
+                &PyTuple_GET_ITEM( positional_args, 0 ),
+                PyTuple_GET_SIZE( positional_args ),
+                NULL
+            );
+        }
+
+        Py_LeaveRecursiveCall();
+
+        return result;
+    }
+
+    return CALL_FUNCTION(
+        called,
+        positional_args,
+        NULL
+    );
+}
+
+extern PyObject *const_str_plain_keys;
+
+// The name and description of a callable, as used in the error messages of
+// complex calls, e.g. "f() argument after * must be a sequence, not int".
+static char const *GET_CALLABLE_NAME( PyObject *object )
+{
+    if ( Nuitka_Function_Check( object ) )
+    {
+        return Nuitka_String_AsString( Nuitka_Function_GetName( object ) );
+    }
+    else if ( PyFunction_Check( object ) )
+    {
+        return Nuitka_String_AsString( ((PyFunctionObject *)object)->func_name );
+    }
+    else if ( PyCFunction_Check( object ) )
+    {
+        return ((PyCFunctionObject *)object)->m_ml->ml_name;
+    }
+#if PYTHON_VERSION < 300
+    else if ( Nuitka_Method_Check( object ) )
+    {
+        return Nuitka_String_AsString( ((Nuitka_MethodObject *)object)->m_function->m_name );
+    }
+    else if ( PyMethod_Check( object ) )
+    {
+        return GET_CALLABLE_NAME( PyMethod_GET_FUNCTION( object ) );
+    }
+    else if ( PyClass_Check( object ) )
+    {
+        return PyString_AS_STRING( ((PyClassObject *)object)->cl_name );
+    }
+    else if ( PyInstance_Check( object ) )
+    {
+        return PyString_AS_STRING( ((PyInstanceObject *)object)->in_class->cl_name );
+    }
+#endif
+    else
+    {
+        return Py_TYPE( object )->tp_name;
+    }
+}
+
+static char const *GET_CALLABLE_DESC( PyObject *object )
+{
+    if ( Nuitka_Function_Check( object ) || PyFunction_Check( object ) || PyCFunction_Check( object ) )
+    {
+        return "()";
+    }
+#if PYTHON_VERSION < 300
+    else if ( Nuitka_Method_Check( object ) || PyMethod_Check( object ) )
+    {
+        return "()";
+    }
+    else if ( PyClass_Check( object ) )
+    {
+        return " constructor";
+    }
+    else if ( PyInstance_Check( object ) )
+    {
+        return " instance";
+    }
+#endif
+    else
+    {
+        return " object";
+    }
+}
+
+// Merge the star dict argument into the keyword arguments, or make a dict of
+// it, if there are none. Returns a new reference.
+static PyObject *MERGE_STAR_DICT_ARG( PyObject *called, PyObject *named_args, PyObject *dict_star_arg )
+{
+    if ( !PyDict_Check( dict_star_arg ) )
+    {
+        PyObject *keys_method = PyObject_GetAttr( dict_star_arg, const_str_plain_keys );
+        PyObject *keys = NULL;
+
+        if ( keys_method != NULL )
+        {
+            keys = CALL_FUNCTION_NO_ARGS( keys_method );
+            Py_DECREF( keys_method );
+        }
+
+        if (unlikely( keys == NULL ))
+        {
+            if ( PyErr_ExceptionMatches( PyExc_AttributeError ) )
+            {
+                PyErr_Format(
+                    PyExc_TypeError,
+                    "%s%s argument after ** must be a mapping, not %s",
+                    GET_CALLABLE_NAME( called ),
+                    GET_CALLABLE_DESC( called ),
+                    Py_TYPE( dict_star_arg )->tp_name
+                );
+            }
+
+            return NULL;
+        }
+
+        PyObject *iter = MAKE_ITERATOR( keys );
+        Py_DECREF( keys );
+
+        if (unlikely( iter == NULL ))
+        {
+            return NULL;
+        }
+
+        PyObject *result;
+
+        if ( named_args != NULL )
+        {
+            result = named_args;
+            Py_INCREF( result );
+        }
+        else
+        {
+            result = PyDict_New();
+        }
+
+        PyObject *key;
+
+        while ( ( key = ITERATOR_NEXT( iter ) ) != NULL )
+        {
+            if ( named_args != NULL && PyDict_GetItem( result, key ) != NULL )
+            {
+                PyObject *key_str = PyObject_Str( key );
+
+                if ( key_str != NULL )
+                {
+                    PyErr_Format(
+                        PyExc_TypeError,
+                        "%s%s got multiple values for keyword argument '%s'",
+                        GET_CALLABLE_NAME( called ),
+                        GET_CALLABLE_DESC( called ),
+                        Nuitka_String_AsString( key_str )
+                    );
+
+                    Py_DECREF( key_str );
+                }
+
+                Py_DECREF( key );
+                Py_DECREF( iter );
+                Py_DECREF( result );
+
+                return NULL;
+            }
+
+            PyObject *value = PyObject_GetItem( dict_star_arg, key );
+
+            if (unlikely( value == NULL || PyDict_SetItem( result, key, value ) == -1 ))
+            {
+                Py_XDECREF( value );
+                Py_DECREF( key );
+                Py_DECREF( iter );
+                Py_DECREF( result );
+
+                return NULL;
+            }
+
+            Py_DECREF( value );
+            Py_DECREF( key );
+        }
+
+        Py_DECREF( iter );
+
+        if (unlikely( ERROR_OCCURED() ))
+        {
+            if ( !PyErr_ExceptionMatches( PyExc_StopIteration ) )
+            {
+                Py_DECREF( result );
+                return NULL;
+            }
+
+            PyErr_Clear();
+        }
+
+        return result;
+    }
+    else if ( named_args == NULL )
+    {
+        // Given to the callee as it is, no copy is made.
+        Py_INCREF( dict_star_arg );
+        return dict_star_arg;
+    }
+    else
+    {
+        Py_ssize_t pos = 0;
+        PyObject *key, *value;
+
+        while ( PyDict_Next( dict_star_arg, &pos, &key, &value ) )
+        {
+            if (unlikely( PyDict_GetItem( named_args, key ) != NULL ))
+            {
+                PyObject *key_str = PyObject_Str( key );
+
+                if ( key_str != NULL )
+                {
+                    PyErr_Format(
+                        PyExc_TypeError,
+                        "%s%s got multiple values for keyword argument '%s'",
+                        GET_CALLABLE_NAME( called ),
+                        GET_CALLABLE_DESC( called ),
+                        Nuitka_String_AsString( key_str )
+                    );
+
+                    Py_DECREF( key_str );
+                }
+
+                return NULL;
+            }
+
+            if (unlikely( PyDict_SetItem( named_args, key, value ) == -1 ))
+            {
+                return NULL;
+            }
+        }
+
+        Py_INCREF( named_args );
+        return named_args;
+    }
+}
+
+// Merge the star list argument into the positional arguments, or make a tuple
+// of it, if there are none. Returns a new reference.
+static PyObject *MERGE_STAR_LIST_ARG( PyObject *called, PyObject *positional_args, PyObject *list_star_arg )
+{
+    PyObject *star_tuple;
+
+    if ( PyTuple_Check( list_star_arg ) )
+    {
+        star_tuple = list_star_arg;
+        Py_INCREF( star_tuple );
+    }
+    else
+    {
+        star_tuple = PySequence_Tuple( list_star_arg );
+
+        if (unlikely( star_tuple == NULL ))
+        {
+            if ( PyErr_ExceptionMatches( PyExc_TypeError ) )
+            {
+                PyErr_Format(
+                    PyExc_TypeError,
+                    "%s%s argument after * must be a sequence, not %s",
+                    GET_CALLABLE_NAME( called ),
+                    GET_CALLABLE_DESC( called ),
+                    Py_TYPE( list_star_arg )->tp_name
+                );
+            }
+
+            return NULL;
+        }
+    }
+
+    if ( positional_args == NULL )
+    {
+        return star_tuple;
+    }
+
+    Py_ssize_t pos_size = PyTuple_GET_SIZE( positional_args );
+    Py_ssize_t star_size = PyTuple_GET_SIZE( star_tuple );
+
+    PyObject *result = PyTuple_New( pos_size + star_size );
+
+    for ( Py_ssize_t i = 0; i < pos_size; i++ )
+    {
+        PyObject *item = PyTuple_GET_ITEM( positional_args, i );
+        Py_INCREF( item );
+        PyTuple_SET_ITEM( result, i, item );
+    }
+
+    for ( Py_ssize_t i = 0; i < star_size; i++ )
+    {
+        PyObject *item = PyTuple_GET_ITEM( star_tuple, i );
+        Py_INCREF( item );
+        PyTuple_SET_ITEM( result, pos_size + i, item );
+    }
+
+    Py_DECREF( star_tuple );
+
+    return result;
+}
+
+PyObject *CALL_FUNCTION_COMPLEX( PyObject *called, PyObject *positional_args, PyObject *named_args, PyObject *list_star_arg, PyObject *dict_star_arg )
+{
+    assertObject( called );
+    assert( positional_args == NULL || PyTuple_Check( positional_args ) );
+    assert( named_args == NULL || PyDict_Check( named_args ) );
+
+    // The star dict is checked before the star list, as CPython does it.
+    if ( dict_star_arg != NULL )
+    {
+        named_args = MERGE_STAR_DICT_ARG( called, named_args, dict_star_arg );
+
+        if (unlikely( named_args == NULL ))
+        {
+            return NULL;
+        }
+    }
+    else
+    {
+        Py_XINCREF( named_args );
+    }
+
+    if ( list_star_arg != NULL )
+    {
+        positional_args = MERGE_STAR_LIST_ARG( called, positional_args, list_star_arg );
+
+        if (unlikely( positional_args == NULL ))
+        {
+            Py_XDECREF( named_args );
+            return NULL;
+        }
+    }
+    else if ( positional_args != NULL )
+    {
+        Py_INCREF( positional_args );
+    }
+    else
+    {
+        positional_args = const_tuple_empty;
+        Py_INCREF( positional_args );
+    }
+
+    PyObject *result;
+
+    // Without keyword arguments, compiled functions are given the positional
+    // arguments directly.
+    if ( named_args == NULL || PyDict_Size( named_args ) == 0 )
+    {
+        result = CALL_FUNCTION_WITH_POSARGS( called, positional_args );
+    }
+    else
+    {
+        result = CALL_FUNCTION( called, positional_args, named_args );
+    }
+
+    Py_DECREF( positional_args );
+    Py_XDECREF( named_args );
+
+    return result;
+}
+
 #if defined(_NUITKA_STANDALONE) || _NUITKA_FROZEN > 0
 
 #include <osdefs.h>
@@ -2326,6 +2995,57 @@ void _initBuiltinOriginalValues()
 volatile int _Py_Ticker = _Py_CheckInterval;
 #endif
 
+int _Nuitka_CallFreeLoopTicker = _NUITKA_CALL_FREE_LOOP_TICKS;
+
+#if PYTHON_VERSION < 300
+int _Nuitka_GILHandOffInterval = 0;
+int _Nuitka_GILHandOffSkip = 0;
+#endif
+
+#ifdef _NUITKA_ATTRIBUTE_CACHE_STATS
+
+static Nuitka_AttributeCache *attribute_caches = NULL;
+
+static void writeAttributeCacheStats( void )
+{
+    for ( Nuitka_AttributeCache *cache = attribute_caches; cache != NULL; cache = cache->m_next )
+    {
+        fprintf( stderr, "Attribute cache '%s': %lu hits, %lu misses\n", cache->m_name, cache->m_hits, cache->m_misses );
+    }
+}
+
+void registerAttributeCache( Nuitka_AttributeCache *cache, PyObject *attr_name )
+{
+    static int stats_state = 0;
+
+    if ( stats_state == 0 )
+    {
+        char const *stats = getenv( "NUITKA_ATTRIBUTE_CACHE_STATS" );
+
+        if ( stats == NULL || *stats == 0 )
+        {
+            stats_state = -1;
+            return;
+        }
+
+        atexit( writeAttributeCacheStats );
+
+        stats_state = 1;
+    }
+    else if ( stats_state < 0 )
+    {
+        return;
+    }
+
+    // The name is copied, as the string may be released before exit.
+    cache->m_name = strdup( Nuitka_String_AsString_Unchecked( attr_name ) );
+
+    cache->m_next = attribute_caches;
+    attribute_caches = cache;
+}
+
+#endif
+
 // Reverse operation mapping.
 static int const swapped_op[] =
 {
@@ -421,6 +421,69 @@ PyFrameObject *MAKE_FRAME( PyCodeObject *code, PyObject *module )
     return (PyFrameObject *)result;
 }
 
+PyFrameObject *acquirePooledFrame( Nuitka_FramePool *pool, PyCodeObject *code, PyObject *module )
+{
+#if PYTHON_VERSION < 340
+    PyThreadState *thread_state = PyThreadState_GET();
+#endif
+
+    int available = -1;
+    int slot;
+
+    for ( slot = 0; slot < _NUITKA_FRAME_POOL_SIZE; slot++ )
+    {
+        PyFrameObject *frame_object = pool->m_frames[ slot ];
+
+        // Slots are filled in order, so the rest is unused too.
+        if ( frame_object == NULL )
+        {
+            break;
+        }
+
+        if ( Py_REFCNT( frame_object ) == 1 && frame_object->f_back == NULL )
+        {
+#if PYTHON_VERSION < 340
+            // Prefer the frames last used by the thread.
+            if ( frame_object->f_tstate == thread_state )
+            {
+                return frame_object;
+            }
+
+            if ( available == -1 )
+            {
+                available = slot;
+            }
+#else
+            return frame_object;
+#endif
+        }
+    }
+
+    if ( available != -1 )
+    {
+        PyFrameObject *frame_object = pool->m_frames[ available ];
+
+#if PYTHON_VERSION < 340
+        frame_object->f_tstate = thread_state;
+#endif
+
+        return frame_object;
+    }
+
+    if ( slot == _NUITKA_FRAME_POOL_SIZE )
+    {
+        // All frames are in use, give up one of them to its current user, it
+        // will be released when that is done with it.
+        slot = pool->m_replace;
+        pool->m_replace = ( slot + 1 ) % _NUITKA_FRAME_POOL_SIZE;
+
+        Py_DECREF( pool->m_frames[ slot ] );
+    }
+
+    pool->m_frames[ slot ] = MAKE_FRAME( code, module );
+    return pool->m_frames[ slot ];
+}
+
 extern PyObject *const_str_empty;
 extern PyObject *const_bytes_empty;
 
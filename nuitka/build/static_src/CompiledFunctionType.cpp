@@ -409,6 +409,12 @@ static PyMethodDef Nuitka_Generator_methods[] =
 };
 
 
+// Free list for function objects, try to avoid malloc overhead.
+static Nuitka_FunctionObject *function_cache_head = NULL;
+static const int max_function_cache_size = 4096;
+
+Nuitka_FreeListCounts function_free_list_counts = { 0, 0, 0 };
+
 static void Nuitka_Function_tp_dealloc( Nuitka_FunctionObject *function )
 {
     Nuitka_GC_UnTrack( function );
@@ -437,7 +443,16 @@ static void Nuitka_Function_tp_dealloc( Nuitka_FunctionObject *function )
         function->m_cleanup( function->m_context );
     }
 
-    PyObject_GC_Del( function );
+    if (likely( function_free_list_counts.size < max_function_cache_size ))
+    {
+        function->m_dict = (PyObject *)function_cache_head;
+        function_cache_head = function;
+        function_free_list_counts.size += 1;
+    }
+    else
+    {
+        PyObject_GC_Del( function );
+    }
 }
 
 static const long tp_flags =
@@ -505,7 +520,21 @@ static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_par
 static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, releaser cleanup )
 #endif
 {
-    Nuitka_FunctionObject *result = PyObject_GC_New( Nuitka_FunctionObject, &Nuitka_Function_Type );
+    Nuitka_FunctionObject *result = function_cache_head;
+
+    if ( result != NULL )
+    {
+        function_cache_head = (Nuitka_FunctionObject *)function_cache_head->m_dict;
+        function_free_list_counts.size -= 1;
+        function_free_list_counts.reused += 1;
+
+        PyObject_INIT( result, &Nuitka_Function_Type );
+    }
+    else
+    {
+        result = PyObject_GC_New( Nuitka_FunctionObject, &Nuitka_Function_Type );
+        function_free_list_counts.allocated += 1;
+    }
 
     assert( result );
 
@@ -593,6 +622,154 @@ PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dpa
 }
 #endif
 
+// Free lists for contexts, one per size in units of pointers, up to a limit
+// beyond which contexts are rare enough.
+#define NUITKA_CONTEXT_SIZE_UNIT sizeof( void * )
+#define NUITKA_CONTEXT_SIZES 32
+
+struct Nuitka_ContextFreeListEntry
+{
+    Nuitka_ContextFreeListEntry *m_next;
+};
+
+static Nuitka_ContextFreeListEntry *context_cache_heads[ NUITKA_CONTEXT_SIZES ] = { NULL };
+static int context_cache_sizes[ NUITKA_CONTEXT_SIZES ] = { 0 };
+static const int max_context_cache_size = 256;
+
+Nuitka_FreeListCounts context_free_list_counts = { 0, 0, 0 };
+
+static inline size_t getContextSizeIndex( size_t size )
+{
+    return ( size + NUITKA_CONTEXT_SIZE_UNIT - 1 ) / NUITKA_CONTEXT_SIZE_UNIT - 1;
+}
+
+void *Nuitka_Context_Allocate( size_t size )
+{
+    size_t index = getContextSizeIndex( size );
+
+    if ( index < NUITKA_CONTEXT_SIZES && context_cache_heads[ index ] != NULL )
+    {
+        Nuitka_ContextFreeListEntry *result = context_cache_heads[ index ];
+
+        context_cache_heads[ index ] = result->m_next;
+        context_cache_sizes[ index ] -= 1;
+
+        context_free_list_counts.size -= 1;
+        context_free_list_counts.reused += 1;
+
+        return result;
+    }
+
+    context_free_list_counts.allocated += 1;
+
+    // Allocate the full unit size, so the memory is usable for all sizes
+    // sharing the same free list.
+    if ( index < NUITKA_CONTEXT_SIZES )
+    {
+        size = ( index + 1 ) * NUITKA_CONTEXT_SIZE_UNIT;
+    }
+
+    return ::operator new( size );
+}
+
+void Nuitka_Context_Release( void *context, size_t size )
+{
+    size_t index = getContextSizeIndex( size );
+
+    if ( index < NUITKA_CONTEXT_SIZES && context_cache_sizes[ index ] < max_context_cache_size )
+    {
+        Nuitka_ContextFreeListEntry *entry = (Nuitka_ContextFreeListEntry *)context;
+
+        entry->m_next = context_cache_heads[ index ];
+        context_cache_heads[ index ] = entry;
+        context_cache_sizes[ index ] += 1;
+
+        context_free_list_counts.size += 1;
+    }
+    else
+    {
+        ::operator delete( context );
+    }
+}
+
+// Free list for the storages of shared variables, these have all the same size.
+static Nuitka_ContextFreeListEntry *shared_storage_cache_head = NULL;
+static const int max_shared_storage_cache_size = 4096;
+
+Nuitka_FreeListCounts shared_storage_free_list_counts = { 0, 0, 0 };
+
+void *Nuitka_SharedStorage_Allocate( size_t size )
+{
+    assert( size == sizeof( PyObjectSharedStorage ) );
+    assert( size == sizeof( PyObjectSharedTempStorage ) );
+
+    if ( shared_storage_cache_head != NULL )
+    {
+        Nuitka_ContextFreeListEntry *result = shared_storage_cache_head;
+
+        shared_storage_cache_head = result->m_next;
+
+        shared_storage_free_list_counts.size -= 1;
+        shared_storage_free_list_counts.reused += 1;
+
+        return result;
+    }
+
+    shared_storage_free_list_counts.allocated += 1;
+
+    return ::operator new( size );
+}
+
+void Nuitka_SharedStorage_Release( void *storage )
+{
+    if ( shared_storage_free_list_counts.size < max_shared_storage_cache_size )
+    {
+        Nuitka_ContextFreeListEntry *entry = (Nuitka_ContextFreeListEntry *)storage;
+
+        entry->m_next = shared_storage_cache_head;
+        shared_storage_cache_head = entry;
+
+        shared_storage_free_list_counts.size += 1;
+    }
+    else
+    {
+        ::operator delete( storage );
+    }
+}
+
+static void writeFreeListCounts( char const *name, Nuitka_FreeListCounts const *counts )
+{
+    fprintf( stderr, "Free list '%s': %lu reused, %lu allocated, %d held\n", name, counts->reused, counts->allocated, counts->size );
+}
+
+static void writeFreeListStats( void )
+{
+    writeFreeListCounts( "function", &function_free_list_counts );
+    writeFreeListCounts( "generator", &generator_free_list_counts );
+    writeFreeListCounts( "context", &context_free_list_counts );
+    writeFreeListCounts( "shared storage", &shared_storage_free_list_counts );
+}
+
+void initFreeListStats( void )
+{
+    // Program and each module initialization call this, output only once.
+    static bool init_done = false;
+
+    if ( init_done )
+    {
+        return;
+    }
+
+    init_done = true;
+
+    char const *stats = getenv( "NUITKA_FREE_LIST_STATS" );
+
+    if ( stats != NULL && *stats != 0 )
+    {
+        atexit( writeFreeListStats );
+    }
+}
+
 void ERROR_NO_ARGUMENTS_ALLOWED( Nuitka_FunctionObject *function,
 #if PYTHON_VERSION >= 330
                                  PyObject *kw,
@@ -70,9 +70,10 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         {
             generator->m_status = status_Running;
 
-            // Prepare the generator context to run. TODO: Make stack size
-            // rational.
+#ifndef _NUITKA_STACKLESS_GENERATORS
+            // Prepare the generator context to run.
             prepareFiber( &generator->m_yielder_context, generator->m_code, (unsigned long)generator );
+#endif
         }
 
         generator->m_yielded = value;
@@ -104,7 +105,13 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         // Continue the yielder function while preventing recursion.
         generator->m_running = true;
 
+#ifdef _NUITKA_STACKLESS_GENERATORS
+        // The generator code returns at each yield, and continues after it
+        // when called again.
+        ((yielder_func)generator->m_code)( generator );
+#else
         swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+#endif
 
         generator->m_running = false;
 
@@ -127,6 +134,12 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
 
             generator->m_status = status_Finished;
 
+#ifndef _NUITKA_STACKLESS_GENERATORS
+            // The stack is not going to be used anymore, allow its reuse
+            // right away.
+            releaseFiber( &generator->m_yielder_context );
+#endif
+
             Py_XDECREF( generator->m_frame );
             generator->m_frame = NULL;
 
@@ -203,6 +216,12 @@ static PyObject *Nuitka_Generator_close( Nuitka_GeneratorObject *generator, PyOb
     return INCREASE_REFCOUNT( Py_None );
 }
 
+// Free list for generator objects, try to avoid malloc overhead.
+static Nuitka_GeneratorObject *generator_cache_head = NULL;
+static const int max_generator_cache_size = 1024;
+
+Nuitka_FreeListCounts generator_free_list_counts = { 0, 0, 0 };
+
 static void Nuitka_Generator_tp_dealloc( Nuitka_GeneratorObject *generator )
 {
     assert( Py_REFCNT( generator ) == 0 );
@@ -226,7 +245,9 @@ static void Nuitka_Generator_tp_dealloc( Nuitka_GeneratorObject *generator )
     assert( Py_REFCNT( generator ) == 1 );
     Py_REFCNT( generator ) = 0;
 
+#ifndef _NUITKA_STACKLESS_GENERATORS
     releaseFiber( &generator->m_yielder_context );
+#endif
 
     // Now it is safe to release references and memory for it.
     Nuitka_GC_UnTrack( generator );
@@ -245,7 +266,17 @@ static void Nuitka_Generator_tp_dealloc( Nuitka_GeneratorObject *generator )
 
     Py_XDECREF( generator->m_frame );
 
-    PyObject_GC_Del( generator );
+    if (likely( generator_free_list_counts.size < max_generator_cache_size ))
+    {
+        generator->m_yielded = (PyObject *)generator_cache_head;
+        generator_cache_head = generator;
+        generator_free_list_counts.size += 1;
+    }
+    else
+    {
+        PyObject_GC_Del( generator );
+    }
+
     PyErr_Restore( save_exception_type, save_exception_value, save_exception_tb );
 }
 
@@ -461,7 +492,21 @@ PyTypeObject Nuitka_Generator_Type =
 
 PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup )
 {
-    Nuitka_GeneratorObject *result = PyObject_GC_New( Nuitka_GeneratorObject, &Nuitka_Generator_Type );
+    Nuitka_GeneratorObject *result = generator_cache_head;
+
+    if ( result != NULL )
+    {
+        generator_cache_head = (Nuitka_GeneratorObject *)generator_cache_head->m_yielded;
+        generator_free_list_counts.size -= 1;
+        generator_free_list_counts.reused += 1;
+
+        PyObject_INIT( result, &Nuitka_Generator_Type );
+    }
+    else
+    {
+        result = PyObject_GC_New( Nuitka_GeneratorObject, &Nuitka_Generator_Type );
+        generator_free_list_counts.allocated += 1;
+    }
 
     if (unlikely( result == NULL ))
     {
@@ -495,7 +540,11 @@ PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject
     result->m_frame = NULL;
     result->m_code_object = code_object;
 
+#ifdef _NUITKA_STACKLESS_GENERATORS
+    result->m_resume_point = 0;
+#else
     initFiber( &result->m_yielder_context );
+#endif
 
     Nuitka_GC_Track( result );
     return (PyObject *)result;
@@ -0,0 +1,292 @@
+//     Copyright 2014, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// Allocation of the stacks used by compiled generators on non-Windows
+// targets, where the fibers are implemented by us.
+
+// The stacks are mapped memory with a guard page below them, so that an
+// overflow faults instead of corrupting other memory. The fault is then
+// reported as a stack overflow of a compiled generator. Released stacks are
+// kept in a bounded pool for reuse, as generators are often created in loops.
+
+#include "nuitka/prelude.hpp"
+
+#include <sys/mman.h>
+#include <signal.h>
+#include <unistd.h>
+
+#ifndef MAP_ANONYMOUS
+#define MAP_ANONYMOUS MAP_ANON
+#endif
+
+#ifndef MAP_NORESERVE
+#define MAP_NORESERVE 0
+#endif
+
+#ifndef MAP_STACK
+#define MAP_STACK 0
+#endif
+
+// Kept at the top of each stack, linking all stacks, so the fault handler
+// can tell if a fault address is in one of their guard pages.
+struct Nuitka_FiberStack
+{
+    Nuitka_FiberStack *m_prev;
+    Nuitka_FiberStack *m_next;
+
+    // Link in the pool of stacks available for reuse.
+    Nuitka_FiberStack *m_pool_next;
+
+    // The start of the mapping, which is the guard page.
+    char *m_mapping;
+
+    // If the guard page was established.
+    bool m_guarded;
+};
+
+static Nuitka_FiberStack *all_stacks = NULL;
+
+static Nuitka_FiberStack *pooled_stacks = NULL;
+static int pooled_stacks_count = 0;
+static const int max_pooled_stacks_count = 64;
+
+// Each guard page costs a memory mapping of its own, of which processes get
+// only a limited number, typically 65530 on Linux. Beyond this many guarded
+// stacks, the stacks are allocated without, and then get merged into few
+// mappings by the kernel.
+static int guarded_stacks_count = 0;
+static const int max_guarded_stacks_count = 16384;
+
+static size_t page_size = 0;
+static size_t stack_size = 0;
+
+static struct sigaction previous_segv_action;
+static struct sigaction previous_bus_action;
+
+static void handleFiberStackFault( int signal_number, siginfo_t *info, void *context )
+{
+    char *address = (char *)info->si_addr;
+
+    for ( Nuitka_FiberStack *current = all_stacks; current != NULL; current = current->m_next )
+    {
+        if ( current->m_guarded && address >= current->m_mapping && address < current->m_mapping + page_size )
+        {
+            static char const message[] =
+                "Fatal error: Stack overflow in compiled generator, the "
+                "\"NUITKA_GENERATOR_STACK_SIZE\" environment variable can "
+                "give a larger size in KB.\n";
+
+            ssize_t res = write( 2, message, sizeof( message ) - 1 );
+            (void)res;
+
+            abort();
+        }
+    }
+
+    // Not a fault of ours, restore the previous handling, which then gets to
+    // handle the fault when it happens again after returning.
+    sigaction(
+        signal_number,
+        signal_number == SIGSEGV ? &previous_segv_action : &previous_bus_action,
+        NULL
+    );
+}
+
+// The fault handler needs an alternative stack to run on, as the one that
+// overflowed cannot be used. These are per thread.
+#ifdef __GNUC__
+static __thread bool alternative_stack_done = false;
+#else
+static bool alternative_stack_done = false;
+#endif
+
+static void prepareFaultHandling( void )
+{
+    static bool handler_done = false;
+
+    if ( !handler_done )
+    {
+        struct sigaction action;
+        memset( &action, 0, sizeof( action ) );
+
+        action.sa_sigaction = handleFiberStackFault;
+        action.sa_flags = SA_SIGINFO | SA_ONSTACK;
+        sigemptyset( &action.sa_mask );
+
+        sigaction( SIGSEGV, &action, &previous_segv_action );
+        sigaction( SIGBUS, &action, &previous_bus_action );
+
+        handler_done = true;
+    }
+
+    if ( !alternative_stack_done )
+    {
+        stack_t current;
+
+        if ( sigaltstack( NULL, &current ) == 0 && ( current.ss_flags & SS_DISABLE ) )
+        {
+            stack_t alternative;
+
+            alternative.ss_sp = malloc( SIGSTKSZ );
+            alternative.ss_size = SIGSTKSZ;
+            alternative.ss_flags = 0;
+
+            if ( alternative.ss_sp != NULL )
+            {
+                sigaltstack( &alternative, NULL );
+            }
+        }
+
+        alternative_stack_done = true;
+    }
+}
+
+static size_t getStackSize( void )
+{
+    size_t result = _NUITKA_GENERATOR_STACK_SIZE;
+
+    char const *stack_size_value = getenv( "NUITKA_GENERATOR_STACK_SIZE" );
+
+    if ( stack_size_value != NULL && atoi( stack_size_value ) > 0 )
+    {
+        result = size_t( atoi( stack_size_value ) ) * 1024;
+    }
+
+    // Whole pages only, and not less than a few.
+    result = ( result + page_size - 1 ) / page_size * page_size;
+
+    if ( result < 4 * page_size )
+    {
+        result = 4 * page_size;
+    }
+
+    return result;
+}
+
+static inline Nuitka_FiberStack *getStackHeader( char *mapping )
+{
+    return (Nuitka_FiberStack *)( mapping + page_size + stack_size - sizeof( Nuitka_FiberStack ) );
+}
+
+// Usable size of the stack, below the header, kept aligned.
+static inline size_t getUsableStackSize( void )
+{
+    return ( stack_size - sizeof( Nuitka_FiberStack ) ) & ~size_t( 15 );
+}
+
+void *allocateFiberStack( size_t *size )
+{
+    if ( stack_size == 0 )
+    {
+        page_size = size_t( sysconf( _SC_PAGESIZE ) );
+        stack_size = getStackSize();
+    }
+
+    prepareFaultHandling();
+
+    *size = getUsableStackSize();
+
+    Nuitka_FiberStack *stack = pooled_stacks;
+
+    if ( stack != NULL )
+    {
+        pooled_stacks = stack->m_pool_next;
+        pooled_stacks_count -= 1;
+
+        return stack->m_mapping + page_size;
+    }
+
+    char *mapping = (char *)mmap(
+        NULL,
+        page_size + stack_size,
+        PROT_READ | PROT_WRITE,
+        MAP_PRIVATE | MAP_ANONYMOUS | MAP_NORESERVE | MAP_STACK,
+        -1,
+        0
+    );
+
+    if (unlikely( mapping == MAP_FAILED ))
+    {
+        fputs( "Fatal error: Cannot allocate stack for compiled generator.\n", stderr );
+        abort();
+    }
+
+    stack = getStackHeader( mapping );
+
+    stack->m_mapping = mapping;
+
+    stack->m_guarded =
+        guarded_stacks_count < max_guarded_stacks_count &&
+        mprotect( mapping, page_size, PROT_NONE ) == 0;
+
+    if ( stack->m_guarded )
+    {
+        guarded_stacks_count += 1;
+    }
+    stack->m_pool_next = NULL;
+
+    stack->m_prev = NULL;
+    stack->m_next = all_stacks;
+
+    if ( all_stacks != NULL )
+    {
+        all_stacks->m_prev = stack;
+    }
+
+    all_stacks = stack;
+
+    return mapping + page_size;
+}
+
+void releaseFiberStack( void *start )
+{
+    char *mapping = (char *)start - page_size;
+    Nuitka_FiberStack *stack = getStackHeader( mapping );
+
+    assert( stack->m_mapping == mapping );
+
+    // Only guarded stacks are pooled, the others are a fallback.
+    if ( stack->m_guarded && pooled_stacks_count < max_pooled_stacks_count )
+    {
+        stack->m_pool_next = pooled_stacks;
+        pooled_stacks = stack;
+        pooled_stacks_count += 1;
+
+        return;
+    }
+
+    if ( stack->m_prev != NULL )
+    {
+        stack->m_prev->m_next = stack->m_next;
+    }
+    else
+    {
+        all_stacks = stack->m_next;
+    }
+
+    if ( stack->m_next != NULL )
+    {
+        stack->m_next->m_prev = stack->m_prev;
+    }
+
+    if ( stack->m_guarded )
+    {
+        guarded_stacks_count -= 1;
+    }
+
+    munmap( mapping, page_size + stack_size );
+}
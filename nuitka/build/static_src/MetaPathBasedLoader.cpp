@@ -44,6 +44,37 @@ static
 PyObject *metapath_based_loader = NULL;
 
 static Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
+static Py_ssize_t loader_entries_count = 0;
+
+// The table is sorted by module name at compile time, so a binary search
+// can be used, most lookups are for modules we will deny.
+static struct Nuitka_MetaPathBasedLoaderEntry *findEntry( char const *name )
+{
+    Py_ssize_t low = 0;
+    Py_ssize_t high = loader_entries_count;
+
+    while ( low < high )
+    {
+        Py_ssize_t middle = ( low + high ) / 2;
+
+        int res = strcmp( name, loader_entries[ middle ].name );
+
+        if ( res == 0 )
+        {
+            return &loader_entries[ middle ];
+        }
+        else if ( res < 0 )
+        {
+            high = middle;
+        }
+        else
+        {
+            low = middle + 1;
+        }
+    }
+
+    return NULL;
+}
 
 static char *_kwlist[] = {
     (char *)"fullname",
@@ -51,6 +82,139 @@ static char *_kwlist[] = {
     NULL
 };
 
+#if PYTHON_VERSION < 330
+// For Python3.3 the frozen modules importer comes before us, so frozen modules
+// are never asked for.
+#define _NUITKA_FIND_FROZEN_MODULES 1
+
+static Py_ssize_t getFrozenModulesCount( void )
+{
+    static Py_ssize_t frozen_count = -1;
+
+    if ( frozen_count == -1 )
+    {
+        frozen_count = 0;
+
+        while ( PyImport_FrozenModules[ frozen_count ].name != NULL )
+        {
+            frozen_count++;
+        }
+    }
+
+    return frozen_count;
+}
+
+// Our own frozen modules come last in the table and are sorted by name, so
+// a binary search can be used. CPython searches the table linearly, once to
+// find a module and again to load it, so we take responsibility for them.
+static struct _frozen *findOwnFrozenModule( char const *name )
+{
+    Py_ssize_t low = getFrozenModulesCount() - _NUITKA_FROZEN;
+    Py_ssize_t high = getFrozenModulesCount();
+
+    while ( low < high )
+    {
+        Py_ssize_t middle = ( low + high ) / 2;
+
+        int res = strcmp( name, PyImport_FrozenModules[ middle ].name );
+
+        if ( res == 0 )
+        {
+            return &PyImport_FrozenModules[ middle ];
+        }
+        else if ( res < 0 )
+        {
+            high = middle;
+        }
+        else
+        {
+            low = middle + 1;
+        }
+    }
+
+    return NULL;
+}
+
+// The few frozen modules pre-existing in CPython before ours are not sorted.
+// To trace their unmarshalling too, we take responsibility for them and let
+// CPython do the work inside the trace events, but only if the trace is
+// active.
+static char const *findPreExistingFrozenModuleName( char const *name )
+{
+    Py_ssize_t count = getFrozenModulesCount() - _NUITKA_FROZEN;
+
+    for ( Py_ssize_t i = 0; i < count; i++ )
+    {
+        if ( strcmp( name, PyImport_FrozenModules[ i ].name ) == 0 )
+        {
+            return PyImport_FrozenModules[ i ].name;
+        }
+    }
+
+    return NULL;
+}
+
+// This does what "PyImport_ImportFrozenModule" does, for the entry found
+// already.
+static PyObject *loadOwnFrozenModule( struct _frozen *entry )
+{
+    int size = entry->size;
+    bool is_package = size < 0;
+
+    if ( is_package )
+    {
+        size = -size;
+    }
+
+    if ( Py_VerboseFlag )
+    {
+        PySys_WriteStderr( "import %s # frozen%s\n", entry->name, is_package ? " package" : "" );
+    }
+
+    PyObject *code_object = PyMarshal_ReadObjectFromString( (char *)entry->code, size );
+
+    if (unlikely( code_object == NULL ))
+    {
+        return NULL;
+    }
+
+    if (unlikely( !PyCode_Check( code_object ) ))
+    {
+        Py_DECREF( code_object );
+
+        PyErr_Format( PyExc_TypeError, "frozen object %s is not a code object", entry->name );
+        return NULL;
+    }
+
+    if ( is_package )
+    {
+        // Borrowed reference.
+        PyObject *module = PyImport_AddModule( entry->name );
+
+        if (unlikely( module == NULL ))
+        {
+            Py_DECREF( code_object );
+            return NULL;
+        }
+
+        PyObject *path = Py_BuildValue( "[s]", entry->name );
+
+        if (unlikely( path == NULL || PyModule_AddObject( module, "__path__", path ) != 0 ))
+        {
+            Py_XDECREF( path );
+            Py_DECREF( code_object );
+            return NULL;
+        }
+    }
+
+    PyObject *result = PyImport_ExecCodeModuleEx( entry->name, code_object, (char *)"<frozen>" );
+
+    Py_DECREF( code_object );
+
+    return result;
+}
+#endif
+
 static PyObject *_path_unfreezer_find_module( PyObject *self, PyObject *args, PyObject *kwds )
 {
     PyObject *module_name;
@@ -77,21 +241,26 @@ static PyObject *_path_unfreezer_find_module( PyObject *self, PyObject *args, Py
         PySys_WriteStderr( "import %s # considering responsibility\n", name );
     }
 
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-
-    while ( current->name != NULL )
+    if ( findEntry( name ) != NULL )
     {
-        if ( strcmp( name, current->name ) == 0 )
+        if ( Py_VerboseFlag )
         {
-            if ( Py_VerboseFlag )
-            {
-                PySys_WriteStderr( "import %s # claimed responsibility\n", name );
-            }
-            return INCREASE_REFCOUNT( metapath_based_loader );
+            PySys_WriteStderr( "import %s # claimed responsibility\n", name );
         }
+        return INCREASE_REFCOUNT( metapath_based_loader );
+    }
 
-        current++;
+#ifdef _NUITKA_FIND_FROZEN_MODULES
+    if ( findOwnFrozenModule( name ) != NULL ||
+         ( NUITKA_STARTUP_TRACE_ACTIVE() && findPreExistingFrozenModuleName( name ) != NULL ) )
+    {
+        if ( Py_VerboseFlag )
+        {
+            PySys_WriteStderr( "import %s # claimed responsibility for frozen module\n", name );
+        }
+        return INCREASE_REFCOUNT( metapath_based_loader );
     }
+#endif
 
     if ( Py_VerboseFlag )
     {
@@ -283,78 +452,117 @@ static PyObject *_path_unfreezer_load_module( PyObject *self, PyObject *args, Py
 
     char *name = Nuitka_String_AsString( module_name );
 
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
+    struct Nuitka_MetaPathBasedLoaderEntry *current = findEntry( name );
 
-    while ( current->name != NULL )
+    if ( current != NULL )
     {
-        if ( strcmp( name, current->name ) == 0 )
+        if ( Py_VerboseFlag )
         {
-            if ( Py_VerboseFlag )
-            {
-                PySys_WriteStderr( "Loading %s\n", name );
-            }
+            PySys_WriteStderr( "Loading %s\n", name );
+        }
 
 #ifdef _NUITKA_STANDALONE
-            if ( ( current->flags & NUITKA_SHLIB_MODULE ) != 0 )
-            {
-                char filename[4096];
+        if ( ( current->flags & NUITKA_SHLIB_MODULE ) != 0 )
+        {
+            char filename[4096];
 
-                strcpy( filename, getBinaryDirectory() );
-                char *d = filename;
-                d += strlen( filename );
-                assert(*d == 0);
-                *d++ = SEP;
+            strcpy( filename, getBinaryDirectory() );
+            char *d = filename;
+            d += strlen( filename );
+            assert(*d == 0);
+            *d++ = SEP;
 
-                char *s = current->name;
+            char *s = current->name;
 
-                while( *s )
+            while( *s )
+            {
+                if ( *s == '.' )
+                {
+                    *d++ = SEP;
+                    s++;
+                }
+                else
                 {
-                    if ( *s == '.' )
-                    {
-                        *d++ = SEP;
-                        s++;
-                    }
-                    else
-                    {
-                        *d++ = *s++;
-                    }
+                    *d++ = *s++;
                 }
-                *d = 0;
+            }
+            *d = 0;
 
 #ifdef _WIN32
-                strcat( filename, ".pyd" );
+            strcat( filename, ".pyd" );
 #else
-                strcat( filename, ".so" );
+            strcat( filename, ".so" );
 #endif
 
-                callIntoShlibModule(
-                    current->name,
-                    filename
-                );
-            }
-            else
+            NUITKA_STARTUP_TRACE_BEGIN( "shlib", current->name );
+
+            callIntoShlibModule(
+                current->name,
+                filename
+            );
+
+            NUITKA_STARTUP_TRACE_END( "shlib", current->name );
+        }
+        else
 #endif
-            {
-                assert( ( current->flags & NUITKA_SHLIB_MODULE ) == 0 );
-                current->python_initfunc();
-            }
+        {
+            assert( ( current->flags & NUITKA_SHLIB_MODULE ) == 0 );
+            current->python_initfunc();
+        }
 
-            if (unlikely( ERROR_OCCURED() ))
-            {
-                return NULL;
-            }
+        if (unlikely( ERROR_OCCURED() ))
+        {
+            return NULL;
+        }
 
-            if ( Py_VerboseFlag )
-            {
-                PySys_WriteStderr( "Loaded %s\n", name );
-            }
+        if ( Py_VerboseFlag )
+        {
+            PySys_WriteStderr( "Loaded %s\n", name );
+        }
+
+        return LOOKUP_SUBSCRIPT( PyImport_GetModuleDict(), module_name );
+    }
+
+#ifdef _NUITKA_FIND_FROZEN_MODULES
+    struct _frozen *frozen_entry = findOwnFrozenModule( name );
+
+    if ( frozen_entry != NULL )
+    {
+        NUITKA_STARTUP_TRACE_BEGIN( "frozen", frozen_entry->name );
+
+        PyObject *module = loadOwnFrozenModule( frozen_entry );
+
+        NUITKA_STARTUP_TRACE_END( "frozen", frozen_entry->name );
+
+        if (unlikely( module == NULL ))
+        {
+            return NULL;
+        }
 
-            return LOOKUP_SUBSCRIPT( PyImport_GetModuleDict(), module_name );
-       }
+        Py_DECREF( module );
 
-       current++;
+        return LOOKUP_SUBSCRIPT( PyImport_GetModuleDict(), module_name );
     }
 
+    char const *frozen_name = findPreExistingFrozenModuleName( name );
+
+    if ( frozen_name != NULL )
+    {
+        NUITKA_STARTUP_TRACE_BEGIN( "frozen", frozen_name );
+
+        int res = PyImport_ImportFrozenModule( (char *)frozen_name );
+
+        NUITKA_STARTUP_TRACE_END( "frozen", frozen_name );
+
+        if (unlikely( res == -1 ))
+        {
+            return NULL;
+        }
+
+        return LOOKUP_SUBSCRIPT( PyImport_GetModuleDict(), module_name );
+    }
+#endif
+
     assert( false );
 
     return INCREASE_REFCOUNT( Py_None );
@@ -389,6 +597,18 @@ void registerMetaPathBasedUnfreezer( struct Nuitka_MetaPathBasedLoaderEntry *_lo
 
     loader_entries = _loader_entries;
 
+    while ( loader_entries[ loader_entries_count ].name != NULL )
+    {
+#ifndef __NUITKA_NO_ASSERT__
+        if ( loader_entries_count > 0 )
+        {
+            assert( strcmp( loader_entries[ loader_entries_count - 1 ].name, loader_entries[ loader_entries_count ].name ) < 0 );
+        }
+#endif
+
+        loader_entries_count++;
+    }
+
     // Build the dictionary of the "loader" object, which needs to have two
     // methods "find_module" where we acknowledge that we are capable of loading
     // the module, and "load_module" that does the actual thing.
@@ -0,0 +1,206 @@
+//     Copyright 2014, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// Implementation of the startup timeline, see "nuitka/startup_trace.hpp" for
+// how it is used.
+
+#include "nuitka/prelude.hpp"
+
+#ifdef _NUITKA_STARTUP_TRACE
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <time.h>
+#include <sys/time.h>
+#include <unistd.h>
+#endif
+
+struct Nuitka_StartupTraceEvent
+{
+    char const *category;
+    char const *name;
+    char phase;
+
+    // Microseconds since the first event.
+    double timestamp;
+};
+
+// Zero for not yet checked, negative for disabled, positive for active.
+static int trace_state = 0;
+static char const *trace_filename = NULL;
+
+static struct Nuitka_StartupTraceEvent *trace_events = NULL;
+static size_t trace_event_count = 0;
+static size_t trace_event_allocated = 0;
+
+#ifdef _WIN32
+static LARGE_INTEGER trace_frequency;
+static LARGE_INTEGER trace_start;
+#else
+static double trace_start;
+#endif
+
+static double getTraceTimestamp( void )
+{
+#ifdef _WIN32
+    LARGE_INTEGER now;
+    QueryPerformanceCounter( &now );
+
+    return double( now.QuadPart - trace_start.QuadPart ) * 1e6 / double( trace_frequency.QuadPart );
+#else
+    double now;
+
+#if defined( CLOCK_MONOTONIC )
+    struct timespec ts;
+    clock_gettime( CLOCK_MONOTONIC, &ts );
+
+    now = double( ts.tv_sec ) * 1e6 + double( ts.tv_nsec ) / 1e3;
+#else
+    struct timeval tv;
+    gettimeofday( &tv, NULL );
+
+    now = double( tv.tv_sec ) * 1e6 + double( tv.tv_usec );
+#endif
+
+    if ( trace_state == 0 )
+    {
+        trace_start = now;
+    }
+
+    return now - trace_start;
+#endif
+}
+
+static void writeTraceString( FILE *output, char const *value )
+{
+    fputc( '"', output );
+
+    while ( *value )
+    {
+        if ( *value == '"' || *value == '\\' )
+        {
+            fputc( '\\', output );
+        }
+
+        fputc( *value++, output );
+    }
+
+    fputc( '"', output );
+}
+
+static void writeStartupTrace( void )
+{
+    FILE *output = fopen( trace_filename, "w" );
+
+    if ( output == NULL )
+    {
+        fprintf( stderr, "Nuitka: Cannot write startup trace to '%s'.\n", trace_filename );
+        return;
+    }
+
+#ifdef _WIN32
+    unsigned long pid = GetCurrentProcessId();
+#else
+    unsigned long pid = (unsigned long)getpid();
+#endif
+
+    fputs( "{\"traceEvents\": [\n", output );
+
+    for ( size_t i = 0; i < trace_event_count; i++ )
+    {
+        struct Nuitka_StartupTraceEvent *event = &trace_events[ i ];
+
+        fputs( "{\"cat\": ", output );
+        writeTraceString( output, event->category );
+        fputs( ", \"name\": ", output );
+        writeTraceString( output, event->name );
+        fprintf(
+            output,
+            ", \"ph\": \"%c\", \"ts\": %.3f, \"pid\": %lu, \"tid\": 0}%s\n",
+            event->phase,
+            event->timestamp,
+            pid,
+            i + 1 < trace_event_count ? "," : ""
+        );
+    }
+
+    fputs( "],\n\"displayTimeUnit\": \"ms\"}\n", output );
+
+    fclose( output );
+}
+
+bool isStartupTraceActive( void )
+{
+    if ( trace_state == 0 )
+    {
+        trace_filename = getenv( "NUITKA_STARTUP_TRACE" );
+
+        if ( trace_filename == NULL || *trace_filename == 0 )
+        {
+            trace_state = -1;
+            return false;
+        }
+
+#ifdef _WIN32
+        QueryPerformanceFrequency( &trace_frequency );
+        QueryPerformanceCounter( &trace_start );
+#endif
+        // Establishes the start of the timeline.
+        getTraceTimestamp();
+
+        // Written only at exit, so the recording itself stays cheap.
+        atexit( writeStartupTrace );
+
+        trace_state = 1;
+    }
+
+    return trace_state > 0;
+}
+
+void traceStartupEvent( char const *category, char const *name, char phase )
+{
+    if ( !isStartupTraceActive() )
+    {
+        return;
+    }
+
+    if ( trace_event_count == trace_event_allocated )
+    {
+        trace_event_allocated = trace_event_allocated ? trace_event_allocated * 2 : 256;
+
+        trace_events = (struct Nuitka_StartupTraceEvent *)realloc(
+            trace_events,
+            trace_event_allocated * sizeof( struct Nuitka_StartupTraceEvent )
+        );
+
+        if (unlikely( trace_events == NULL ))
+        {
+            trace_state = -1;
+            return;
+        }
+    }
+
+    struct Nuitka_StartupTraceEvent *event = &trace_events[ trace_event_count++ ];
+
+    event->category = category;
+    event->name = name;
+    event->phase = phase;
+    event->timestamp = getTraceTimestamp();
+}
+
+#endif
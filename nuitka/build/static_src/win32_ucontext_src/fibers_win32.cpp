@@ -19,8 +19,6 @@
 
 #include "nuitka/prelude.hpp"
 
-#define STACK_SIZE (1024*1024)
-
 void initFiber( Fiber *to )
 {
     // Need to call this at least once per thread, so we have a main FIBER.
@@ -35,7 +33,7 @@ void prepareFiber( Fiber *to, void *code, unsigned long arg )
     assert( to );
     assert( code );
 
-    to->fiber = CreateFiber( STACK_SIZE, (LPFIBER_START_ROUTINE)code, (LPVOID)arg );
+    to->fiber = CreateFiber( _NUITKA_GENERATOR_STACK_SIZE, (LPFIBER_START_ROUTINE)code, (LPVOID)arg );
 }
 
 void releaseFiber( Fiber *to )
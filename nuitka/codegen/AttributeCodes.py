@@ -20,6 +20,8 @@
 Attribute lookup, setting.
 """
 
+from nuitka import Utils
+
 from .ErrorCodes import (
     getErrorExitCode,
     getErrorExitBoolCode,
@@ -72,7 +74,26 @@ def getAttributeLookupCode(to_name, source_name, attribute_name, emit, context):
                 source_name
             )
         )
+    elif Utils.python_version < 330:
+        cache_name = context.allocateLabel("attribute_cache")
+
+        emit(
+            "static Nuitka_AttributeCache %s;" % cache_name
+        )
+
+        emit(
+            "%s = LOOKUP_ATTRIBUTE_CACHED( %s, %s, &%s );" % (
+                to_name,
+                source_name,
+                getConstantCode(
+                    context  = context,
+                    constant = attribute_name
+                ),
+                cache_name
+            )
+        )
     else:
+        # The split dictionaries of Python 3.3 are not cached.
         emit(
             "%s = LOOKUP_ATTRIBUTE( %s, %s );" % (
                 to_name,
@@ -100,6 +121,51 @@ def getAttributeLookupCode(to_name, source_name, attribute_name, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def getMethodLookupCode(to_name, self_name, source_name, attribute_name, emit,
+                        context):
+    # Only used where the attribute caches are available.
+    assert Utils.python_version < 330
+
+    # The source is released only after the call, it may be passed as self
+    # without a reference of its own.
+    if not context.needsCleanup(source_name):
+        emit("Py_INCREF( %s );" % source_name)
+
+        context.addCleanupTempName(source_name)
+
+    cache_name = context.allocateLabel("attribute_cache")
+
+    emit(
+        "static Nuitka_AttributeCache %s;" % cache_name
+    )
+
+    emit(
+        "%s = NULL;" % self_name
+    )
+
+    emit(
+        "%s = LOOKUP_METHOD_CACHED( %s, %s, &%s, &%s );" % (
+            to_name,
+            source_name,
+            getConstantCode(
+                context  = context,
+                constant = attribute_name
+            ),
+            cache_name,
+            self_name
+        )
+    )
+
+    getErrorExitCode(
+        check_name      = to_name,
+        quick_exception = None,
+        emit            = emit,
+        context         = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def getAttributeCheckBoolCode(source_name, attr_name, emit, context):
     res_name = context.getIntResName()
 
@@ -131,14 +197,32 @@ def getAttributeAssignmentCode(target_name, attribute_name, value_name, emit,
                                context):
     res_name = context.getBoolResName()
 
-    emit(
-        "%s = SET_ATTRIBUTE( %s, %s, %s );" % (
-            res_name,
-            target_name,
-            attribute_name,
-            value_name
+    if Utils.python_version < 330:
+        cache_name = context.allocateLabel("attribute_cache")
+
+        emit(
+            "static Nuitka_AttributeCache %s;" % cache_name
+        )
+
+        emit(
+            "%s = SET_ATTRIBUTE_CACHED( %s, %s, %s, &%s );" % (
+                res_name,
+                target_name,
+                attribute_name,
+                value_name,
+                cache_name
+            )
+        )
+    else:
+        # The split dictionaries of Python 3.3 are not cached.
+        emit(
+            "%s = SET_ATTRIBUTE( %s, %s, %s );" % (
+                res_name,
+                target_name,
+                attribute_name,
+                value_name
+            )
         )
-    )
 
     getErrorExitBoolCode(
         condition       = "%s == false" % res_name,
@@ -89,6 +89,54 @@ def getCallCodePosArgsQuickC(to_name, called_name, arg_names, emit, context):
     context.addCleanupTempName(to_name)
 
 
+# Method calls with that many arguments, the quick call with one more is then
+# needed too.
+quick_method_calls_used = set()
+
+def getCallCodeMethodArgsC(to_name, called_name, self_name, source_name,
+                           arg_names, emit, context):
+    arg_size = len(arg_names)
+
+    if arg_size == 0:
+        emit(
+            "%s = CALL_METHOD_NO_ARGS( %s, %s );" % (
+                to_name,
+                called_name,
+                self_name
+            )
+        )
+    else:
+        quick_method_calls_used.add(arg_size)
+        quick_calls_used.add(arg_size)
+        quick_calls_used.add(arg_size + 1)
+
+        emit(
+            "%s = CALL_METHOD_WITH_ARGS%d( %s, %s, %s );" % (
+                to_name,
+                arg_size,
+                called_name,
+                self_name,
+                ", ".join(arg_names)
+            )
+        )
+
+    # The source object was kept alive for the call, as the method self may
+    # be borrowed from it.
+    getReleaseCodes(
+        release_names = [called_name, source_name] + arg_names,
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def getCallCodePosArgsC(to_name, called_name, args_name, emit, context):
 
     emit(
@@ -182,6 +230,23 @@ def getCallsDecls():
             }
         )
 
+    result.append(
+        CodeTemplates.template_call_method_no_args_decl % {}
+    )
+
+    for quick_method_call_used in sorted(quick_method_calls_used):
+        args_decl = [
+            "PyObject *arg%d" % d
+            for d in range(quick_method_call_used)
+        ]
+
+        result.append(
+            CodeTemplates.template_call_method_with_args_decl % {
+                "args_decl"  : ", ".join(args_decl),
+                "args_count" : quick_method_call_used
+            }
+        )
+
     return CodeTemplates.template_header_guard % {
         "header_guard_name" : "__NUITKA_CALLS_H__",
         "header_body"       : "\n".join(result)
@@ -217,6 +282,29 @@ def getCallsCode():
             }
         )
 
+    result.append(
+        CodeTemplates.template_call_method_no_args_impl % {}
+    )
+
+    for quick_method_call_used in sorted(quick_method_calls_used):
+        args_decl = [
+            "PyObject *arg%d" % d
+            for d in range(1, quick_method_call_used + 1)
+        ]
+        args_list = [
+            "arg%d" % d
+            for d in range(1, quick_method_call_used + 1)
+        ]
+
+        result.append(
+            CodeTemplates.template_call_method_with_args_impl % {
+                "args_decl"       : ", ".join(args_decl),
+                "args_list"       : ", ".join(args_list),
+                "args_count"      : quick_method_call_used,
+                "self_args_count" : quick_method_call_used + 1
+            }
+        )
+
     return "\n".join(result)
 
 
@@ -40,7 +40,7 @@ from nuitka import (
     Utils
 )
 
-from nuitka.__past__ import iterItems
+from nuitka.__past__ import iterItems, unicode
 
 def generateTupleCreationCode(to_name, elements, emit, context):
     if _areConstants(elements):
@@ -866,7 +866,106 @@ def generateSliceLookupCode(to_name, expression, emit, context):
             )
 
 
+def _isMethodCall(call_node):
+    # The method lookup uses the attribute caches, not available for the split
+    # dictionaries of Python 3.3 or higher.
+    if Utils.python_version >= 330:
+        return False
+
+    called = call_node.getCalled()
+
+    if not called.isExpressionAttributeLookup() or \
+       called.getAttributeName() in ("__dict__", "__class__"):
+        return False
+
+    call_kw = call_node.getCallKw()
+
+    if not call_kw.isExpressionConstantRef() or call_kw.getConstant() != {}:
+        return False
+
+    call_args = call_node.getCallArgs()
+
+    return call_args.isExpressionMakeTuple() or \
+           call_args.isExpressionConstantRef()
+
+
+def generateMethodCallCode(to_name, call_node, emit, context):
+    called = call_node.getCalled()
+
+    source_name = context.allocateTempName("source_name")
+
+    generateExpressionCode(
+        to_name    = source_name,
+        expression = called.getLookupSource(),
+        emit       = emit,
+        context    = context
+    )
+
+    called_name = context.allocateTempName("called")
+    self_name = context.allocateTempName("method_self")
+
+    # The lookup is done before the arguments are evaluated, as it would be
+    # for the bound method.
+    Generator.getMethodLookupCode(
+        to_name        = called_name,
+        self_name      = self_name,
+        source_name    = source_name,
+        attribute_name = called.getAttributeName(),
+        emit           = emit,
+        context        = context
+    )
+
+    call_args = call_node.getCallArgs()
+    call_arg_names = []
+
+    if call_args.isExpressionMakeTuple():
+        for call_arg_element in call_args.getElements():
+            call_arg_name = context.allocateTempName("call_arg_element")
+
+            generateExpressionCode(
+                to_name    = call_arg_name,
+                expression = call_arg_element,
+                emit       = emit,
+                context    = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+    else:
+        call_args_value = call_args.getConstant()
+        assert type(call_args_value) is tuple
+
+        for call_arg_element in call_args_value:
+            call_arg_name = context.allocateTempName("call_arg_element")
+
+            Generator.getConstantAccessC(
+                to_name    = call_arg_name,
+                constant   = call_arg_element,
+                emit       = emit,
+                context    = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    Generator.getCallCodeMethodArgsC(
+        to_name     = to_name,
+        called_name = called_name,
+        self_name   = self_name,
+        source_name = source_name,
+        arg_names   = call_arg_names,
+        emit        = emit,
+        context     = context
+    )
+
+
 def generateCallCode(to_name, call_node, emit, context):
+    if _isMethodCall(call_node):
+        return generateMethodCallCode(
+            to_name   = to_name,
+            call_node = call_node,
+            emit      = emit,
+            context   = context
+        )
+
     called_name = context.allocateTempName("called")
 
     generateExpressionCode(
@@ -1185,6 +1284,21 @@ def _generateExpressionCode(to_name, expression, emit, context, allow_none):
             emit      = emit,
             context   = context
         )
+    elif expression.isExpressionCallComplex():
+        generateCAPIObjectCode(
+            to_name   = to_name,
+            capi      = "CALL_FUNCTION_COMPLEX",
+            arg_desc  = (
+                ("complex_call_called", expression.getCalled()),
+                ("complex_call_pos", expression.getCallArgs()),
+                ("complex_call_kw", expression.getCallKw()),
+                ("complex_call_star_list", expression.getStarListArg()),
+                ("complex_call_star_dict", expression.getStarDictArg()),
+            ),
+            emit      = emit,
+            none_null = True,
+            context   = context
+        )
     elif expression.isExpressionFunctionCall():
         generateFunctionCallCode(
             to_name   = to_name,
@@ -1412,6 +1526,72 @@ def _generateExpressionCode(to_name, expression, emit, context, allow_none):
                 context   = context
             )
 
+    elif expression.isExpressionBuiltinIter1() and \
+         expression.isLoopOnly() and \
+         expression.getValue().isExpressionBuiltinRange1():
+        # Loops over ranges don't need the list. Other iterators of ranges
+        # may be seen by user code, and must be what CPython gives.
+        generateCAPIObjectCode(
+            to_name   = to_name,
+            capi      = "BUILTIN_RANGE_ITERATOR",
+            arg_desc  = (
+                ("range_arg", expression.getValue().getLow()),
+            ),
+            emit      = emit,
+            context   = context
+        )
+    elif expression.isExpressionBuiltinIter1() and \
+         expression.isLoopOnly() and \
+         expression.getValue().isExpressionBuiltinRange2():
+        generateCAPIObjectCode(
+            to_name   = to_name,
+            capi      = "BUILTIN_RANGE2_ITERATOR",
+            arg_desc  = (
+                ("range2_low", expression.getValue().getLow()),
+                ("range2_high", expression.getValue().getHigh()),
+            ),
+            emit      = emit,
+            context   = context
+        )
+    elif expression.isExpressionBuiltinIter1() and \
+         expression.isLoopOnly() and \
+         expression.getValue().isExpressionBuiltinRange3():
+        generateCAPIObjectCode(
+            to_name   = to_name,
+            capi      = "BUILTIN_RANGE3_ITERATOR",
+            arg_desc  = (
+                ("range3_low", expression.getValue().getLow()),
+                ("range3_high", expression.getValue().getHigh()),
+                ("range3_step", expression.getValue().getStep()),
+            ),
+            emit      = emit,
+            context   = context
+        )
+    elif expression.isExpressionBuiltinIter1() and \
+         expression.isLoopOnly() and \
+         expression.getValue().isExpressionBuiltinXrange():
+        generateCAPIObjectCode(
+            to_name   = to_name,
+            capi      = "BUILTIN_XRANGE_ITERATOR",
+            arg_desc  = (
+                ("xrange_low", expression.getValue().getLow()),
+                ("xrange_high", expression.getValue().getHigh()),
+                ("xrange_step", expression.getValue().getStep()),
+            ),
+            emit      = emit,
+            none_null = True,
+            context   = context
+        )
+    elif expression.isExpressionSpecialUnpackIter1():
+        generateCAPIObjectCode(
+            to_name  = to_name,
+            capi     = "MAKE_UNPACK_ITERATOR",
+            arg_desc = (
+                ( "iter_arg", expression.getValue() ),
+            ),
+            emit     = emit,
+            context  = context
+        )
     elif expression.isExpressionBuiltinIter1():
         generateCAPIObjectCode(
             to_name  = to_name,
@@ -2038,6 +2218,17 @@ def _generateExpressionCode(to_name, expression, emit, context, allow_none):
             emit     = emit,
             context  = context
         )
+    elif expression.isExpressionBuiltinFrozenset():
+        generateCAPIObjectCode(
+            to_name   = to_name,
+            capi      = "PyFrozenSet_New",
+            arg_desc  = (
+                ("frozenset_arg", expression.getValue()),
+            ),
+            emit      = emit,
+            none_null = True,
+            context   = context
+        )
     elif expression.isExpressionBuiltinType3():
         type_name = context.allocateTempName("type_name")
         bases_name = context.allocateTempName("type_bases")
@@ -2150,63 +2341,11 @@ def _generateExpressionCode(to_name, expression, emit, context, allow_none):
             context   = context
         )
     elif expression.isExpressionBuiltinCompile():
-        source_name = context.allocateTempName("compile_source")
-        filename_name = context.allocateTempName("compile_filename")
-        mode_name = context.allocateTempName("compile_mode")
-
-        makeExpressionCode(
-            to_name    = source_name,
-            expression = expression.getSourceCode()
-        )
-        makeExpressionCode(
-            to_name    = filename_name,
-            expression = expression.getFilename()
-        )
-        makeExpressionCode(
-            to_name    = mode_name,
-            expression = expression.getMode()
-        )
-
-        if expression.getFlags() is not None:
-            flags_name = context.allocateTempName("compile_flags")
-
-            makeExpressionCode(
-                to_name    = flags_name,
-                expression = expression.getFlags(),
-            )
-        else:
-            flags_name = "NULL"
-
-        if expression.getDontInherit() is not None:
-            dont_inherit_name = context.allocateTempName("compile_dont_inherit")
-
-            makeExpressionCode(
-                to_name    = dont_inherit_name,
-                expression = expression.getDontInherit()
-            )
-        else:
-            dont_inherit_name = "NULL"
-
-        if expression.getOptimize() is not None:
-            optimize_name = context.allocateTempName("compile_dont_inherit")
-
-            makeExpressionCode(
-                to_name    = optimize_name,
-                expression = expression.getOptimize()
-            )
-        else:
-            optimize_name = "NULL"
-
-        Generator.getCompileCode(
-            to_name           = to_name,
-            source_name       = source_name,
-            filename_name     = filename_name,
-            mode_name         = mode_name,
-            flags_name        = flags_name,
-            dont_inherit_name = dont_inherit_name,
-            optimize_name     = optimize_name,
-            emit              = emit,
-            context           = context
+        generateBuiltinCompileCode(
+            to_name      = to_name,
+            compile_node = expression,
+            emit         = emit,
+            context      = context
         )
     elif expression.isExpressionTryFinally():
         generateTryFinallyCode(
@@ -2580,18 +2719,73 @@ def generateDelAttributeCode(statement, emit, context):
     )
 
 
+def _getPrecompiledSourceCode(source_code, filename, mode, flags):
+    """ Get constant code object for a constant source, if possible.
+
+        This saves parsing and compiling the source code at run time, each
+        time it is executed.
+    """
+
+    if not source_code.isExpressionConstantRef():
+        return None
+
+    if type(source_code.getConstant()) not in (str, unicode):
+        return None
+
+    # The code depends on the optimize flag, e.g. for asserts. Programs set it
+    # to the one of Nuitka, but extension modules run with the one of the
+    # loading interpreter, which is not known before.
+    if Options.shallMakeModule():
+        return None
+
+    return Generator.getPrecompiledCode(
+        source_code = source_code.getConstant(),
+        filename    = filename,
+        mode        = mode,
+        flags       = flags
+    )
+
 def _generateEvalCode(to_name, node, emit, context):
-    source_name = context.allocateTempName("eval_source")
-    globals_name = context.allocateTempName("eval_globals")
-    locals_name = context.allocateTempName("eval_locals")
+    if node.isExpressionBuiltinEval() or \
+         (Utils.python_version >= 300 and node.isExpressionBuiltinExec()):
+        filename = "<string>"
+    else:
+        filename = "<execfile>"
 
-    generateExpressionCode(
-        to_name    = source_name,
-        expression = node.getSourceCode(),
-        emit       = emit,
-        context    = context
+    if node.isExpressionBuiltinEval():
+        mode = "eval"
+    else:
+        mode = "exec"
+
+    # The code inherits the future flags of the code executing it.
+    code_object = _getPrecompiledSourceCode(
+        source_code = node.getSourceCode(),
+        filename    = filename,
+        mode        = mode,
+        flags       = node.getSourceReference().getFutureSpec().\
+                        asCompilerFlags()
     )
 
+    precompiled = code_object is not None
+
+    if precompiled:
+        source_name = Generator.getConstantCode(
+            constant = code_object,
+            context  = context
+        )
+    else:
+        source_name = context.allocateTempName("eval_source")
+
+        generateExpressionCode(
+            to_name    = source_name,
+            expression = node.getSourceCode(),
+            emit       = emit,
+            context    = context
+        )
+
+    globals_name = context.allocateTempName("eval_globals")
+    locals_name = context.allocateTempName("eval_locals")
+
     generateExpressionCode(
         to_name    = globals_name,
         expression = node.getGlobals(),
@@ -2606,12 +2800,6 @@ def _generateEvalCode(to_name, node, emit, context):
         context    = context
     )
 
-    if node.isExpressionBuiltinEval() or \
-         (Utils.python_version >= 300 and node.isExpressionBuiltinExec()):
-        filename = "<string>"
-    else:
-        filename = "<execfile>"
-
     Generator.getEvalCode(
         to_name       = to_name,
         source_name   = source_name,
@@ -2622,13 +2810,58 @@ def _generateEvalCode(to_name, node, emit, context):
             context  = context
         ),
         mode_name     = Generator.getConstantCode(
-            constant = "eval" if node.isExpressionBuiltinEval() else "exec",
+            constant = mode,
             context  = context
         ),
+        precompiled   = precompiled,
         emit          = emit,
         context       = context
     )
 
+def _getPrecompiledCompileCode(compile_node):
+    """ Get constant code object for a "compile" call, if possible.
+
+        All arguments must be constants, and the result must be a code object
+        for this to work. Without "dont_inherit", the future flags of the
+        calling code are inherited.
+    """
+
+    for arg in (compile_node.getFilename(), compile_node.getMode()):
+        if not arg.isExpressionConstantRef() or not arg.isStringConstant():
+            return None
+
+    flags = compile_node.getFlags()
+
+    if flags is None:
+        flags = 0
+    elif flags.isExpressionConstantRef() and flags.isIndexConstant():
+        flags = int(flags.getConstant())
+    else:
+        return None
+
+    dont_inherit = compile_node.getDontInherit()
+
+    if dont_inherit is None:
+        dont_inherit = False
+    elif dont_inherit.isExpressionConstantRef():
+        dont_inherit = bool(dont_inherit.getConstant())
+    else:
+        return None
+
+    if compile_node.getOptimize() is not None:
+        return None
+
+    if not dont_inherit:
+        flags |= compile_node.getSourceReference().getFutureSpec().\
+          asCompilerFlags()
+
+    return _getPrecompiledSourceCode(
+        source_code = compile_node.getSourceCode(),
+        filename    = compile_node.getFilename().getConstant(),
+        mode        = compile_node.getMode().getConstant(),
+        flags       = flags
+    )
+
 def generateEvalCode(to_name, eval_node, emit, context):
     return _generateEvalCode(
         to_name = to_name,
@@ -2645,46 +2878,146 @@ def generateExecfileCode(to_name, execfile_node, emit, context):
         context = context
     )
 
-def generateExecCode(exec_def, emit, context):
-    source_name = context.allocateTempName("eval_source")
-    globals_name = context.allocateTempName("eval_globals")
-    locals_name = context.allocateTempName("eval_locals")
+def generateBuiltinCompileCode(to_name, compile_node, emit, context):
+    code_object = _getPrecompiledCompileCode(compile_node)
+
+    if code_object is not None:
+        Generator.getPrecompiledCompileCode(
+            to_name     = to_name,
+            code_object = code_object,
+            emit        = emit,
+            context     = context
+        )
+
+        return
+
+    source_name = context.allocateTempName("compile_source")
+    filename_name = context.allocateTempName("compile_filename")
+    mode_name = context.allocateTempName("compile_mode")
 
     generateExpressionCode(
         to_name    = source_name,
-        expression = exec_def.getSourceCode(),
+        expression = compile_node.getSourceCode(),
         emit       = emit,
         context    = context
     )
-
     generateExpressionCode(
-        to_name    = globals_name,
-        expression = exec_def.getGlobals(),
+        to_name    = filename_name,
+        expression = compile_node.getFilename(),
         emit       = emit,
         context    = context
     )
-
     generateExpressionCode(
-        to_name    = locals_name,
-        expression = exec_def.getLocals(),
+        to_name    = mode_name,
+        expression = compile_node.getMode(),
         emit       = emit,
         context    = context
     )
 
+    if compile_node.getFlags() is not None:
+        flags_name = context.allocateTempName("compile_flags")
+
+        generateExpressionCode(
+            to_name    = flags_name,
+            expression = compile_node.getFlags(),
+            emit       = emit,
+            context    = context
+        )
+    else:
+        flags_name = "NULL"
+
+    if compile_node.getDontInherit() is not None:
+        dont_inherit_name = context.allocateTempName("compile_dont_inherit")
+
+        generateExpressionCode(
+            to_name    = dont_inherit_name,
+            expression = compile_node.getDontInherit(),
+            emit       = emit,
+            context    = context
+        )
+    else:
+        dont_inherit_name = "NULL"
+
+    if compile_node.getOptimize() is not None:
+        optimize_name = context.allocateTempName("compile_dont_inherit")
+
+        generateExpressionCode(
+            to_name    = optimize_name,
+            expression = compile_node.getOptimize(),
+            emit       = emit,
+            context    = context
+        )
+    else:
+        optimize_name = "NULL"
+
+    Generator.getCompileCode(
+        to_name           = to_name,
+        source_name       = source_name,
+        filename_name     = filename_name,
+        mode_name         = mode_name,
+        flags_name        = flags_name,
+        dont_inherit_name = dont_inherit_name,
+        optimize_name     = optimize_name,
+        emit              = emit,
+        context           = context
+    )
+
+def generateExecCode(exec_def, emit, context):
     source_ref = exec_def.getSourceReference()
 
     # Filename with origin in improved mode.
     if Options.isFullCompat():
-        filename_name = Generator.getConstantCode(
-            constant = "<string>",
+        filename = "<string>"
+    else:
+        filename = "<string at %s>" % source_ref.getAsString()
+
+    # The code inherits the future flags of the code executing it.
+    code_object = _getPrecompiledSourceCode(
+        source_code = exec_def.getSourceCode(),
+        filename    = filename,
+        mode        = "exec",
+        flags       = source_ref.getFutureSpec().asCompilerFlags()
+    )
+
+    precompiled = code_object is not None
+
+    if precompiled:
+        source_name = Generator.getConstantCode(
+            constant = code_object,
             context  = context
         )
     else:
-        filename_name = Generator.getConstantCode(
-            constant = "<string at %s>" % source_ref.getAsString(),
-            context  = context
+        source_name = context.allocateTempName("eval_source")
+
+        generateExpressionCode(
+            to_name    = source_name,
+            expression = exec_def.getSourceCode(),
+            emit       = emit,
+            context    = context
         )
 
+    globals_name = context.allocateTempName("eval_globals")
+    locals_name = context.allocateTempName("eval_locals")
+
+    generateExpressionCode(
+        to_name    = globals_name,
+        expression = exec_def.getGlobals(),
+        emit       = emit,
+        context    = context
+    )
+
+    generateExpressionCode(
+        to_name    = locals_name,
+        expression = exec_def.getLocals(),
+        emit       = emit,
+        context    = context
+    )
+
+    filename_name = Generator.getConstantCode(
+        constant = filename,
+        context  = context
+    )
+
     provider = exec_def.getParentVariableProvider()
     store_back = provider.isExpressionFunctionBody() and \
                  provider.isUnqualifiedExec()
@@ -2696,6 +3029,7 @@ def generateExecCode(exec_def, emit, context):
         filename_name = filename_name,
         store_back    = store_back,
         provider      = provider,
+        precompiled   = precompiled,
         emit          = emit,
         context       = context,
     )
@@ -2822,6 +3156,21 @@ def generateTryExceptCode(statement, emit, context):
     old_published = context.isExceptionPublished()
     context.setExceptionPublished(statement.needsExceptionPublish())
 
+    # Locally handled exceptions get no traceback, remember the line number
+    # for creating it, in case it is re-raised.
+    old_exception_lineno = context.getExceptionLineNumberName()
+
+    if statement.isHandledLocally():
+        exception_lineno_name = context.allocateTempName(
+            "exception_lineno",
+            "int"
+        )
+        Generator.getLineNumberCode(exception_lineno_name, emit, context)
+    else:
+        exception_lineno_name = None
+
+    context.setExceptionLineNumberName(exception_lineno_name)
+
     emit("// Exception handler of try/except")
     _generateStatementSequenceCode(
         statement_sequence = handling_block,
@@ -2830,6 +3179,8 @@ def generateTryExceptCode(statement, emit, context):
         allow_none         = True
     )
 
+    context.setExceptionLineNumberName(old_exception_lineno)
+
     if handling_block is not None and handling_block.isStatementAborting():
         Generator.getExceptionUnpublishedReleaseCode(
             emit       = emit,
@@ -2837,7 +3188,9 @@ def generateTryExceptCode(statement, emit, context):
         )
 
     # TODO: May have to do this for before return, break, and continue as well.
-    if not statement.needsExceptionPublish():
+    # Locally handled ones have release statements in their handlers.
+    if not statement.needsExceptionPublish() and \
+       not statement.isHandledLocally():
         emit(
              """\
 Py_DECREF( exception_type );
@@ -3560,8 +3913,15 @@ def generateLoopCode(statement, emit, context):
     context.setLoopBreakTarget(old_loop_break)
     context.setLoopContinueTarget(old_loop_continue)
 
+    # Loops without calls do cheap iterations, and need not consider threading
+    # for each one.
+    if statement.mayCall():
+        consider_threading = "CONSIDER_THREADING()"
+    else:
+        consider_threading = "CONSIDER_THREADING_CALL_FREE()"
+
     Generator.getErrorExitBoolCode(
-        condition = "CONSIDER_THREADING() == false",
+        condition = "%s == false" % consider_threading,
         emit      = emit,
         context   = context
     )
@@ -3941,6 +4301,11 @@ def _generateStatementCode(statement, emit, context):
             emit    = emit,
             context = context
         )
+    elif statement.isStatementReleaseException():
+        Generator.getExceptionUnpublishedReleaseCode(
+            emit    = emit,
+            context = context
+        )
     elif statement.isStatementPublishException():
         context.markAsNeedsExceptionVariables()
 
@@ -4065,7 +4430,9 @@ def generateStatementSequenceCode(statement_sequence, context,
 
         needs_preserve = statement_sequence.needsFrameExceptionPreserving()
 
-        if statement_sequence.mayReturn():
+        # Frames passed through have nothing to do on return, so there is no
+        # need for an extra return target.
+        if statement_sequence.mayReturn() and guard_mode != "pass_through":
             parent_return_exit = statement_context.getReturnTarget()
 
             statement_context.setReturnTarget(
@@ -4078,12 +4445,21 @@ def generateStatementSequenceCode(statement_sequence, context,
 
     # print statement_sequence.source_ref, len(statements)
 
+    if statement_sequence.isStatementsFrame():
+        # Frames passed through continue the line of the using statement.
+        Generator.pushErrorLineNumber(
+            inherit = guard_mode == "pass_through"
+        )
+
     _generateStatementSequenceCode(
         statement_sequence = statement_sequence,
         emit               = emit,
         context            = statement_context
     )
 
+    if statement_sequence.isStatementsFrame():
+        Generator.popErrorLineNumber()
+
     # Complain if any temporary was not dealt with yet.
     assert not statement_context.getCleanupTempnames(), \
       statement_context.getCleanupTempnames()
@@ -4236,7 +4612,9 @@ def generateModuleCode(global_context, module, module_name, other_modules):
 
     metapath_loader_inittab = []
 
-    for other_module in other_modules:
+    # The loader looks up modules by name with a binary search, so the table
+    # must be sorted.
+    for other_module in sorted(other_modules, key = lambda module: module.getFullName()):
         metapath_loader_inittab.append(
             Generator.getModuleMetapathLoaderEntryCode(
                 module_name = other_module.getFullName(),
@@ -4285,6 +4663,15 @@ def generateConstantsDefinitionCode(context):
     )
 
 
+def generateSharedRuntimeConstantsCode(context, module_contexts,
+                                       runtime_contexts):
+    return Generator.getSharedRuntimeConstantsCode(
+        context          = context,
+        module_contexts  = module_contexts,
+        runtime_contexts = runtime_contexts
+    )
+
+
 def generateHelpersCode():
     header_code = Generator.getCallsDecls()
 
@@ -48,7 +48,7 @@ else:
 
         return hash_value.hexdigest()
 
-def _getCodeObjects():
+def getCodeObjects():
     return sorted(iterItems(code_objects))
 
 # Sad but true, code objects have these many details that actually are fed from
@@ -87,12 +87,15 @@ def getCodeObjectHandle( context, filename, code_name, line_number, var_names,
     return code_objects[key]
 
 
-def getCodeObjectsDeclCode(for_header):
+def getCodeObjectsDeclCode(for_header, selected = None):
     # There are many cases for constants of different types.
     # pylint: disable=R0912
     statements = []
 
-    for _code_object_key, code_identifier in _getCodeObjects():
+    if selected is None:
+        selected = getCodeObjects()
+
+    for _code_object_key, code_identifier in selected:
         declaration = "PyCodeObject *%s;" % code_identifier
 
         if for_header:
@@ -102,10 +105,13 @@ def getCodeObjectsDeclCode(for_header):
 
     return statements
 
-def getCodeObjectsInitCode(context):
+def getCodeObjectsInitCode(context, selected = None):
     statements = []
 
-    for code_object_key, code_identifier in _getCodeObjects():
+    if selected is None:
+        selected = getCodeObjects()
+
+    for code_object_key, code_identifier in selected:
         co_flags = []
 
         if code_object_key[2] != 0:
@@ -31,7 +31,9 @@ from ..__past__ import unicode, long, iterItems
 
 from ..Constants import constant_builtin_types, isMutable, compareConstants
 
-import re, struct
+import re, struct, marshal
+
+from types import CodeType
 
 stream_data = StreamData()
 
@@ -373,6 +375,17 @@ def _addConstantInitCode(context, emit, constant_type, constant_value,
 
         return
 
+    if constant_type is CodeType:
+        # Code objects cannot be pickled, but marshal is made for them.
+        emit(
+            "%s = UNSTREAM_CODE( %s );" % (
+                constant_identifier,
+                stream_data.getStreamDataCode( marshal.dumps( constant_value ) )
+            )
+        )
+
+        return
+
     if constant_value in constant_builtin_types:
         return
 
@@ -386,14 +399,17 @@ def _lengthKey(value):
 
 the_contained_constants = {}
 
-def getConstantsInitCode(context):
+def getConstantsInitCode(context, constants = None):
     # There are many cases for constants to be created in the most efficient
     # way, pylint: disable=R0912
 
     emit = SourceCodeCollector()
 
-    all_constants = the_contained_constants
-    all_constants.update(context.getConstants())
+    if constants is None:
+        all_constants = the_contained_constants
+        all_constants.update(context.getConstants())
+    else:
+        all_constants = constants
 
     for constant_value, constant_identifier in \
           sorted(all_constants.items(), key = _lengthKey):
@@ -434,48 +450,67 @@ class HashableConstant(object):
         return compareConstants(self.constant, other.constant)
 
 
-def getConstantsDeclCode(context, for_header):
-    # There are many cases for constants of different types.
-    # pylint: disable=R0912
-    statements = []
-    statements2 = []
+def _considerForDeferral(context, constant_value, contained_constants):
+    if constant_value is None:
+        return
 
-    constants = context.getConstants()
+    if constant_value is False:
+        return
 
-    contained_constants = {}
+    if constant_value is True:
+        return
 
-    def considerForDeferral(constant_value):
-        if constant_value is None:
-            return
+    if constant_value is Ellipsis:
+        return
 
-        if constant_value is False:
-            return
+    constant_type = type(constant_value)
 
-        if constant_value is True:
-            return
+    if constant_type is type:
+        return
 
-        if constant_value is Ellipsis:
-            return
+    key = HashableConstant(constant_value)
 
-        constant_type = type(constant_value)
+    if key not in contained_constants:
+        constant_identifier = getConstantCodeName(context, constant_value)
 
-        if constant_type is type:
-            return
+        contained_constants[key] = constant_identifier
+
+        if constant_type in (tuple, list, set, frozenset):
+            for element in constant_value:
+                _considerForDeferral(context, element, contained_constants)
+        elif constant_type is dict:
+            for key, value in iterItems(constant_value):
+                _considerForDeferral(context, key, contained_constants)
+                _considerForDeferral(context, value, contained_constants)
+
+
+def getConstantsClosure(context, constants):
+    """ Get the given constants plus all the ones needed to create them.
+
+    The result maps the constants to their identifiers, with the elements of
+    containers added, as these are created along with them.
+    """
 
-        key = HashableConstant(constant_value)
+    result = {}
 
-        if key not in contained_constants:
-            constant_identifier = getConstantCodeName(context, constant_value)
+    for constant_value in constants:
+        _considerForDeferral(context, constant_value.getConstant(), result)
 
-            contained_constants[key] = constant_identifier
+    return result
 
-            if constant_type in (tuple, list, set, frozenset):
-                for element in constant_value:
-                    considerForDeferral(element)
-            elif constant_type is dict:
-                for key, value in iterItems(constant_value):
-                    considerForDeferral(key)
-                    considerForDeferral(value)
+
+def getConstantsDeclCode(context, for_header):
+    # There are many cases for constants of different types.
+    # pylint: disable=R0912
+    statements = []
+    statements2 = []
+
+    constants = context.getConstants()
+
+    contained_constants = {}
+
+    def considerForDeferral(constant_value):
+        _considerForDeferral(context, constant_value, contained_constants)
 
 
     for constant_value, constant_identifier in \
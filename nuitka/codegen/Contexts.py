@@ -50,6 +50,8 @@ class TempMixin:
         self.frame_preservation_stack = []
         # For exception handlers visibility of caught exception
         self.exception_published = True
+        # For locally handled exceptions, the line number they occured at
+        self.exception_lineno_name = None
 
         # For branches
         self.true_target = None
@@ -57,6 +59,9 @@ class TempMixin:
 
         self.keeper_variable_count = 0
 
+        # For stackless generators, the points to resume at after a yield.
+        self.resume_point_count = 0
+
     def formatTempName(self, base_name, number):
         if number is None:
             return "tmp_{name}".format(
@@ -145,6 +150,12 @@ class TempMixin:
     def setExceptionPublished(self, value):
         self.exception_published = value
 
+    def getExceptionLineNumberName(self):
+        return self.exception_lineno_name
+
+    def setExceptionLineNumberName(self, name):
+        self.exception_lineno_name = name
+
     def getLoopBreakTarget(self):
         return self.loop_break
 
@@ -191,6 +202,14 @@ class TempMixin:
     def getKeeperVariableCount(self):
         return self.keeper_variable_count
 
+    def allocateResumePoint(self):
+        self.resume_point_count += 1
+
+        return self.resume_point_count
+
+    def getResumePointCount(self):
+        return self.resume_point_count
+
     def getTrueBranchTarget(self):
         return self.true_target
 
@@ -299,6 +318,9 @@ def _getConstantDefaultPopulation():
         "__all__",
         "__cmp__",
 
+        # Star dict arguments that are mappings, used in complex calls.
+        "keys",
+
         # Patched module name.
         "inspect",
 
@@ -387,6 +409,10 @@ class PythonGlobalContext:
         for value in _getConstantDefaultPopulation():
             self.getConstantCode(value)
 
+        # The constants used by the helper code, these must be created no
+        # matter which module uses what.
+        self.runtime_constants = dict(self.constants)
+
         self.needs_exception_variables = False
 
     def getConstantCode(self, constant, real_use = True):
@@ -428,6 +454,8 @@ class PythonGlobalContext:
     def getConstants(self):
         return self.constants
 
+    def getRuntimeConstants(self):
+        return self.runtime_constants
 
 
 class PythonModuleContext(PythonContextBase, TempMixin):
@@ -450,6 +478,10 @@ class PythonModuleContext(PythonContextBase, TempMixin):
         self.declaration_codes = {}
         self.helper_codes = {}
 
+        # The constants used by this module, to tell apart the ones shared with
+        # other modules.
+        self.constants = {}
+
     def __repr__(self):
         return "<PythonModuleContext instance for module %s>" % self.filename
 
@@ -463,7 +495,15 @@ class PythonModuleContext(PythonContextBase, TempMixin):
         return "frame_module"
 
     def getConstantCode(self, constant):
-        return self.global_context.getConstantCode(constant)
+        result = self.global_context.getConstantCode(constant)
+
+        if result.startswith("const_"):
+            self.constants[HashableConstant(constant)] = result
+
+        return result
+
+    def getConstants(self):
+        return self.constants
 
     def getName(self):
         return self.name
@@ -669,6 +709,12 @@ class PythonStatementCContext(PythonChildContextBase):
     def setExceptionPublished(self, value):
         self.parent.setExceptionPublished(value)
 
+    def getExceptionLineNumberName(self):
+        return self.parent.getExceptionLineNumberName()
+
+    def setExceptionLineNumberName(self, name):
+        self.parent.setExceptionLineNumberName(name)
+
     def getLoopBreakTarget(self):
         return self.parent.getLoopBreakTarget()
 
@@ -741,6 +787,9 @@ class PythonStatementCContext(PythonChildContextBase):
     def getExceptionKeeperVariables(self):
         return self.parent.getExceptionKeeperVariables()
 
+    def allocateResumePoint(self):
+        return self.parent.allocateResumePoint()
+
     def needsExceptionVariables(self):
         return self.parent.needsExceptionVariables()
 
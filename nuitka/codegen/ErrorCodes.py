@@ -20,6 +20,10 @@ from .ExceptionCodes import (
     getExceptionIdentifier
 )
 
+from .LineNumberCodes import (
+    getErrorLineNumberUpdateCode
+)
+
 from .Indentation import (
     indented
 )
@@ -29,12 +33,23 @@ from . import (
 )
 
 def getErrorExitReleaseCode(context):
-    return "\n".join(
+    release_code = "\n".join(
         "Py_DECREF( %s );" % tmp_name
         for tmp_name in
         context.getCleanupTempnames()
     )
 
+    # With lines set for errors only, the error exit sets it.
+    line_number_code = getErrorLineNumberUpdateCode(context)
+
+    if line_number_code:
+        if release_code:
+            release_code += "\n"
+
+        release_code += line_number_code
+
+    return release_code
+
 def getErrorExitBoolCode(condition, emit, context, quick_exception = None):
     assert not condition.endswith(";")
 
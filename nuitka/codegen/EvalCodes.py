@@ -25,6 +25,55 @@ from .ErrorCodes import getErrorExitCode, getReleaseCodes
 
 from nuitka.Utils import python_version
 
+from types import CodeType
+
+import warnings
+
+def getPrecompiledCode(source_code, filename, mode, flags):
+    """ Compile constant source code at compile time already.
+
+        Returns the code object, to be used as a constant, or None, if it
+        cannot be done, e.g. due to syntax errors or warnings, which must
+        then be given at run time.
+    """
+
+    # Everything that goes wrong is left to run time to handle, where it
+    # will give the exception again, pylint: disable=W0703
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            result = compile(source_code, filename, mode, flags, True)
+    except Exception:
+        return None
+
+    # With flags asking for an AST, that is what we got.
+    if type(result) is not CodeType:
+        return None
+
+    return result
+
+
+def getPrecompiledCompileCode(to_name, code_object, emit, context):
+    emit(
+        "%s = COPY_CODE( %s );" % (
+            to_name,
+            getConstantCode(
+                constant = code_object,
+                context  = context
+            )
+        )
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def getCompileCode(to_name, source_name, filename_name, mode_name,
                    flags_name, dont_inherit_name, optimize_name, emit, context):
 
@@ -70,20 +119,23 @@ def getCompileCode(to_name, source_name, filename_name, mode_name,
 
 
 def getEvalCode(to_name, source_name, filename_name, globals_name, locals_name,
-                mode_name, emit, context):
-    compiled_name = context.allocateTempName("eval_compiled")
-
-    getCompileCode(
-        to_name            = compiled_name,
-        source_name        = source_name,
-        filename_name      = filename_name,
-        mode_name          = mode_name,
-        flags_name         = "NULL",
-        dont_inherit_name  = "NULL",
-        optimize_name      = "NULL",
-        emit               = emit,
-        context            = context
-    )
+                mode_name, precompiled, emit, context):
+    if precompiled:
+        compiled_name = source_name
+    else:
+        compiled_name = context.allocateTempName("eval_compiled")
+
+        getCompileCode(
+            to_name            = compiled_name,
+            source_name        = source_name,
+            filename_name      = filename_name,
+            mode_name          = mode_name,
+            flags_name         = "NULL",
+            dont_inherit_name  = "NULL",
+            optimize_name      = "NULL",
+            emit               = emit,
+            context            = context
+        )
 
     emit(
         "%s = EVAL_CODE( %s, %s, %s );" % (
@@ -110,23 +162,26 @@ def getEvalCode(to_name, source_name, filename_name, globals_name, locals_name,
 
 
 def getExecCode(source_name, globals_name, filename_name, locals_name,
-                store_back, provider, emit, context):
-    compiled_name = context.allocateTempName("exec_compiled")
-
-    getCompileCode(
-        to_name           = compiled_name,
-        source_name       = source_name,
-        filename_name     = filename_name,
-        mode_name         = getConstantCode(
-            constant = "exec",
-            context  = context
-        ),
-        flags_name        = "NULL",
-        dont_inherit_name = "NULL",
-        optimize_name     = "NULL",
-        emit              = emit,
-        context           = context
-    )
+                store_back, provider, precompiled, emit, context):
+    if precompiled:
+        compiled_name = source_name
+    else:
+        compiled_name = context.allocateTempName("exec_compiled")
+
+        getCompileCode(
+            to_name           = compiled_name,
+            source_name       = source_name,
+            filename_name     = filename_name,
+            mode_name         = getConstantCode(
+                constant = "exec",
+                context  = context
+            ),
+            flags_name        = "NULL",
+            dont_inherit_name = "NULL",
+            optimize_name     = "NULL",
+            emit              = emit,
+            context           = context
+        )
 
     to_name = context.allocateTempName("exec_result")
 
@@ -45,6 +45,7 @@ from .LineNumberCodes import (
     getSetLineNumberCodeRaw
 )
 
+from nuitka import Options
 from nuitka.Utils import python_version
 
 
@@ -133,8 +134,16 @@ def getFrameGuardLightCode(frame_identifier, code_identifier, codes,
 
     no_exception_exit = context.allocateLabel("frame_no_exception")
 
+    # Stackless generators keep the frame in their context, where it is
+    # declared with the other local variables.
+    if Options.isStacklessGenerators():
+        frame_declaration = frame_identifier
+    else:
+        frame_declaration = "PyFrameObject *" + frame_identifier
+
     result = CodeTemplates.template_frame_guard_generator % {
         "frame_identifier"      : frame_identifier,
+        "frame_declaration"     : frame_declaration,
         "code_identifier"       : code_identifier,
         "codes"                 : indented(codes, 0),
         "module_identifier"     : getModuleAccessCode(context = context),
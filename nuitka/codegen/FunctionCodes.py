@@ -547,6 +547,156 @@ def getFunctionCode( context, function_name, function_identifier, parameters,
 
     return result
 
+def _getStacklessGeneratorLocals(context):
+    # The local variables of a stackless generator function, that need to be
+    # stored in its context to survive yields, with their initialization to
+    # be done on entry.
+    result = []
+
+    if context.hasLocalsDict():
+        result.append(
+            (
+                "PyObjectTempVariable",
+                "locals_dict",
+                "locals_dict.object = PyDict_New();"
+            )
+        )
+
+    if context.needsExceptionVariables():
+        result += [
+            ("PyObject *", "exception_type", "exception_type = NULL;"),
+            ("PyObject *", "exception_value", "exception_value = NULL;"),
+            ("PyTracebackObject *", "exception_tb", "exception_tb = NULL;")
+        ]
+
+    for keeper_variable in range(1, context.getKeeperVariableCount()+1):
+        result += [
+            ("PyObject *", "exception_keeper_type_%d" % keeper_variable, None),
+            ("PyObject *", "exception_keeper_value_%d" % keeper_variable, None),
+            (
+                "PyTracebackObject *",
+                "exception_keeper_tb_%d" % keeper_variable,
+                None
+            )
+        ]
+
+    for tmp_name, tmp_type in context.getTempNameInfos():
+        result.append((tmp_type, tmp_name, None))
+
+    result.append(
+        ("NUITKA_MAY_BE_UNUSED PyFrameObject *", context.getFrameHandle(), None)
+    )
+
+    return result
+
+
+def _getGeneratorYielderCode(function_identifier, function_codes,
+                             context_access, needs_exception_exit,
+                             needs_generator_return, context):
+    function_locals = []
+
+    if context.hasLocalsDict():
+        function_locals += CodeTemplates.function_dict_setup.split( "\n" )
+
+    if context.needsExceptionVariables():
+        function_locals += [
+            "PyObject *exception_type = NULL, *exception_value = NULL;",
+            "PyTracebackObject *exception_tb = NULL;"
+        ]
+
+    for keeper_variable in range(1, context.getKeeperVariableCount()+1):
+        function_locals += [
+            "PyObject *exception_keeper_type_%d;" % keeper_variable,
+            "PyObject *exception_keeper_value_%d;" % keeper_variable,
+            "PyTracebackObject *exception_keeper_tb_%d;" % keeper_variable
+        ]
+
+
+    function_locals += [
+        "%s%s%s;" % (
+            tmp_type,
+            " " if not tmp_type.endswith("*") else "",
+            tmp_name
+        )
+        for tmp_name, tmp_type in
+        context.getTempNameInfos()
+    ]
+
+    if needs_exception_exit:
+        generator_exit = CodeTemplates.template_generator_exception_exit % {}
+    else:
+        generator_exit = CodeTemplates.template_generator_noexception_exit % {}
+
+    if needs_generator_return:
+        generator_exit += CodeTemplates.template_generator_return_exit % {}
+
+    return CodeTemplates.genfunc_yielder_template % {
+        "function_identifier" : function_identifier,
+        "function_body"       : indented(function_codes, 1),
+        "function_var_inits"  : indented(function_locals, 1),
+        "context_access"      : indented(context_access, 1),
+        "generator_exit"      : generator_exit
+    }
+
+
+def _getGeneratorStacklessYielderCode(function_identifier, function_codes,
+                                      stored_locals, context_access,
+                                      needs_exception_exit,
+                                      needs_generator_return, context):
+    function_var_decls = []
+    function_var_inits = []
+
+    for var_type, var_name, var_init in stored_locals:
+        function_var_decls.append(
+            "%s%s&%s = _python_context->%s;" % (
+                var_type,
+                " " if not var_type.endswith("*") else "",
+                var_name,
+                var_name
+            )
+        )
+
+        if var_init is not None:
+            function_var_inits.append(var_init)
+
+    resume_point_count = context.getResumePointCount()
+
+    if resume_point_count:
+        resume_dispatch = CodeTemplates.template_generator_resume_dispatch % {
+            "resume_cases" : "\n".join(
+                "case %d: goto resume_point_%d;" % (
+                    resume_point,
+                    resume_point
+                )
+                for resume_point in
+                range(1, resume_point_count+1)
+            )
+        }
+    else:
+        resume_dispatch = ""
+
+    if needs_exception_exit:
+        generator_exit = \
+          CodeTemplates.template_generator_stackless_exception_exit % {}
+    else:
+        generator_exit = \
+          CodeTemplates.template_generator_stackless_noexception_exit % {}
+
+    if needs_generator_return:
+        generator_exit += \
+          CodeTemplates.template_generator_stackless_return_exit % {}
+
+    return CodeTemplates.genfunc_yielder_stackless_template % {
+        "function_identifier" : function_identifier,
+        "function_body"       : indented(function_codes, 1),
+        "function_var_decls"  : indented(function_var_decls, 1),
+        "resume_dispatch"     : indented(resume_dispatch, 1),
+        "function_var_inits"  : indented(function_var_inits, 1),
+        "context_access"      : indented(context_access, 1),
+        "generator_exit"      : generator_exit
+    }
+
+
 def getGeneratorFunctionCode( context, function_name, function_identifier,
                               parameters, closure_variables, user_variables,
                               temp_variables, function_codes, source_ref,
@@ -591,7 +741,6 @@ def getGeneratorFunctionCode( context, function_name, function_identifier,
         )
         del variable
 
-    function_var_inits = []
     local_var_decl = []
 
     for user_variable in user_variables:
@@ -614,6 +763,20 @@ def getGeneratorFunctionCode( context, function_name, function_identifier,
             )
         )
 
+    if Options.isStacklessGenerators():
+        stored_locals = _getStacklessGeneratorLocals(context)
+
+        for var_type, var_name, _var_init in stored_locals:
+            var_type = var_type.replace("NUITKA_MAY_BE_UNUSED ", "")
+
+            local_var_decl.append(
+                "%s%s%s;" % (
+                    var_type,
+                    " " if not var_type.endswith("*") else "",
+                    var_name
+                )
+            )
+
     for closure_variable in closure_variables:
         assert closure_variable.isShared()
 
@@ -669,52 +832,25 @@ def getGeneratorFunctionCode( context, function_name, function_identifier,
     else:
         context_access_instance = ""
 
-    function_locals = []
-
-    if context.hasLocalsDict():
-        function_locals += CodeTemplates.function_dict_setup.split( "\n" )
-
-    function_locals += function_var_inits
-
-    if context.needsExceptionVariables():
-        function_locals += [
-            "PyObject *exception_type = NULL, *exception_value = NULL;",
-            "PyTracebackObject *exception_tb = NULL;"
-        ]
-
-    for keeper_variable in range(1, context.getKeeperVariableCount()+1):
-        function_locals += [
-            "PyObject *exception_keeper_type_%d;" % keeper_variable,
-            "PyObject *exception_keeper_value_%d;" % keeper_variable,
-            "PyTracebackObject *exception_keeper_tb_%d;" % keeper_variable
-        ]
-
-
-    function_locals += [
-        "%s%s%s;" % (
-            tmp_type,
-            " " if not tmp_type.endswith("*") else "",
-            tmp_name
+    if Options.isStacklessGenerators():
+        result += _getGeneratorStacklessYielderCode(
+            function_identifier    = function_identifier,
+            function_codes         = function_codes,
+            stored_locals          = stored_locals,
+            context_access         = context_access_instance,
+            needs_exception_exit   = needs_exception_exit,
+            needs_generator_return = needs_generator_return,
+            context                = context
         )
-        for tmp_name, tmp_type in
-        context.getTempNameInfos()
-    ]
-
-    if needs_exception_exit:
-        generator_exit = CodeTemplates.template_generator_exception_exit % {}
     else:
-        generator_exit = CodeTemplates.template_generator_noexception_exit % {}
-
-    if needs_generator_return:
-        generator_exit += CodeTemplates.template_generator_return_exit % {}
-
-    result += CodeTemplates.genfunc_yielder_template % {
-        "function_identifier" : function_identifier,
-        "function_body"       : indented(function_codes, 1),
-        "function_var_inits"  : indented(function_locals, 1),
-        "context_access"      : indented(context_access_instance, 1),
-        "generator_exit"      : generator_exit
-    }
+        result += _getGeneratorYielderCode(
+            function_identifier    = function_identifier,
+            function_codes         = function_codes,
+            context_access         = context_access_instance,
+            needs_exception_exit   = needs_exception_exit,
+            needs_generator_return = needs_generator_return,
+            context                = context
+        )
 
     code_identifier = getCodeObjectHandle(
         context       = context,
@@ -36,7 +36,9 @@ from .LineNumberCodes import (
     popLineNumberBranch,
     getSetLineNumberCode,
     getLineNumberCode,
-    resetLineNumber
+    resetLineNumber,
+    pushErrorLineNumber,
+    popErrorLineNumber
 )
 from .ListCodes import (
     getListOperationAppendCode
@@ -60,6 +62,7 @@ from .CallCodes import (
     getMakeBuiltinExceptionCode,
     getCallCodePosKeywordArgs,
     getCallCodePosArgsQuickC,
+    getCallCodeMethodArgsC,
     getCallCodeKeywordArgs,
     getCallCodePosArgsC,
     getCallCodeNoArgsC,
@@ -70,6 +73,7 @@ from .CallCodes import (
 from .ConstantCodes import (
     getConstantsInitCode,
     getConstantsDeclCode,
+    getConstantsClosure,
     getConstantAccessC,
     getConstantCode,
     needsPickleInit,
@@ -186,6 +190,7 @@ from .AttributeCodes import (
     getAttributeAssignmentDictSlotCode,
     getAttributeAssignmentCode,
     getAttributeLookupCode,
+    getMethodLookupCode,
     getAttributeDelCode
 )
 
@@ -203,6 +208,8 @@ from .MainCodes import getMainCode
 from .PythonAPICodes import getCAPIObjectCode, getCAPIIntCode
 
 from .EvalCodes import (
+    getPrecompiledCode,
+    getPrecompiledCompileCode,
     getCompileCode,
     getExecCode,
     getEvalCode
@@ -224,6 +231,7 @@ from .VariableCodes import (
 from .CodeObjectCodes import (
     getCodeObjectsDeclCode,
     getCodeObjectsInitCode,
+    getCodeObjects
 )
 
 from . import (
@@ -237,6 +245,8 @@ from nuitka import (
     Utils
 )
 
+from nuitka.__past__ import iterItems
+
 
 def getOperationCode(to_name, operator, arg_names, emit, context):
     # This needs to have one return per operation of Python, and there are many
@@ -259,6 +269,12 @@ def getOperationCode(to_name, operator, arg_names, emit, context):
         helper = "BINARY_OPERATION_MUL"
     elif operator == "Mod":
         helper = "BINARY_OPERATION_REMAINDER"
+    elif operator == "IAdd":
+        helper = "BINARY_OPERATION_ADD_INPLACE"
+    elif operator == "ISub":
+        helper = "BINARY_OPERATION_SUB_INPLACE"
+    elif operator == "IMult":
+        helper = "BINARY_OPERATION_MUL_INPLACE"
     elif len(arg_names) == 2:
         helper = "BINARY_OPERATION"
         prefix_args = (
@@ -585,3 +601,152 @@ def getConstantsDefinitionCode(context):
         "constant_inits"        : indented(constant_inits),
         "constant_locals"       : indented(constant_locals)
     }
+
+
+def _getConstantDefinitions(constants, for_header):
+    if for_header:
+        prefix = "extern "
+    else:
+        prefix = ""
+
+    return [
+        "%sPyObject *%s;" % (prefix, constant_identifier)
+        for constant_identifier in
+        sorted(constants.values())
+    ]
+
+
+def getSharedRuntimeConstantsCode(context, module_contexts, runtime_contexts):
+    """ Constants code for the shared runtime and the modules using it.
+
+    The constants used by more than one of the modules, or by the runtime
+    itself, are created by the runtime, the others by the modules using them
+    on their own. Returns the runtime code and a dictionary with the code for
+    each module context.
+    """
+
+    # Many variables as there are two sides to it, pylint: disable=R0914
+
+    shared_constants = getConstantsClosure(
+        context   = context,
+        constants = context.getRuntimeConstants()
+    )
+
+    for runtime_context in runtime_contexts:
+        shared_constants.update(
+            getConstantsClosure(
+                context   = context,
+                constants = runtime_context.getConstants()
+            )
+        )
+
+    module_constants = {}
+    usage_counts = {}
+
+    for module_context in module_contexts:
+        module_constants[module_context] = getConstantsClosure(
+            context   = context,
+            constants = module_context.getConstants()
+        )
+
+        for key in module_constants[module_context]:
+            usage_counts[key] = usage_counts.get(key, 0) + 1
+
+    for module_context in module_contexts:
+        for key, constant_identifier in iterItems(module_constants[module_context]):
+            if usage_counts[key] > 1:
+                shared_constants[key] = constant_identifier
+
+    module_filenames = dict(
+        (module_context.getFilename(), module_context)
+        for module_context in
+        module_contexts
+    )
+
+    shared_code_objects = []
+    module_code_objects = dict(
+        (module_context, [])
+        for module_context in
+        module_contexts
+    )
+
+    for code_object_info in getCodeObjects():
+        if code_object_info[0][0] in module_filenames:
+            module_code_objects[module_filenames[code_object_info[0][0]]].append(
+                code_object_info
+            )
+        else:
+            shared_code_objects.append(code_object_info)
+
+    # The shared constants must be created first, so that the module code will
+    # not attempt to create them again.
+    constant_inits = getConstantsInitCode(
+        context   = context,
+        constants = shared_constants
+    )
+    constant_inits += getCodeObjectsInitCode(
+        context  = context,
+        selected = shared_code_objects
+    )
+
+    constant_declarations = _getConstantDefinitions(
+        constants  = shared_constants,
+        for_header = False
+    )
+    constant_declarations += getCodeObjectsDeclCode(
+        for_header = False,
+        selected   = shared_code_objects
+    )
+
+    runtime_code = CodeTemplates.template_constants_reading % {
+        "constant_declarations" : "\n".join(constant_declarations),
+        "constant_inits"        : indented(constant_inits),
+        "constant_locals"       : ""
+    }
+
+    module_codes = {}
+
+    for module_context in module_contexts:
+        unique_constants = dict(
+            (key, constant_identifier)
+            for key, constant_identifier in
+            iterItems(module_constants[module_context])
+            if key not in shared_constants
+        )
+
+        constant_inits = getConstantsInitCode(
+            context   = context,
+            constants = unique_constants
+        )
+        constant_inits += getCodeObjectsInitCode(
+            context  = context,
+            selected = module_code_objects[module_context]
+        )
+
+        constant_declarations = _getConstantDefinitions(
+            constants  = dict(
+                (key, constant_identifier)
+                for key, constant_identifier in
+                iterItems(module_constants[module_context])
+                if key in shared_constants
+            ),
+            for_header = True
+        )
+        constant_declarations += _getConstantDefinitions(
+            constants  = unique_constants,
+            for_header = False
+        )
+        constant_declarations += getCodeObjectsDeclCode(
+            for_header = False,
+            selected   = module_code_objects[module_context]
+        )
+
+        module_codes[module_context] = \
+          CodeTemplates.template_module_constants_reading % {
+            "module_name"           : module_context.getName(),
+            "module_identifier"     : module_context.getModuleCodeName(),
+            "constant_declarations" : "\n".join(constant_declarations),
+            "constant_inits"        : indented(constant_inits),
+        }
+
+    return runtime_code, module_codes
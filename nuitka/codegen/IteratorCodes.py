@@ -107,18 +107,9 @@ if (%s == NULL)
     context.addCleanupTempName(to_name)
 
 
-def getUnpackNextCode(iterator_identifier, count):
-    emit(
-        "UNPACK_NEXT( %s, %d )" % (
-            iterator_identifier.getCodeTemporaryRef(),
-            count - 1
-        )
-    )
-
-
 def getUnpackNextCode(to_name, value, count, emit, context):
     emit(
-        "%s = UNPACK_PARAMETER_NEXT( %s, %s );" % (
+        "%s = UNPACK_NEXT( %s, %s );" % (
             to_name,
             value,
             count - 1
@@ -142,20 +133,14 @@ def getUnpackNextCode(to_name, value, count, emit, context):
 
 
 def getUnpackCheckCode(iterator_name, count, emit, context):
-    # TODO: These re-usable variables could be treated different, as they cannot
-    # collide.
-    attempt_name = context.allocateTempName("iterator_attempt")
-
-    release_code = getErrorExitReleaseCode(context)
+    context.markAsNeedsExceptionVariables()
 
     emit(
         CodeTemplates.template_iterator_check % {
-            "iterator_name"   : iterator_name,
-            "attempt_name"    : attempt_name,
-            "count"           : count,
-            "exception_exit"  : context.getExceptionEscape(),
-            "release_temps_1" : indented(release_code, 2),
-            "release_temps_2" : indented(release_code),
+            "iterator_name"  : iterator_name,
+            "count"          : count,
+            "exception_exit" : context.getExceptionEscape(),
+            "release_temps"  : indented(getErrorExitReleaseCode(context)),
         }
     )
 
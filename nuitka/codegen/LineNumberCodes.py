@@ -19,10 +19,16 @@
 
 """
 
+from nuitka import Options
+
 # Stack of source code references, to push and pop from, for loops and branches
 # to not rely on their last line number.
 source_ref_stack = [ None ]
 
+# Stack of the line numbers of the current statement per frame, to be set by
+# the exits to exception handlers, if lines are set for errors only.
+error_line_stack = [ None ]
+
 def resetLineNumber():
     source_ref_stack[-1] = None
 
@@ -47,11 +53,33 @@ def getSetLineNumberCodeRaw(line_number, emit, context):
         )
     )
 
+def pushErrorLineNumber(inherit):
+    error_line_stack.append( error_line_stack[-1] if inherit else None )
+
+
+def popErrorLineNumber():
+    del error_line_stack[-1]
+
+
+def getErrorLineNumberUpdateCode(context):
+    line_number = error_line_stack[-1]
+
+    if line_number is None:
+        return ""
+    else:
+        return "%s->f_lineno = %d;" % (
+            context.getFrameHandle(),
+            line_number
+        )
+
+
 def getSetLineNumberCode(source_ref, emit, context):
     if source_ref.shallSetCurrentLine():
         line_number = source_ref.getLineNumber()
 
-        if line_number != source_ref_stack[-1]:
+        if Options.shallSetLinesOnErrorsOnly():
+            error_line_stack[-1] = line_number
+        elif line_number != source_ref_stack[-1]:
             source_ref_stack[-1] = line_number
 
             getSetLineNumberCodeRaw(line_number, emit, context)
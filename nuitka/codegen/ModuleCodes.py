@@ -133,7 +133,9 @@ def getModuleCode( context, module_name, codes, metapath_loader_inittab,
     ]
 
     if context.needsExceptionVariables():
-        module_exit = CodeTemplates.template_module_exception_exit
+        module_exit = CodeTemplates.template_module_exception_exit % {
+            "module_name" : module_name
+        }
     else:
         module_exit = CodeTemplates.template_module_noexception_exit
 
@@ -149,9 +151,7 @@ def getModuleCode( context, module_name, codes, metapath_loader_inittab,
         "temps_decl"              : indented(local_var_inits),
         "module_code"             : indented(codes),
         "module_exit"             : module_exit,
-        "metapath_loader_inittab" : indented(
-            sorted(metapath_loader_inittab)
-        ),
+        "metapath_loader_inittab" : indented(metapath_loader_inittab),
         "use_unfreezer"           : 1 if metapath_loader_inittab else 0
 
     }
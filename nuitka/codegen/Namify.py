@@ -29,7 +29,9 @@ from nuitka.__past__ import long, unicode
 
 from logging import warning
 
-import hashlib, re, math
+import hashlib, re, math, marshal
+
+from types import CodeType
 
 # False alarms about "hashlib.md5" due to its strange way of defining what is
 # exported, pylint won't understand it. pylint: disable=E1101
@@ -153,6 +155,10 @@ def namifyConstant(constant):
                 warning( "Couldn't namify '%r'" % value )
 
                 return "list_" + _digest( repr( constant ) )
+    elif type( constant ) is CodeType:
+        # Precompiled code for "exec", "eval", and "compile", the marshal form
+        # includes all there is, e.g. the filename too.
+        return "code_" + _digest( marshal.dumps( constant ) )
     elif type( constant ) is range:
         # Python3 type only.
         return "range_%s" % (
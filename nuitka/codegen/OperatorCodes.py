@@ -29,6 +29,9 @@ binary_operator_codes = {
 #    "Div"       : "PyNumber_Divide",
 #    "Mult"      : "PyNumber_Multiply",
 #    "Mod"       : "PyNumber_Remainder",
+#    "IAdd"      : "PyNumber_InPlaceAdd",
+#    "ISub"      : "PyNumber_InPlaceSubtract",
+#    "IMult"     : "PyNumber_InPlaceMultiply",
 # These have their own variants only to make sure the generic code is inlined
 # but the CPython code is not inlined.
 
@@ -43,9 +46,6 @@ binary_operator_codes = {
     "BitAnd"    : "PyNumber_And",
     "BitOr"     : "PyNumber_Or",
     "BitXor"    : "PyNumber_Xor",
-    "IAdd"      : "PyNumber_InPlaceAdd",
-    "ISub"      : "PyNumber_InPlaceSubtract",
-    "IMult"     : "PyNumber_InPlaceMultiply",
     "IDiv"      : "PyNumber_InPlaceDivide",
     "IFloorDiv" : "PyNumber_InPlaceFloorDivide",
     "ITrueDiv"  : "PyNumber_InPlaceTrueDivide",
@@ -42,6 +42,30 @@ def getDirectFunctionEntryPointIdentifier(function_identifier):
     return "impl_" + function_identifier
 
 
+# Signatures with at least that many parameters that can be given as keyword
+# arguments get their names dispatched by length.
+_wide_signature_count = 4
+
+def _isWideSignature(parameters):
+    parameter_names = [
+        variable.getName()
+        for variable in
+        parameters.getTopLevelVariables()
+        if not variable.isNestedParameterVariable()
+    ]
+
+    if len(parameter_names) < _wide_signature_count:
+        return False
+
+    # The length of the name must be the same for the C string, which is only
+    # assured for ASCII names.
+    for parameter_name in parameter_names:
+        if any(ord(c) >= 128 for c in parameter_name):
+            return False
+
+    return True
+
+
 def _getParameterParsingCode(context, parameters, function_name):
     # There is really no way this could be any less complex.
     # pylint: disable=R0912,R0914
@@ -88,6 +112,7 @@ def _getParameterParsingCode(context, parameters, function_name):
     elif not parameters.isEmpty():
         quick_path_code = ""
         slow_path_code = ""
+        switch_paths = {}
 
         for variable in top_level_parameters:
             # Only named ones can be assigned from the dict.
@@ -106,10 +131,11 @@ def _getParameterParsingCode(context, parameters, function_name):
             if variable.isParameterVariableKwOnly():
                 assign_quick = CodeTemplates.argparse_template_assign_from_dict_parameter_quick_path_kw_only
                 assign_slow = CodeTemplates.argparse_template_assign_from_dict_parameter_slow_path_kw_only
+                assign_switch = CodeTemplates.argparse_template_assign_from_dict_parameter_switch_path_kw_only
             else:
                 assign_quick = CodeTemplates.argparse_template_assign_from_dict_parameter_quick_path
                 assign_slow = CodeTemplates.argparse_template_assign_from_dict_parameter_slow_path
-
+                assign_switch = CodeTemplates.argparse_template_assign_from_dict_parameter_switch_path
 
             quick_path_code += assign_quick % {
                 "parameter_name_object"    : parameter_name_object,
@@ -121,6 +147,30 @@ def _getParameterParsingCode(context, parameters, function_name):
                 "parameter_assign_from_kw" : indented(parameter_assign_from_kw)
             }
 
+            switch_paths.setdefault(len(variable.getName()), "")
+            switch_paths[len(variable.getName())] += assign_switch % {
+                "parameter_name_object"    : parameter_name_object,
+                "parameter_assign_from_kw" : indented(parameter_assign_from_kw)
+            }
+
+        # For wide signatures, names that are not identical to the parameter
+        # name constants are compared only to the ones of the same length,
+        # unless they are not exact strings.
+        if _isWideSignature(parameters):
+            switch_cases_code = "".join(
+                CodeTemplates.argparse_template_assign_from_dict_parameter_switch_case % {
+                    "name_length"           : name_length,
+                    "parameter_switch_path" : indented(switch_path_code)
+                }
+                for name_length, switch_path_code in
+                sorted(switch_paths.items())
+            )
+
+            slow_path_code = CodeTemplates.argparse_template_assign_from_dict_parameter_switch % {
+                "parameter_switch_cases" : indented(switch_cases_code, 2),
+                "parameter_slow_path"    : indented(slow_path_code, 2)
+            }
+
         parameter_parsing_code += CodeTemplates.argparse_template_assign_from_dict_parameters % {
             "function_name"         : function_name,
             "parameter_quick_path"  : indented(quick_path_code, 2),
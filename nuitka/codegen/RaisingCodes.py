@@ -18,6 +18,19 @@
 
 from .PythonAPICodes import getReferenceExportCode
 
+from .LineNumberCodes import (
+    getErrorLineNumberUpdateCode,
+    getSetLineNumberCodeRaw
+)
+
+
+def _getErrorLineNumberCode(emit, context):
+    # With lines set for errors only, raising sets it.
+    line_number_code = getErrorLineNumberUpdateCode(context)
+
+    if line_number_code:
+        emit(line_number_code)
+
 
 def getReRaiseExceptionCode(emit, context):
     assert context.getExceptionEscape() is not None
@@ -27,6 +40,15 @@ def getReRaiseExceptionCode(emit, context):
             "RERAISE_EXCEPTION( &exception_type, &exception_value, &exception_tb );"
         )
 
+    exception_lineno_name = context.getExceptionLineNumberName()
+
+    # Locally handled exceptions have no traceback for this frame yet, restore
+    # the line they occured at, so it is created as if never caught.
+    if exception_lineno_name is not None:
+        getSetLineNumberCodeRaw(exception_lineno_name, emit, context)
+    else:
+        _getErrorLineNumberCode(emit, context)
+
     emit(
         "goto %s;" % context.getExceptionEscape()
     )
@@ -48,6 +70,8 @@ RAISE_EXCEPTION_WITH_CAUSE( &exception_type, &exception_value, &exception_tb, \
 %s );""" % getReferenceExportCode(raise_cause_name, context)
     )
 
+    _getErrorLineNumberCode(emit, context)
+
     emit(
         "goto %s;" % (
             context.getExceptionEscape()
@@ -73,6 +97,8 @@ def getRaiseExceptionWithTypeCode(raise_type_name, emit, context):
         "RAISE_EXCEPTION_WITH_TYPE( &exception_type, &exception_value, &exception_tb);"
     )
 
+    _getErrorLineNumberCode(emit, context)
+
     emit(
         "goto %s;" % (
             context.getExceptionEscape()
@@ -101,6 +127,8 @@ def getRaiseExceptionWithValueCode(raise_type_name, raise_value_name, implicit,
         )
     )
 
+    _getErrorLineNumberCode(emit, context)
+
     emit(
         "goto %s;" % (
             context.getExceptionEscape()
@@ -135,6 +163,8 @@ def getRaiseExceptionWithTracebackCode(raise_type_name, raise_value_name,
         "RAISE_EXCEPTION_WITH_TRACEBACK( &exception_type, &exception_value, &exception_tb);"
     )
 
+    _getErrorLineNumberCode(emit, context)
+
     emit(
         "goto %s;" % (
             context.getExceptionEscape()
@@ -19,7 +19,7 @@
 
 """
 
-from nuitka import Variables
+from nuitka import Variables, Utils
 
 from .ConstantCodes import getConstantCode
 
@@ -178,9 +178,15 @@ def getVariableAccessCode(to_name, variable, emit, context):
         # TODO: use SSA to determine
         needs_check = True
 
+        if Utils.python_version < 330:
+            template = CodeTemplates.template_read_mvar_unclear
+        else:
+            template = CodeTemplates.template_read_mvar_unclear_uncached
+
         emit(
-            CodeTemplates.template_read_mvar_unclear % {
+            template % {
                 "module_identifier" : context.getModuleCodeName(),
+                "cache_name"        : context.allocateLabel("mvar_cache"),
                 "tmp_name"          : to_name,
                 "var_name"          : getConstantCode(
                     context  = context,
@@ -25,16 +25,51 @@ from .ErrorCodes import (
     getReleaseCode
 )
 
+from nuitka import Options
+
+
+def _getResumePointCode(resume_point, emit):
+    # Stackless generators return at a yield, and when called again, continue
+    # at the label.
+    emit("generator->m_resume_point = %d;" % resume_point)
+    emit("return;")
+    emit("resume_point_%d:;" % resume_point)
+
+
 def getYieldCode(to_name, value_name, in_handler, emit, context):
-    emit(
-        "%s = %s( generator, %s );" % (
-            to_name,
-            "YIELD" if not in_handler else "YIELD_IN_HANDLER",
-            value_name
-              if context.needsCleanup(value_name) else
-            "INCREASE_REFCOUNT( %s )" % value_name
+    yielded = value_name \
+                if context.needsCleanup(value_name) else \
+              "INCREASE_REFCOUNT( %s )" % value_name
+
+    if Options.isStacklessGenerators():
+        emit(
+            "%s( generator, %s );" % (
+                "YIELD_SUSPEND"
+                  if not in_handler else
+                "YIELD_IN_HANDLER_SUSPEND",
+                yielded
+            )
+        )
+
+        _getResumePointCode(
+            resume_point = context.allocateResumePoint(),
+            emit         = emit
+        )
+
+        emit(
+            "%s = %s( generator );" % (
+                to_name,
+                "YIELD_RESUME" if not in_handler else "YIELD_IN_HANDLER_RESUME"
+            )
+        )
+    else:
+        emit(
+            "%s = %s( generator, %s );" % (
+                to_name,
+                "YIELD" if not in_handler else "YIELD_IN_HANDLER",
+                yielded
+            )
         )
-    )
 
     if context.needsCleanup(value_name):
         context.removeCleanupTempName(value_name)
@@ -49,16 +84,34 @@ def getYieldCode(to_name, value_name, in_handler, emit, context):
     # context.addCleanupTempName(to_name)
 
 def getYieldFromCode(to_name, value_name, in_handler, emit, context):
-    emit(
-        "%s = %s( generator, %s );" % (
-            to_name,
-            # TODO: Clarify, if the difference as in getYieldCode is needed.
-            "YIELD_FROM" if not in_handler or True else "YIELD_IN_HANDLER",
-            value_name
-              if context.needsCleanup(value_name) else
-            "INCREASE_REFCOUNT( %s )" % value_name
+    if Options.isStacklessGenerators():
+        resume_point = context.allocateResumePoint()
+
+        # The sub-generator is first given "None", and then each value sent
+        # after a yield, until it is exhausted.
+        emit("generator->m_yielded = Py_None;")
+        emit("resume_point_%d:;" % resume_point)
+        emit(
+            "if ( YIELD_FROM_STEP( generator, %s, &%s ) )" % (
+                value_name,
+                to_name
+            )
+        )
+        emit("{")
+        emit("    generator->m_resume_point = %d;" % resume_point)
+        emit("    return;")
+        emit("}")
+    else:
+        emit(
+            "%s = %s( generator, %s );" % (
+                to_name,
+                # TODO: Clarify, if the difference as in getYieldCode is needed.
+                "YIELD_FROM" if not in_handler or True else "YIELD_IN_HANDLER",
+                value_name
+                  if context.needsCleanup(value_name) else
+                "INCREASE_REFCOUNT( %s )" % value_name
+            )
         )
-    )
 
     getReleaseCode(
         release_name = value_name,
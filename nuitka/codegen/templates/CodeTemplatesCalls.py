@@ -214,3 +214,41 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d( PyObject *called, %(args_decl)s
     return result;
 }
 """
+
+template_call_method_no_args_decl = """\
+extern PyObject *CALL_METHOD_NO_ARGS( PyObject *called, PyObject *self );"""
+
+template_call_method_no_args_impl = """\
+PyObject *CALL_METHOD_NO_ARGS( PyObject *called, PyObject *self )
+{
+    // Functions found by "LOOKUP_METHOD_CACHED" get the object as the first
+    // argument, instead of being bound to it.
+    if ( self != NULL )
+    {
+        return CALL_FUNCTION_WITH_ARGS1( called, self );
+    }
+    else
+    {
+        return CALL_FUNCTION_NO_ARGS( called );
+    }
+}
+"""
+
+template_call_method_with_args_decl = """\
+extern PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *called, PyObject *self, %(args_decl)s );"""
+
+template_call_method_with_args_impl = """\
+PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *called, PyObject *self, %(args_decl)s )
+{
+    // Functions found by "LOOKUP_METHOD_CACHED" get the object as the first
+    // argument, instead of being bound to it.
+    if ( self != NULL )
+    {
+        return CALL_FUNCTION_WITH_ARGS%(self_args_count)d( called, self, %(args_list)s );
+    }
+    else
+    {
+        return CALL_FUNCTION_WITH_ARGS%(args_count)d( called, %(args_list)s );
+    }
+}
+"""
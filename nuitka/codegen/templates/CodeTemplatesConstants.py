@@ -49,6 +49,11 @@ extern "C" const unsigned char constant_bin[];
 #endif
 #define stream_data constant_bin
 
+#ifdef _NUITKA_SHARED_RUNTIME
+// The modules using the runtime library take their constants from it too.
+const unsigned char *shared_constant_bin = constant_bin;
+#endif
+
 static void __initConstants( void )
 {
     NUITKA_MAY_BE_UNUSED PyObject *exception_type, *exception_value;
@@ -92,3 +97,39 @@ void _initConstants( void );
 
 %(constant_declarations)s
 """
+
+template_module_constants_reading = """
+#include "nuitka/prelude.hpp"
+
+#include "__constants.hpp"
+
+// The constants only used by module '%(module_name)s', the ones shared with
+// other modules are created by the runtime library.
+%(constant_declarations)s
+
+extern const unsigned char *shared_constant_bin;
+#define stream_data shared_constant_bin
+
+void _initModuleConstants_%(module_identifier)s( void )
+{
+    static bool init_done = false;
+
+    if ( init_done )
+    {
+        return;
+    }
+
+    init_done = true;
+
+    NUITKA_MAY_BE_UNUSED PyObject *exception_type, *exception_value;
+    NUITKA_MAY_BE_UNUSED PyTracebackObject *exception_tb;
+
+%(constant_inits)s
+
+    return;
+
+constants_init_exception:;
+    abort();
+    goto constants_init_exception; // NUITKA_MAY_BE_UNUSED
+}
+"""
@@ -21,9 +21,8 @@
 
 # Frame in a function
 template_frame_guard_full_block = """\
-static PyFrameObject *cache_%(frame_identifier)s = NULL;
-MAKE_OR_REUSE_FRAME( cache_%(frame_identifier)s, %(code_identifier)s, %(module_identifier)s );
-PyFrameObject *%(frame_identifier)s = cache_%(frame_identifier)s;
+static Nuitka_FramePool cache_%(frame_identifier)s;
+PyFrameObject *%(frame_identifier)s = MAKE_OR_REUSE_FRAME( &cache_%(frame_identifier)s, %(code_identifier)s, %(module_identifier)s );
 
 // Push the new frame as the currently active one.
 pushFrameStack( %(frame_identifier)s );
@@ -159,7 +158,7 @@ if ( generator->m_exception_type )
 
 # Frame in a generator
 template_frame_guard_generator = """\
-PyFrameObject *%(frame_identifier)s = MAKE_FRAME( %(code_identifier)s, %(module_identifier)s );
+%(frame_declaration)s = MAKE_FRAME( %(code_identifier)s, %(module_identifier)s );
 
 Py_INCREF( %(frame_identifier)s );
 generator->m_frame = %(frame_identifier)s;
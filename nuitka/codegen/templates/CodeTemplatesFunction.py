@@ -30,7 +30,7 @@ template_function_direct_declaration = """\
 function_context_body_template = """
 // This structure is for attachment as self of %(function_identifier)s.
 // It is allocated at the time the function object is created.
-struct _context_%(function_identifier)s_t
+struct _context_%(function_identifier)s_t : public Nuitka_ContextBase
 {
     // The function can access a read-only closure of the creator.
 %(context_decl)s
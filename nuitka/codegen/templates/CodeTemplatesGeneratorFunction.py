@@ -23,7 +23,7 @@ genfunc_context_body_template = """
 
 // This structure is for attachment as self of the generator function %(function_identifier)s and
 // contains the common closure. It is allocated at the time the genexpr object is created.
-struct _context_common_%(function_identifier)s_t
+struct _context_common_%(function_identifier)s_t : public Nuitka_ContextBase
 {
     // Ref count to keep track of common context usage and release only when it's the last one
     int ref_count;
@@ -32,7 +32,7 @@ struct _context_common_%(function_identifier)s_t
 %(function_common_context_decl)s
 };
 
-struct _context_generator_%(function_identifier)s_t
+struct _context_generator_%(function_identifier)s_t : public Nuitka_ContextBase
 {
     _context_common_%(function_identifier)s_t *common_context;
 
@@ -65,7 +65,7 @@ static void _context_generator_%(function_identifier)s_destructor( void *context
 """
 
 genfunc_context_local_only_template = """
-struct _context_generator_%(function_identifier)s_t
+struct _context_generator_%(function_identifier)s_t : public Nuitka_ContextBase
 {
     // The generator function instance can access its parameters from creation time.
 %(function_instance_context_decl)s
@@ -189,6 +189,65 @@ function_return_exit:
 
 """
 
+# For stackless generators, the local variables are references to storage in
+# the context, so they survive the returns at yields, and the code continues
+# after the last yield.
+genfunc_yielder_stackless_template = """
+static void %(function_identifier)s_context( Nuitka_GeneratorObject *generator )
+{
+    // Make context accessible if one is used.
+%(context_access)s
+
+    // Local variables, stored in the context.
+%(function_var_decls)s
+
+    // Continue after the yield, the generator returned at.
+%(resume_dispatch)s
+
+    // Local variable inits
+%(function_var_inits)s
+
+    // Actual function code.
+%(function_body)s
+
+%(generator_exit)s
+}"""
+
+template_generator_resume_dispatch = """\
+switch( generator->m_resume_point )
+{
+%(resume_cases)s
+}"""
+
+template_generator_stackless_exception_exit = """\
+    PyErr_Restore( INCREASE_REFCOUNT( PyExc_StopIteration ), NULL, NULL );
+
+    generator->m_yielded = NULL;
+    return;
+function_exception_exit:
+    assert( exception_type );
+    assert( exception_tb );
+    PyErr_Restore( exception_type, exception_value, (PyObject *)exception_tb );
+    generator->m_yielded = NULL;
+"""
+
+template_generator_stackless_noexception_exit = """\
+    // Return statement must be present.
+    assert(false);
+    generator->m_yielded = NULL;
+"""
+
+template_generator_stackless_return_exit = """\
+    return;
+function_return_exit:
+#if PYTHON_VERSION < 330
+    PyErr_Restore( INCREASE_REFCOUNT( PyExc_StopIteration ), NULL, NULL );
+#else
+    PyErr_Restore( INCREASE_REFCOUNT( PyExc_StopIteration ), tmp_return_value, NULL );
+#endif
+    generator->m_yielded = NULL;
+"""
+
 
 genfunc_common_context_use_template = """\
 struct _context_common_%(function_identifier)s_t *_python_common_context = (struct _context_common_%(function_identifier)s_t *)self->m_context;
@@ -19,38 +19,9 @@
 
 template_iterator_check = """\
 // Check if iterator has left-over elements.
-assertObject( %(iterator_name)s ); assert( PyIter_Check( %(iterator_name)s ) );
-
-%(attempt_name)s = (*Py_TYPE( %(iterator_name)s )->tp_iternext)( %(iterator_name)s );
-
-if (likely( %(attempt_name)s == NULL ))
+if (unlikely( UNPACK_ITERATOR_CHECK( %(iterator_name)s, %(count)d ) == false ))
 {
-    // TODO: Could first fetch, then check, should be faster.
-    if ( !ERROR_OCCURED() )
-    {
-    }
-    else if ( PyErr_ExceptionMatches( PyExc_StopIteration ))
-    {
-        PyErr_Clear();
-    }
-    else
-    {
-        PyErr_Fetch( &exception_type, &exception_value, (PyObject **)&exception_tb );
-%(release_temps_1)s
-        goto %(exception_exit)s;
-    }
-}
-else
-{
-    Py_DECREF( %(attempt_name)s );
-
-    // TODO: Could avoid PyErr_Format.
-#if PYTHON_VERSION < 300
-    PyErr_Format( PyExc_ValueError, "too many values to unpack" );
-#else
-    PyErr_Format( PyExc_ValueError, "too many values to unpack (expected %(count)d)" );
-#endif
     PyErr_Fetch( &exception_type, &exception_value, (PyObject **)&exception_tb );
-%(release_temps_2)s
+%(release_temps)s
     goto %(exception_exit)s;
 }"""
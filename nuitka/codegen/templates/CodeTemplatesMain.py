@@ -63,7 +63,9 @@ int main( int argc, char *argv[] )
 {
 #endif
 #ifdef _NUITKA_STANDALONE
+    NUITKA_STARTUP_TRACE_BEGIN( "startup", "prepareStandaloneEnvironment" );
     prepareStandaloneEnvironment();
+    NUITKA_STARTUP_TRACE_END( "startup", "prepareStandaloneEnvironment" );
 #endif
 
     // Initialize Python environment.
@@ -103,7 +105,9 @@ int main( int argc, char *argv[] )
 
     // Initialize the embedded CPython interpreter.
     setCommandLineParameters( argc, argv, true );
+    NUITKA_STARTUP_TRACE_BEGIN( "startup", "Py_Initialize" );
     Py_Initialize();
+    NUITKA_STARTUP_TRACE_END( "startup", "Py_Initialize" );
 
     // Lie about it, believe it or not, there are "site" files, that check
     // against later imports, see below.
@@ -113,8 +117,12 @@ int main( int argc, char *argv[] )
     setCommandLineParameters( argc, argv, false );
 
     // Initialize the constant values used.
+    NUITKA_STARTUP_TRACE_BEGIN( "startup", "_initBuiltinModule" );
     _initBuiltinModule();
+    NUITKA_STARTUP_TRACE_END( "startup", "_initBuiltinModule" );
+    NUITKA_STARTUP_TRACE_BEGIN( "startup", "_initConstants" );
     _initConstants();
+    NUITKA_STARTUP_TRACE_END( "startup", "_initConstants" );
     _initBuiltinOriginalValues();
 
     // Revert the wrong sys.flags value, it's used by "site" on at least Debian
@@ -134,6 +142,7 @@ int main( int argc, char *argv[] )
     PyType_Ready( &Nuitka_Function_Type );
     PyType_Ready( &Nuitka_Method_Type );
     PyType_Ready( &Nuitka_Frame_Type );
+    PyType_Ready( &Nuitka_RangeIterator_Type );
 #if PYTHON_VERSION < 300
     initSlotCompare();
 #endif
@@ -150,6 +159,8 @@ int main( int argc, char *argv[] )
     patchBuiltinModule();
     patchTypeComparison();
 
+    initFreeListStats();
+
     // Allow to override the ticker value, to remove checks for threads in
     // CPython core from impact on benchmarks.
     char const *ticker_value = getenv( "NUITKA_TICKER" );
@@ -231,6 +242,11 @@ static struct PyModuleDef mdef_%(module_identifier)s =
   };
 #endif
 
+#ifdef _NUITKA_SHARED_RUNTIME
+// The constants only this module uses, the runtime library creates the others.
+extern void _initModuleConstants_%(module_identifier)s( void );
+#endif
+
 #define _MODULE_UNFREEZER %(use_unfreezer)d
 
 #if _MODULE_UNFREEZER
@@ -268,20 +284,30 @@ MOD_INIT_DECL( %(module_identifier)s )
     }
 #endif
 
+    NUITKA_STARTUP_TRACE_BEGIN( "MOD_INIT", "%(module_name)s" );
+
 #ifdef _NUITKA_MODULE
     // In case of a stand alone extension module, need to call initialization
     // the init here because that's the first and only time we are going to get
     // called here.
 
     // Initialize the constant values used.
+    NUITKA_STARTUP_TRACE_BEGIN( "startup", "_initBuiltinModule" );
     _initBuiltinModule();
+    NUITKA_STARTUP_TRACE_END( "startup", "_initBuiltinModule" );
+    NUITKA_STARTUP_TRACE_BEGIN( "startup", "_initConstants" );
     _initConstants();
+    NUITKA_STARTUP_TRACE_END( "startup", "_initConstants" );
+#ifdef _NUITKA_SHARED_RUNTIME
+    _initModuleConstants_%(module_identifier)s();
+#endif
 
     // Initialize the compiled types of Nuitka.
     PyType_Ready( &Nuitka_Generator_Type );
     PyType_Ready( &Nuitka_Function_Type );
     PyType_Ready( &Nuitka_Method_Type );
     PyType_Ready( &Nuitka_Frame_Type );
+    PyType_Ready( &Nuitka_RangeIterator_Type );
 #if PYTHON_VERSION < 300
     initSlotCompare();
 #endif
@@ -289,6 +315,8 @@ MOD_INIT_DECL( %(module_identifier)s )
     patchBuiltinModule();
     patchTypeComparison();
 
+    initFreeListStats();
+
 #endif
 
 #if _MODULE_UNFREEZER
@@ -372,12 +400,16 @@ MOD_INIT_DECL( %(module_identifier)s )
     // Module code.
 %(module_code)s
 
+    NUITKA_STARTUP_TRACE_END( "MOD_INIT", "%(module_name)s" );
+
     return MOD_RETURN_VALUE( module_%(module_identifier)s );
 %(module_exit)s
 """
 
 template_module_exception_exit = """\
 module_exception_exit:
+    NUITKA_STARTUP_TRACE_END( "MOD_INIT", "%(module_name)s" );
+
     PyErr_Restore( exception_type, exception_value, (PyObject *)exception_tb );
     return MOD_RETURN_VALUE( NULL );
 }"""
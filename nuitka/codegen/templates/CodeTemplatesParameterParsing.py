@@ -345,7 +345,7 @@ if ( kw_size > 0 )
 
         // Quick path, could be our value.
 %(parameter_quick_path)s
-        // Slow path, compare against all parameter names.
+        // Slow path, compare the names of the parameters.
 %(parameter_slow_path)s
 
         Py_DECREF( key );
@@ -409,6 +409,53 @@ if ( found == false && RICH_COMPARE_BOOL_EQ( %(parameter_name_object)s, key ) ==
 }
 """
 
+argparse_template_assign_from_dict_parameter_switch = """\
+if ( found == false )
+{
+    Py_ssize_t key_length = GET_KEYWORD_NAME_LENGTH( key );
+
+    if ( key_length < 0 )
+    {
+        // Not an exact string, compare against all parameter names.
+%(parameter_slow_path)s
+    }
+    else
+    {
+        // An exact string, only parameter names of the same length can be
+        // equal, without one it is an unexpected keyword argument.
+        switch( key_length )
+        {
+%(parameter_switch_cases)s
+        }
+    }
+}
+"""
+
+argparse_template_assign_from_dict_parameter_switch_case = """\
+case %(name_length)d:
+%(parameter_switch_path)s
+    break;
+"""
+
+argparse_template_assign_from_dict_parameter_switch_path = """\
+if ( found == false && KEYWORD_NAME_EQ( %(parameter_name_object)s, key, key_length ) )
+{
+%(parameter_assign_from_kw)s
+    found = true;
+    kw_found += 1;
+}
+"""
+
+argparse_template_assign_from_dict_parameter_switch_path_kw_only = """\
+if ( found == false && KEYWORD_NAME_EQ( %(parameter_name_object)s, key, key_length ) )
+{
+%(parameter_assign_from_kw)s
+    found = true;
+    kw_found += 1;
+    kw_only_found += 1;
+}
+"""
+
 
 argparse_template_assign_from_dict_finding = """\
 assert( _python_par_%(parameter_name)s == NULL );
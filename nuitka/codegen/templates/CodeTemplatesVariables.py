@@ -116,9 +116,15 @@ template_read_shared_known = """\
 """
 
 # For module variable values, need to lookup in module dictionary or in
-# built-in dictionary.
+# built-in dictionary. The cached variant is not available for the split
+# dictionaries of Python 3.3 or higher.
 
 template_read_mvar_unclear = """\
+static Nuitka_ModuleVariableCache %(cache_name)s;
+%(tmp_name)s = GET_MODULE_VARIABLE_VALUE_CACHED( &%(cache_name)s, moduledict_%(module_identifier)s, dict_builtin, (Nuitka_StringObject *)%(var_name)s );
+"""
+
+template_read_mvar_unclear_uncached = """\
 %(tmp_name)s = GET_STRING_DICT_VALUE( moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s );
 
 if (unlikely( %(tmp_name)s == NULL ))
@@ -42,6 +42,44 @@ def isWhileListedImport(node):
 
     return Importing.isStandardLibraryPath(module.getFilename())
 
+def _mayCallOut(node):
+    """ Check if a node may run code other than its own.
+
+        Not knowing the types of values, operations, iterations, attribute
+        lookups, and checking the truth of values may all call code of the
+        user, so only very few nodes are known to not do it. Releasing values
+        may call "__del__" always, which is not considered here.
+    """
+
+    # Bodies of modules and functions are not run by where they are.
+    if node.isPythonModule() or node.isExpressionFunctionBody():
+        return False
+
+    if node.isStatementsSequence() or \
+       node.isStatementLoop() or \
+       node.isStatementBreakLoop() or \
+       node.isStatementContinueLoop() or \
+       node.isStatementAssignmentVariable() or \
+       node.isExpressionConstantRef() or \
+       node.isExpressionVariableRef() or \
+       node.isExpressionTargetVariableRef() or \
+       node.isExpressionTempVariableRef() or \
+       node.isExpressionTargetTempVariableRef() or \
+       node.isExpressionComparisonIs() or \
+       node.isExpressionComparisonIsNOT():
+        return False
+
+    # Identity checks give a "bool", which is checked without calls.
+    if node.isStatementConditional():
+        condition = node.getCondition()
+
+        return not condition.isExpressionComparisonIs() and \
+               not condition.isExpressionComparisonIsNOT() and \
+               not condition.isExpressionConstantRef()
+
+    return True
+
+
 class FinalizeMarkups(FinalizationVisitorBase):
     def onEnterNode(self, node):
         # This has many different things it deals with, so there need to be a
@@ -122,6 +160,18 @@ class FinalizeMarkups(FinalizationVisitorBase):
             if search.isGenerator():
                 search.markAsNeedsGeneratorReturnHandling(1)
 
+        if _mayCallOut(node):
+            search = node.getParent()
+
+            # Search up to the containing function, and mark the loops that
+            # contain the node.
+            while not search.isExpressionFunctionBody() and \
+                  not search.isPythonModule():
+                if search.isStatementLoop():
+                    search.markAsMayCall()
+
+                search = search.getParent()
+
         if node.isStatementDelVariable():
             variable = node.getTargetVariableRef().getVariable()
 
@@ -58,7 +58,8 @@ stream_data = ConstantCodes.stream_data
 def generateBytecodeFrozenCode():
     frozen_defs = []
 
-    for frozen_module in frozen_modules:
+    # Sorted by name, so lookups in the table can use a binary search.
+    for frozen_module in sorted(frozen_modules):
         module_name, code_data, is_package, _filename, _is_late = frozen_module
 
         size = len(code_data)
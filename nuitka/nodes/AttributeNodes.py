@@ -23,6 +23,8 @@ and objects and classes.
 There will be a method "computeExpressionAttribute" to aid predicting them.
 """
 
+from nuitka.__past__ import unicode
+
 from .NodeBases import ExpressionChildrenHavingBase
 
 
@@ -82,6 +84,23 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
             constraint_collection = constraint_collection
         )
 
+    def computeExpressionCall(self, call_node, constraint_collection):
+        lookup_source = self.getLookupSource()
+
+        if self.getAttributeName() == "join" and \
+           lookup_source.isExpressionConstantRef() and \
+           type(lookup_source.getConstant()) in (str, unicode):
+            from nuitka.optimizations.OptimizeBuiltinCalls import \
+                computeStringJoinCall
+
+            return computeStringJoinCall(call_node)
+
+        return ExpressionChildrenHavingBase.computeExpressionCall(
+            self,
+            call_node             = call_node,
+            constraint_collection = constraint_collection
+        )
+
     def isKnownToBeIterable(self, count):
         # TODO: Could be known.
         return None
@@ -74,6 +74,23 @@ class ExpressionBuiltinLen(ExpressionBuiltinSingleArgBase):
 class ExpressionBuiltinIter1(ExpressionBuiltinSingleArgBase):
     kind = "EXPRESSION_BUILTIN_ITER1"
 
+    def __init__(self, value, source_ref):
+        ExpressionBuiltinSingleArgBase.__init__(
+            self,
+            value      = value,
+            source_ref = source_ref
+        )
+
+        # Iterators made for loops of re-formulations are not seen by user
+        # code, so their type need not be what CPython gives.
+        self.loop_only = False
+
+    def markAsLoopOnly(self):
+        self.loop_only = True
+
+    def isLoopOnly(self):
+        return self.loop_only
+
     def computeExpression(self, constraint_collection):
         value = self.getValue()
 
@@ -161,6 +178,16 @@ class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
         return self, None, None
 
 
+class ExpressionSpecialUnpackIter1(ExpressionBuiltinIter1):
+    """ Iterator creation for unpacking to a fixed number of targets.
+
+        Exact tuples and lists are not turned into an iterator, but used as
+        they are, so their items can be taken by index.
+    """
+
+    kind = "EXPRESSION_SPECIAL_UNPACK_ITER1"
+
+
 class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
     kind = "EXPRESSION_SPECIAL_UNPACK"
 
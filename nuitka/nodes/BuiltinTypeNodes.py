@@ -54,6 +54,12 @@ class ExpressionBuiltinSet(ExpressionBuiltinTypeBase):
     builtin_spec = BuiltinOptimization.builtin_set_spec
 
 
+class ExpressionBuiltinFrozenset(ExpressionBuiltinTypeBase):
+    kind = "EXPRESSION_BUILTIN_FROZENSET"
+
+    builtin_spec = BuiltinOptimization.builtin_frozenset_spec
+
+
 class ExpressionBuiltinFloat(ExpressionBuiltinTypeBase):
     kind = "EXPRESSION_BUILTIN_FLOAT"
 
@@ -158,3 +158,72 @@ class ExpressionCallEmpty(ExpressionCall):
             ),
             source_ref = source_ref
         )
+
+
+class ExpressionCallComplex(ExpressionChildrenHavingBase):
+    """ Call with star list and/or star dict arguments.
+
+    The positional and keyword arguments are optional, the star arguments
+    are merged with them at run time by a helper in one pass, which also
+    raises the errors for bad star arguments and duplicate keywords.
+    """
+
+    kind = "EXPRESSION_CALL_COMPLEX"
+
+    named_children = (
+        "called", "args", "kw", "list_star_arg", "dict_star_arg"
+    )
+
+    def __init__(self, called, args, kw, list_star_arg, dict_star_arg,
+                 source_ref):
+        assert called.isExpression()
+        assert list_star_arg is not None or dict_star_arg is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "called"        : called,
+                "args"          : args,
+                "kw"            : kw,
+                "list_star_arg" : list_star_arg,
+                "dict_star_arg" : dict_star_arg,
+            },
+            source_ref = source_ref
+        )
+
+    getCalled = ExpressionChildrenHavingBase.childGetter( "called" )
+    getCallArgs = ExpressionChildrenHavingBase.childGetter( "args" )
+    getCallKw = ExpressionChildrenHavingBase.childGetter( "kw" )
+    getStarListArg = ExpressionChildrenHavingBase.childGetter(
+        "list_star_arg"
+    )
+    getStarDictArg = ExpressionChildrenHavingBase.childGetter(
+        "dict_star_arg"
+    )
+
+    def computeExpression(self, constraint_collection):
+        from .NodeMakingHelpers import wrapExpressionWithSideEffects
+
+        # The children are evaluated in this order, if one raises, the ones
+        # before it are side effects, and the call is not made.
+        side_effects = []
+
+        for child in self.getVisitableNodes():
+            if child.willRaiseException(BaseException):
+                result = wrapExpressionWithSideEffects(
+                    side_effects = tuple(side_effects),
+                    old_node     = self,
+                    new_node     = child
+                )
+
+                return result, "new_raise", """\
+Complex call argument raises exception."""
+
+            side_effects.append(child)
+
+        # The called object and all the arguments may be used and changed by
+        # the call in any way.
+        for child in self.getVisitableNodes():
+            child.onContentEscapes(constraint_collection)
+
+        return self, None, None
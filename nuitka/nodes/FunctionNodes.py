@@ -145,6 +145,9 @@ class ExpressionFunctionBody( ClosureTakerMixin, ChildrenHavingMixin,
         # Indicator if the function is used outside of where it's defined.
         self.cross_module_use = False
 
+        # Compile time simulation of a contraction, if it's pure.
+        self.contraction_simulator = None
+
     def getDetails(self):
         return {
             "name"       : self.getFunctionName(),
@@ -174,6 +177,12 @@ class ExpressionFunctionBody( ClosureTakerMixin, ChildrenHavingMixin,
 
         return None
 
+    def setContractionSimulator(self, simulator):
+        self.contraction_simulator = simulator
+
+    def getContractionSimulator(self):
+        return self.contraction_simulator
+
     def getFunctionName(self):
         if self.is_lambda:
             return "<lambda>"
@@ -634,7 +643,77 @@ class ExpressionFunctionCall(ExpressionChildrenHavingBase):
 
                 return result, "new_raise", "Called function arguments raise"
 
+        function_body = function.getFunctionRef().getFunctionBody()
+        simulator = function_body.getContractionSimulator()
+
+        if simulator is not None:
+            iterated = values[0]
+
+            if iterated.isExpressionBuiltinIter1() and \
+               iterated.getValue().isExpressionConstantRef():
+                simulation = simulator(iterated.getValue().getConstant())
+
+                if simulation is not None:
+                    result = self._makeSimulationResult(
+                        provider    = function_body.getParentVariableProvider(),
+                        constant    = simulation[0],
+                        assignments = simulation[1]
+                    )
+
+                    return result, "new_constant", """\
+Contraction over constant value computed at compile time."""
+
         return self, None, None
 
+    def _makeSimulationResult(self, provider, constant, assignments):
+        from .NodeMakingHelpers import makeConstantReplacementNode
+
+        result = makeConstantReplacementNode(
+            constant = constant,
+            node     = self
+        )
+
+        # Python2 list contractions assign their loop variables in the outer
+        # scope, which must still happen.
+        if assignments:
+            from .AssignNodes import StatementAssignmentVariable
+            from .StatementNodes import StatementsSequence
+            from .TryNodes import ExpressionTryFinally
+            from .VariableRefNodes import ExpressionTargetVariableRef
+
+            statements = []
+
+            for variable_name, value in assignments:
+                variable_ref = ExpressionTargetVariableRef(
+                    variable_name = variable_name,
+                    source_ref    = self.source_ref
+                )
+                variable_ref.setVariable(
+                    provider.getVariableForAssignment(variable_name)
+                )
+
+                statements.append(
+                    StatementAssignmentVariable(
+                        variable_ref = variable_ref,
+                        source       = makeConstantReplacementNode(
+                            constant = value,
+                            node     = self
+                        ),
+                        source_ref   = self.source_ref
+                    )
+                )
+
+            result = ExpressionTryFinally(
+                tried      = StatementsSequence(
+                    statements = statements,
+                    source_ref = self.source_ref
+                ),
+                expression = result,
+                final      = None,
+                source_ref = self.source_ref
+            )
+
+        return result
+
     getFunction = ExpressionChildrenHavingBase.childGetter( "function" )
     getArgumentValues = ExpressionChildrenHavingBase.childGetter( "values" )
@@ -87,3 +87,29 @@ class FutureSpec:
             result.append("CO_FUTURE_BARRY_AS_BDFL")
 
         return tuple(result)
+
+    def asCompilerFlags(self):
+        """ Flags for "compile" to use these, as code would inherit them.
+
+        """
+        import __future__
+
+        result = 0
+
+        if self.future_division and Utils.python_version < 300:
+            result |= __future__.division.compiler_flag
+
+        if self.unicode_literals:
+            result |= __future__.unicode_literals.compiler_flag
+
+        if self.absolute_import and Utils.python_version < 300:
+            result |= __future__.absolute_import.compiler_flag
+
+        if self.future_print:
+            result |= __future__.print_function.compiler_flag
+
+        if self.barry_bdfl and Utils.python_version >= 300:
+            # Only present in Python3, pylint: disable=E1101
+            result |= __future__.barry_as_FLUFL.compiler_flag
+
+        return result
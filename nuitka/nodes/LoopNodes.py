@@ -49,8 +49,17 @@ class StatementLoop(StatementChildrenHavingBase):
         # not.
         self.has_break = False
 
+        # For code generation, so it knows if the loop body makes calls.
+        self.may_call = False
+
     getLoopBody = StatementChildrenHavingBase.childGetter("frame")
 
+    def markAsMayCall(self):
+        self.may_call = True
+
+    def mayCall(self):
+        return self.may_call
+
     def mayReturn(self):
         loop_body = self.getLoopBody()
 
@@ -559,3 +559,25 @@ class StatementPublishException(NodeBase):
 
     def mayRaiseException(self, exception_type):
         return False
+
+
+class StatementReleaseException(NodeBase):
+    """ Release the caught exception of a locally handled try/except.
+
+        For handlers that cannot observe the exception, it is never published,
+        and this drops it as soon as the handler has been selected.
+    """
+
+    kind = "STATEMENT_RELEASE_EXCEPTION"
+
+    def __init__(self, source_ref):
+        NodeBase.__init__(
+            self,
+            source_ref = source_ref
+        )
+
+    def computeStatement(self, constraint_collection):
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return False
@@ -21,6 +21,8 @@ The try/except needs handlers, and these blocks are complex control flow.
 
 """
 
+from nuitka.Utils import python_version
+
 from .NodeBases import (
     StatementChildrenHavingBase,
     ExpressionChildrenHavingBase
@@ -408,6 +410,10 @@ class StatementTryExcept(StatementChildrenHavingBase):
     def __init__(self, tried, handling, public_exc, source_ref):
         self.public_exc = public_exc
 
+        # Set when the handlers were found to not observe the exception, so
+        # it is released by them, without ever being published.
+        self.handled_locally = False
+
         StatementChildrenHavingBase.__init__(
             self,
             values     = {
@@ -508,6 +514,9 @@ class StatementTryExcept(StatementChildrenHavingBase):
     def needsExceptionPublish(self):
         return self.public_exc
 
+    def isHandledLocally(self):
+        return self.handled_locally
+
     def computeStatement(self, constraint_collection):
         # The tried block can be processed normally.
         tried_statement_sequence = self.getBlockTry()
@@ -559,4 +568,196 @@ Removed try/except with tried block that cannot raise."""
         # if a pessimistic one.
         constraint_collection.removeAllKnowledge()
 
+        # Only for Python2, where the handlers are not wrapped into restoring
+        # the previous frame exception, and where "sys.exc_info" is all there
+        # is to observe.
+        if python_version < 300 and \
+           self.public_exc and \
+           self._demoteToLocalHandling():
+            constraint_collection.signalChange(
+                "new_statements",
+                self.getSourceReference(),
+                """\
+Try/except handlers do not observe the exception, not publishing it."""
+            )
+
         return self, None, None
+
+    def _demoteToLocalHandling(self):
+        handling = self.getExceptionHandling()
+
+        if handling is None:
+            return False
+
+        # Remove the prelude of publishing and preserving the frame exception.
+        statements = [
+            statement
+            for statement in
+            handling.getStatements()
+            if not statement.isStatementPreserveFrameException()
+            if not statement.isStatementPublishException()
+        ]
+
+        release_points = []
+
+        if not _collectHandlerReleasePoints(
+            statements     = statements,
+            owner          = None,
+            release_points = release_points
+        ):
+            return False
+
+        # The caught exception remains visible in the frame until it is left,
+        # so the handling must leave it immediately, without running any
+        # "finally" code of ours.
+        if not _isHandlingLeavingFrame(self, statements):
+            return False
+
+        from .StatementNodes import StatementReleaseException
+
+        for owner, at_end in release_points:
+            release = StatementReleaseException(
+                source_ref = self.getSourceReference().atInternal()
+            )
+
+            if owner is None:
+                if at_end:
+                    statements.append(release)
+                else:
+                    statements.insert(0, release)
+            elif at_end:
+                owner.setStatements(owner.getStatements() + (release,))
+            else:
+                owner.setStatements((release,) + owner.getStatements())
+
+        handling.setStatements(tuple(statements))
+
+        self.public_exc = False
+        self.handled_locally = True
+
+        return True
+
+
+def _isQuietHandlerStatement(statement):
+    # Statements that neither raise, nor look at the caught exception in any
+    # way, nor catch exceptions themselves.
+    if statement.mayRaiseException(BaseException):
+        return False
+
+    pending = [statement]
+
+    while pending:
+        node = pending.pop()
+
+        if node.isExpressionCaughtExceptionTypeRef() or \
+           node.isExpressionCaughtExceptionValueRef() or \
+           node.isExpressionCaughtExceptionTracebackRef() or \
+           node.isStatementTryExcept() or \
+           node.isStatementTryFinally() or \
+           node.isExpressionTryFinally():
+            return False
+
+        pending += node.getVisitableNodes()
+
+    return True
+
+
+def _isBuiltinExceptionMatch(condition):
+    if not condition.isExpressionComparisonExceptionMatch():
+        return False
+
+    if not condition.getLeft().isExpressionCaughtExceptionTypeRef():
+        return False
+
+    right = condition.getRight()
+
+    if right.isExpressionMakeTuple():
+        elements = right.getElements()
+    else:
+        elements = (right,)
+
+    for element in elements:
+        if not element.isExpressionBuiltinExceptionRef():
+            return False
+
+    return True
+
+
+def _isReraiseOnly(statements):
+    return len(statements) == 1 and statements[0].isStatementReraiseException()
+
+
+def _collectHandlerReleasePoints(statements, owner, release_points):
+    """ Check the handlers of a try/except for observing the exception.
+
+        The handlers are a chain of conditional statements matching against
+        the caught type, ending in a re-raise or a default handler. Where the
+        exception is known to be no longer needed, the owning sequence is
+        added to "release_points", "None" standing for the top level.
+    """
+
+    if _isReraiseOnly(statements):
+        return True
+
+    if statements and statements[-1].isStatementConditional():
+        conditional = statements[-1]
+        condition = conditional.getCondition()
+
+        yes_branch = conditional.getBranchYes()
+        no_branch = conditional.getBranchNo()
+
+        for statement in statements[:-1]:
+            if not _isQuietHandlerStatement(statement):
+                return False
+
+        if _isBuiltinExceptionMatch(condition) and \
+           yes_branch is not None and no_branch is not None:
+            return _collectHandlerReleasePoints(
+                statements     = yes_branch.getStatements(),
+                owner          = yes_branch,
+                release_points = release_points
+            ) and _collectHandlerReleasePoints(
+                statements     = no_branch.getStatements(),
+                owner          = no_branch,
+                release_points = release_points
+            )
+
+        # Handlers with empty body become an inverted check that re-raises,
+        # after which the exception is not needed anymore.
+        if condition.isExpressionOperationNOT() and \
+           _isBuiltinExceptionMatch(condition.getOperand()) and \
+           yes_branch is not None and no_branch is None and \
+           _isReraiseOnly(yes_branch.getStatements()):
+            release_points.append((owner, True))
+
+            return True
+
+    # Default handler or body of a matching handler.
+    for statement in statements:
+        if not _isQuietHandlerStatement(statement):
+            return False
+
+    release_points.append((owner, False))
+
+    return True
+
+
+def _isHandlingLeavingFrame(node, statements):
+    if not statements or not statements[-1].isStatementAborting():
+        return False
+
+    for statement in statements:
+        if statement.mayBreak() or statement.mayContinue():
+            return False
+
+    current = node.getParent()
+
+    while not current.isExpressionFunctionBody():
+        if current.isPythonModule() or \
+           current.isStatementTryFinally() or \
+           current.isExpressionTryFinally():
+            return False
+
+        current = current.getParent()
+
+    return True
@@ -22,6 +22,11 @@ types.
 """
 
 from nuitka.Utils import python_version
+
+# pylint: disable=W0622
+from nuitka.__past__ import unicode
+# pylint: enable=W0622
+
 from nuitka.Options import isDebug, shallMakeModule
 
 from nuitka.nodes.BuiltinIteratorNodes import (
@@ -38,7 +43,8 @@ from nuitka.nodes.BuiltinTypeNodes import (
     ExpressionBuiltinBool,
     ExpressionBuiltinInt,
     ExpressionBuiltinStr,
-    ExpressionBuiltinSet
+    ExpressionBuiltinSet,
+    ExpressionBuiltinFrozenset
 )
 from nuitka.nodes.BuiltinFormatNodes import (
     ExpressionBuiltinBin,
@@ -65,6 +71,7 @@ from nuitka.nodes.GlobalsLocalsNodes import (
     ExpressionBuiltinDir1
 )
 from nuitka.nodes.OperatorNodes import (
+    ExpressionOperationBinary,
     ExpressionOperationUnary,
     ExpressionOperationNOT
 )
@@ -87,7 +94,13 @@ from nuitka.nodes.TypeNodes import (
 from nuitka.nodes.ClassNodes import ExpressionBuiltinType3
 from nuitka.nodes.CallNodes import (
     ExpressionCallNoKeywords,
-    ExpressionCallEmpty
+    ExpressionCallEmpty,
+    ExpressionCall
+)
+from nuitka.nodes.ContainerMakingNodes import ExpressionMakeTuple
+from nuitka.nodes.ContainerOperationNodes import (
+    ExpressionListOperationAppend,
+    ExpressionSetOperationAdd
 )
 from nuitka.nodes.AttributeNodes import (
     ExpressionAttributeLookup,
@@ -107,12 +120,366 @@ from nuitka.nodes.BuiltinRefNodes import (
     ExpressionBuiltinOriginalRef,
     ExpressionBuiltinRef,
 )
-from nuitka.nodes.StatementNodes import StatementsSequence
+from nuitka.nodes.StatementNodes import (
+    StatementExpressionOnly,
+    StatementsSequence,
+    StatementsFrame
+)
+from nuitka.nodes.ReturnNodes import StatementReturn
 
 from nuitka.tree.ReformulationExecStatements import wrapEvalGlobalsAndLocals
+from nuitka.tree.ReformulationTryExceptStatements import (
+    makeTryExceptSingleHandlerNode,
+    makeReraiseExceptionStatement
+)
 
 from . import BuiltinOptimization
 
+def _isInlinableGeneratorExpression(value):
+    """ Check if a value is a generator expression that can become a loop.
+
+        The generator expression is created and called right there, and its
+        only "yield" is the one of its loop body, so the consumer of the
+        values can be put in its place instead.
+    """
+
+    if not value.isExpressionFunctionCall():
+        return False
+
+    function_body = value.getFunction().getFunctionRef().getFunctionBody()
+
+    if not function_body.isGenerator() or \
+       function_body.getFunctionName() != "<genexpr>":
+        return False
+
+    frame = function_body.getBody()
+
+    if frame is None or \
+       not frame.isStatementsFrame() or \
+       frame.getGuardMode() != "generator" or \
+       not frame.getStatements()[0].isStatementGeneratorEntry():
+        return False
+
+    yields = []
+
+    def collectYields(node):
+        if node.isExpressionYield() or node.isExpressionYieldFrom():
+            yields.append(node)
+
+    frame.visit(None, collectYields)
+
+    return len(yields) == 1 and \
+           yields[0].isExpressionYield() and \
+           yields[0].getParent().isStatementExpressionOnly()
+
+
+def _inlineGeneratorExpression(value, emit_kind):
+    """ Turn a generator expression into a function that consumes its values.
+
+        For "list" and "set" the values are collected into a container, for
+        "sum" they are added up, for "any" and "all" the function returns as
+        soon as the result is known. No generator object is created, the
+        loop runs directly in the function called, like for contractions.
+    """
+
+    # Many kinds of emitting code, pylint: disable=R0914
+
+    function_body = value.getFunction().getFunctionRef().getFunctionBody()
+    source_ref = value.getSourceReference()
+
+    frame = function_body.getBody()
+
+    yields = []
+
+    def collectYields(node):
+        if node.isExpressionYield():
+            yields.append(node)
+
+    frame.visit(None, collectYields)
+
+    yield_statement = yields[0].getParent()
+
+    # The yielded value is computed into a temporary variable, and consumed
+    # from there, while an indicator variable tells that the consumer runs.
+    value_variable = function_body.allocateTempVariable(
+        temp_scope = None,
+        name       = "inlined_value"
+    )
+    consuming_variable = function_body.allocateTempVariable(
+        temp_scope = None,
+        name       = "inlined_consuming"
+    )
+
+    def makeValueRef():
+        return ExpressionTempVariableRef(
+            variable   = value_variable.makeReference(function_body),
+            source_ref = source_ref
+        )
+
+    def makeConsumingAssignment(consuming):
+        return StatementAssignmentVariable(
+            variable_ref = ExpressionTargetTempVariableRef(
+                variable   = consuming_variable.makeReference(function_body),
+                source_ref = source_ref
+            ),
+            source       = ExpressionConstantRef(
+                constant   = consuming,
+                source_ref = source_ref
+            ),
+            source_ref   = source_ref.atInternal()
+        )
+
+    statements = [
+        makeConsumingAssignment(False)
+    ]
+
+    if emit_kind in ("list", "set", "sum"):
+        result_variable = function_body.allocateTempVariable(
+            temp_scope = None,
+            name       = "inlined_result"
+        )
+
+        def makeResultRef():
+            return ExpressionTempVariableRef(
+                variable   = result_variable.makeReference(function_body),
+                source_ref = source_ref
+            )
+
+        start_values = {
+            "list" : [],
+            "set"  : set(),
+            "sum"  : 0
+        }
+
+        statements.append(
+            StatementAssignmentVariable(
+                variable_ref = ExpressionTargetTempVariableRef(
+                    variable   = result_variable.makeReference(function_body),
+                    source_ref = source_ref
+                ),
+                source       = ExpressionConstantRef(
+                    constant   = start_values[emit_kind],
+                    source_ref = source_ref
+                ),
+                source_ref   = source_ref.atInternal()
+            )
+        )
+
+        if emit_kind == "list":
+            emit_statement = StatementExpressionOnly(
+                expression = ExpressionListOperationAppend(
+                    liste      = makeResultRef(),
+                    value      = makeValueRef(),
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        elif emit_kind == "set":
+            emit_statement = StatementExpressionOnly(
+                expression = ExpressionSetOperationAdd(
+                    sete       = makeResultRef(),
+                    value      = makeValueRef(),
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        else:
+            emit_statement = StatementAssignmentVariable(
+                variable_ref = ExpressionTargetTempVariableRef(
+                    variable   = result_variable.makeReference(function_body),
+                    source_ref = source_ref
+                ),
+                source       = ExpressionOperationBinary(
+                    operator   = "Add",
+                    left       = makeResultRef(),
+                    right      = makeValueRef(),
+                    source_ref = source_ref
+                ),
+                source_ref   = source_ref
+            )
+    else:
+        assert emit_kind in ("any", "all"), emit_kind
+
+        def makeResultRef():
+            return ExpressionConstantRef(
+                constant   = emit_kind == "all",
+                source_ref = source_ref
+            )
+
+        consumed = makeValueRef()
+
+        if emit_kind == "all":
+            consumed = ExpressionOperationNOT(
+                operand    = consumed,
+                source_ref = source_ref
+            )
+
+        emit_statement = StatementConditional(
+            condition  = consumed,
+            yes_branch = StatementsSequence(
+                statements = (
+                    StatementReturn(
+                        expression = ExpressionConstantRef(
+                            constant   = emit_kind == "any",
+                            source_ref = source_ref
+                        ),
+                        source_ref = source_ref
+                    ),
+                ),
+                source_ref = source_ref
+            ),
+            no_branch  = None,
+            source_ref = source_ref
+        )
+
+    yield_sequence = yield_statement.getParent()
+    yield_sequence_statements = list(yield_sequence.getStatements())
+    yield_index = yield_sequence_statements.index(yield_statement)
+
+    yield_sequence_statements[yield_index:yield_index+1] = [
+        StatementAssignmentVariable(
+            variable_ref = ExpressionTargetTempVariableRef(
+                variable   = value_variable.makeReference(function_body),
+                source_ref = source_ref
+            ),
+            source       = yields[0].getExpression(),
+            source_ref   = yield_statement.getSourceReference()
+        ),
+        makeConsumingAssignment(True),
+        emit_statement,
+        makeConsumingAssignment(False)
+    ]
+
+    yield_sequence.setStatements(tuple(yield_sequence_statements))
+
+    def makeResultReturn():
+        return StatementReturn(
+            expression = makeResultRef(),
+            source_ref = source_ref
+        )
+
+    # A "StopIteration" raised by the generator expression ends it, and the
+    # consumer gets only the values produced so far, this must be preserved.
+    # One raised by the consumer itself, e.g. from "__radd__" or a truth
+    # check, is not for the generator expression, and must propagate.
+    statements.append(
+        makeTryExceptSingleHandlerNode(
+            tried          = StatementsSequence(
+                statements = frame.getStatements()[1:],
+                source_ref = source_ref
+            ),
+            exception_name = "StopIteration",
+            handler_body   = StatementsSequence(
+                statements = (
+                    StatementConditional(
+                        condition  = ExpressionComparisonIs(
+                            left       = ExpressionTempVariableRef(
+                                variable   = consuming_variable.makeReference(
+                                    function_body
+                                ),
+                                source_ref = source_ref
+                            ),
+                            right      = ExpressionConstantRef(
+                                constant   = True,
+                                source_ref = source_ref
+                            ),
+                            source_ref = source_ref
+                        ),
+                        yes_branch = makeReraiseExceptionStatement(
+                            source_ref = source_ref
+                        ),
+                        no_branch  = None,
+                        source_ref = source_ref
+                    ),
+                    makeResultReturn(),
+                ),
+                source_ref = source_ref
+            ),
+            public_exc     = False,
+            source_ref     = source_ref
+        )
+    )
+    statements.append(makeResultReturn())
+
+    # The frame is a real one, so tracebacks show the generator expression
+    # like they do for CPython.
+    function_body.setBody(
+        StatementsFrame(
+            statements    = statements,
+            guard_mode    = "full",
+            var_names     = (),
+            arg_count     = 0,
+            kw_only_count = 0,
+            has_starlist  = False,
+            has_stardict  = False,
+            code_name     = "<genexpr>",
+            source_ref    = source_ref
+        )
+    )
+
+    function_body.unmarkAsGenerator()
+
+    return value
+
+
+def _inlineGeneratorExpressionArg(node, emit_kind):
+    """ Inline a generator expression given as the only argument of a call.
+
+        Returns the replacement for the call or None, if the argument is not a
+        generator expression or if keyword arguments were given.
+    """
+    kw = node.getCallKw()
+
+    if not kw.isMappingWithConstantStringKeys() or \
+       kw.getMappingStringKeyPairs():
+        return None
+
+    args = node.getCallArgs()
+
+    if not args.canPredictIterationValues():
+        return None
+
+    positional = args.getIterationValues()
+
+    if len(positional) != 1 or \
+       not _isInlinableGeneratorExpression(positional[0]):
+        return None
+
+    return _inlineGeneratorExpression(positional[0], emit_kind)
+
+
+def _makeGeneratorExpressionArgList(node):
+    """ Pass a list instead of a generator expression, if it's the only
+        positional argument of a call.
+
+        Used for consumers that need all values anyway before doing anything
+        else with them. The list is filled without any generator object being
+        created.
+    """
+    args = node.getCallArgs()
+
+    if not args.canPredictIterationValues():
+        return None
+
+    positional = args.getIterationValues()
+
+    if len(positional) != 1 or \
+       not _isInlinableGeneratorExpression(positional[0]):
+        return None
+
+    return ExpressionCall(
+        called     = node.getCalled(),
+        args       = ExpressionMakeTuple(
+            elements   = (
+                _inlineGeneratorExpression(positional[0], "list"),
+            ),
+            source_ref = args.getSourceReference()
+        ),
+        kw         = node.getCallKw(),
+        source_ref = node.getSourceReference()
+    )
+
+
 def dir_extractor(node):
     def buildDirEmptyCase(source_ref):
         if node.getParentVariableProvider().isPythonModule():
@@ -360,11 +727,25 @@ if python_version < 300:
     from nuitka.nodes.BuiltinRangeNodes import ExpressionBuiltinXrange
 
     def xrange_extractor(node):
+        # Only the calls that CPython accepts, with 1 to 3 positional
+        # arguments, others are left to give their error at run time, which
+        # is not the one of argument matching.
+        kw = node.getCallKw()
+
+        if not kw.isExpressionConstantRef() or kw.getConstant() != {}:
+            return None
+
+        args = node.getCallArgs()
+
+        if not args.canPredictIterationValues() or \
+           not 1 <= len(args.getIterationValues()) <= 3:
+            return None
+
         return BuiltinOptimization.extractBuiltinArgs(
             node          = node,
             builtin_class = ExpressionBuiltinXrange,
             builtin_spec  = BuiltinOptimization.builtin_xrange_spec
-    )
+        )
 
 
 def len_extractor(node):
@@ -375,24 +756,59 @@ def len_extractor(node):
     )
 
 def tuple_extractor(node):
+    def makeTupleFromGeneratorExpression(value, source_ref):
+        if value is not None and _isInlinableGeneratorExpression(value):
+            value = _inlineGeneratorExpression(value, "list")
+
+        return ExpressionBuiltinTuple(
+            value      = value,
+            source_ref = source_ref
+        )
+
     return BuiltinOptimization.extractBuiltinArgs(
         node          = node,
-        builtin_class = ExpressionBuiltinTuple,
+        builtin_class = makeTupleFromGeneratorExpression,
         builtin_spec  = BuiltinOptimization.builtin_tuple_spec
     )
 
 def list_extractor(node):
-    return BuiltinOptimization.extractBuiltinArgs(
-        node          = node,
-        builtin_class = ExpressionBuiltinList,
-        builtin_spec  = BuiltinOptimization.builtin_list_spec
-    )
+    result = _inlineGeneratorExpressionArg(node, "list")
+
+    if result is None:
+        result = BuiltinOptimization.extractBuiltinArgs(
+            node          = node,
+            builtin_class = ExpressionBuiltinList,
+            builtin_spec  = BuiltinOptimization.builtin_list_spec
+        )
+
+    return result
 
 def set_extractor(node):
+    result = _inlineGeneratorExpressionArg(node, "set")
+
+    if result is None:
+        result = BuiltinOptimization.extractBuiltinArgs(
+            node          = node,
+            builtin_class = ExpressionBuiltinSet,
+            builtin_spec  = BuiltinOptimization.builtin_set_spec
+        )
+
+    return result
+
+def sum_extractor(node):
+    return _inlineGeneratorExpressionArg(node, "sum")
+
+def any_extractor(node):
+    return _inlineGeneratorExpressionArg(node, "any")
+
+def all_extractor(node):
+    return _inlineGeneratorExpressionArg(node, "all")
+
+def frozenset_extractor(node):
     return BuiltinOptimization.extractBuiltinArgs(
         node          = node,
-        builtin_class = ExpressionBuiltinSet,
-        builtin_spec  = BuiltinOptimization.builtin_set_spec
+        builtin_class = ExpressionBuiltinFrozenset,
+        builtin_spec  = BuiltinOptimization.builtin_frozenset_spec
     )
 
 def float_extractor(node):
@@ -546,6 +962,25 @@ def eval_extractor(node):
             source_ref   = source_ref
         )
 
+        # Constant source code can be stripped at compile time already, which
+        # also allows to compile it at compile time.
+        if source.isExpressionConstantRef() and \
+           type(source.getConstant()) in (str, unicode):
+            return ExpressionTryFinally(
+                tried      = tried,
+                expression = ExpressionBuiltinEval(
+                    source_code = ExpressionConstantRef(
+                        constant   = source.getConstant().strip(" \t"),
+                        source_ref = source_ref
+                    ),
+                    globals_arg = globals_ref,
+                    locals_arg  = locals_ref,
+                    source_ref  = source_ref
+                ),
+                final      = final,
+                source_ref = source_ref
+            )
+
         source_variable = provider.allocateTempVariable(
             temp_scope = temp_scope,
             name       = "source"
@@ -890,6 +1325,7 @@ _dispatch_dict = {
     "list"       : list_extractor,
     "dict"       : dict_extractor,
     "set"        : set_extractor,
+    "frozenset"  : frozenset_extractor,
     "float"      : float_extractor,
     "str"        : str_extractor,
     "bool"       : bool_extractor,
@@ -900,19 +1336,37 @@ _dispatch_dict = {
     "hasattr"    : hasattr_extractor,
     "getattr"    : getattr_extractor,
     "setattr"    : setattr_extractor,
-    "isinstance" : isinstance_extractor
+    "isinstance" : isinstance_extractor,
+    "sum"        : sum_extractor,
+    "any"        : any_extractor,
+    "all"        : all_extractor
 }
 
 if python_version < 300:
     _dispatch_dict[ "long" ] = long_extractor
     _dispatch_dict[ "unicode" ] = unicode_extractor
     _dispatch_dict[ "execfile" ] = execfile_extractor
+    _dispatch_dict[ "xrange" ] = xrange_extractor
 
     # The handling of 'open' built-in for Python3 is not yet correct.
     _dispatch_dict[ "open" ] = open_extractor
 else:
     _dispatch_dict[ "exec" ] = exec_extractor
 
+def computeStringJoinCall(call_node):
+    """ Optimize calls of "join" on a constant string.
+
+        The "join" makes a list of its argument anyway, so a generator
+        expression can just be a list contraction instead.
+    """
+    new_node = _makeGeneratorExpressionArgList(call_node)
+
+    if new_node is None:
+        return call_node, None, None
+
+    return new_node, "new_expression", """\
+Replaced generator expression argument of string 'join' with a list."""
+
 def check():
     from nuitka.Builtins import builtin_names
 
@@ -965,6 +1419,12 @@ Replaced call to builtin %s with unary operation %s.""" % (
                 inspect_node.kind,
                 inspect_node.getOperator()
             )
+        elif inspect_node.isExpressionFunctionCall():
+            tags = "new_expression"
+            message = """\
+Replaced call to builtin %s with inlined generator expression.""" % (
+                builtin_name,
+            )
         elif inspect_node.isExpressionCall():
             tags = "new_expression"
             message = """\
@@ -25,6 +25,7 @@ from nuitka.nodes.VariableRefNodes import (
 from nuitka.nodes.ConstantRefNodes import ExpressionConstantRef
 from nuitka.nodes.TryNodes import StatementTryFinally
 from nuitka.nodes.BuiltinIteratorNodes import (
+    ExpressionSpecialUnpackIter1,
     StatementSpecialUnpackCheck,
     ExpressionSpecialUnpack,
     ExpressionBuiltinIter1,
@@ -97,6 +98,28 @@ def buildExtSliceNode(provider, node, source_ref):
         source_ref    = source_ref
     )
 
+def _getUnpackedSourceValues( source, count ):
+    # Values of a sequence built right at the assignment source, if it has the
+    # right size to be unpacked, otherwise None.
+    if source.isExpressionMakeTuple() or source.isExpressionMakeList():
+        elements = source.getElements()
+
+        if len( elements ) == count:
+            return elements
+    elif source.isExpressionConstantRef() and \
+         type( source.getConstant() ) in ( tuple, list ) and \
+         len( source.getConstant() ) == count:
+        return [
+            ExpressionConstantRef(
+                constant   = value,
+                source_ref = source.getSourceReference()
+            )
+            for value in
+            source.getConstant()
+        ]
+
+    return None
+
 def buildAssignmentStatementsFromDecoded( provider, kind, detail, source,
                                           source_ref ):
     # This is using many variable names on purpose, so as to give names to the
@@ -141,25 +164,6 @@ def buildAssignmentStatementsFromDecoded( provider, kind, detail, source,
     elif kind == "Tuple":
         temp_scope = provider.allocateTempScope( "tuple_unpack" )
 
-        source_iter_var = provider.allocateTempVariable(
-            temp_scope = temp_scope,
-            name       = "source_iter"
-        )
-
-        statements = [
-            StatementAssignmentVariable(
-                variable_ref = ExpressionTargetTempVariableRef(
-                    variable   = source_iter_var.makeReference( provider ),
-                    source_ref = source_ref
-                ),
-                source = ExpressionBuiltinIter1(
-                    value      = source,
-                    source_ref = source_ref
-                ),
-                source_ref   = source_ref
-            )
-        ]
-
         element_vars = [
             provider.allocateTempVariable(
                 temp_scope = temp_scope,
@@ -171,62 +175,121 @@ def buildAssignmentStatementsFromDecoded( provider, kind, detail, source,
 
         starred = False
 
-        for element_index, element in enumerate( detail ):
-            element_var = element_vars[ element_index ]
+        for element in detail:
+            if element[0] == "Starred":
+                starred = True
+
+        if starred:
+            source_values = None
+        else:
+            source_values = _getUnpackedSourceValues( source, len( detail ) )
 
-            if element[0] != "Starred":
+        statements = []
+
+        if source_values is not None:
+            # The source is a sequence built right here with the correct size,
+            # e.g. "a, b = b, a", its values can be used directly without
+            # creating the sequence.
+            source_iter_var = None
+
+            for element_var, source_value in zip( element_vars, source_values ):
                 statements.append(
                     StatementAssignmentVariable(
                         variable_ref = ExpressionTargetTempVariableRef(
                             variable   = element_var.makeReference( provider ),
                             source_ref = source_ref
                         ),
-                        source = ExpressionSpecialUnpack(
-                            value      = ExpressionTempVariableRef(
-                                variable   = source_iter_var.makeReference(
-                                    provider
-                                ),
-                                source_ref = source_ref
-                            ),
-                            count      = element_index + 1,
-                            source_ref = source_ref
-                        ),
+                        source       = source_value,
                         source_ref   = source_ref
                     )
                 )
+        else:
+            source_iter_var = provider.allocateTempVariable(
+                temp_scope = temp_scope,
+                name       = "source_iter"
+            )
+
+            # Without a starred target, exact tuples and lists are not iterated,
+            # but indexed.
+            if starred:
+                iter_class = ExpressionBuiltinIter1
             else:
-                starred = True
+                iter_class = ExpressionSpecialUnpackIter1
 
-                statements.append(
-                    StatementAssignmentVariable(
-                        variable_ref = ExpressionTargetTempVariableRef(
-                            variable   = element_var.makeReference( provider ),
-                            source_ref = source_ref
-                        ),
-                        source = ExpressionBuiltinList(
-                            value      = ExpressionTempVariableRef(
-                                variable   = source_iter_var.makeReference(
+            statements.append(
+                StatementAssignmentVariable(
+                    variable_ref = ExpressionTargetTempVariableRef(
+                        variable   = source_iter_var.makeReference( provider ),
+                        source_ref = source_ref
+                    ),
+                    source = iter_class(
+                        value      = source,
+                        source_ref = source_ref
+                    ),
+                    source_ref   = source_ref
+                )
+            )
+
+            for element_index, element in enumerate( detail ):
+                element_var = element_vars[ element_index ]
+
+                if element[0] != "Starred":
+                    statements.append(
+                        StatementAssignmentVariable(
+                            variable_ref = ExpressionTargetTempVariableRef(
+                                variable   = element_var.makeReference(
                                     provider
                                 ),
                                 source_ref = source_ref
                             ),
-                            source_ref = source_ref
-                        ),
-                        source_ref   = source_ref
+                            source = ExpressionSpecialUnpack(
+                                value      = ExpressionTempVariableRef(
+                                    variable   = source_iter_var.makeReference(
+                                        provider
+                                    ),
+                                    source_ref = source_ref
+                                ),
+                                count      = element_index + 1,
+                                source_ref = source_ref
+                            ),
+                            source_ref   = source_ref
+                        )
+                    )
+                else:
+                    statements.append(
+                        StatementAssignmentVariable(
+                            variable_ref = ExpressionTargetTempVariableRef(
+                                variable   = element_var.makeReference(
+                                    provider
+                                ),
+                                source_ref = source_ref
+                            ),
+                            source = ExpressionBuiltinList(
+                                value      = ExpressionTempVariableRef(
+                                    variable   = source_iter_var.makeReference(
+                                        provider
+                                    ),
+                                    source_ref = source_ref
+                                ),
+                                source_ref = source_ref
+                            ),
+                            source_ref   = source_ref
+                        )
                     )
-                )
 
-        if not starred:
-            statements.append(
-                StatementSpecialUnpackCheck(
-                    iterator   = ExpressionTempVariableRef(
-                        variable   = source_iter_var.makeReference( provider ),
+            if not starred:
+                statements.append(
+                    StatementSpecialUnpackCheck(
+                        iterator   = ExpressionTempVariableRef(
+                            variable   = source_iter_var.makeReference(
+                                provider
+                            ),
+                            source_ref = source_ref
+                        ),
+                        count      = len( detail ),
                         source_ref = source_ref
-                    ),
-                    count      = len( detail ),
-                    source_ref = source_ref
+                    )
                 )
-            )
 
         for element_index, element in enumerate( detail ):
             if element[0] == "Starred":
@@ -249,16 +312,17 @@ def buildAssignmentStatementsFromDecoded( provider, kind, detail, source,
 
         final_statements = []
 
-        final_statements.append(
-            StatementDelVariable(
-                variable_ref = ExpressionTargetTempVariableRef(
-                    variable   = source_iter_var.makeReference( provider ),
-                    source_ref = source_ref
-                ),
-                tolerant     = True,
-                source_ref   = source_ref
+        if source_iter_var is not None:
+            final_statements.append(
+                StatementDelVariable(
+                    variable_ref = ExpressionTargetTempVariableRef(
+                        variable   = source_iter_var.makeReference( provider ),
+                        source_ref = source_ref
+                    ),
+                    tolerant     = True,
+                    source_ref   = source_ref
+                )
             )
-        )
 
         # TODO: In that order, or reversed.
         for element_var in element_vars:
@@ -17,11 +17,9 @@
 #
 
 from nuitka.nodes.ConstantRefNodes import ExpressionConstantRef
-from nuitka.nodes.CallNodes import ExpressionCall
-from nuitka.nodes.FunctionNodes import (
-    ExpressionFunctionCreation,
-    ExpressionFunctionCall,
-    ExpressionFunctionRef
+from nuitka.nodes.CallNodes import (
+    ExpressionCall,
+    ExpressionCallComplex
 )
 from .Helpers import (
     makeSequenceCreationOrConstant,
@@ -67,9 +65,6 @@ def buildCallNode(provider, node, source_ref):
 
 def _makeCallNode(called, positional_args, keys, values, list_star_arg,
                   dict_star_arg, source_ref):
-    # Many variables, but only to cover the many complex call cases.
-    # pylint: disable=R0914
-
     if list_star_arg is None and dict_star_arg is None:
         return ExpressionCall(
             called  = called,
@@ -87,98 +82,32 @@ def _makeCallNode(called, positional_args, keys, values, list_star_arg,
             source_ref      = source_ref,
         )
     else:
-        # Dispatch to complex helper function for each case. These do
-        # re-formulation of complex calls according to developer manual.
-
-        key = (
-            len(positional_args) > 0,
-            len(keys) > 0,
-            list_star_arg is not None,
-            dict_star_arg is not None
-        )
-
-        from .ComplexCallHelperFunctions import (
-            getFunctionCallHelperPosKeywordsStarList,
-            getFunctionCallHelperPosStarList,
-            getFunctionCallHelperKeywordsStarList,
-            getFunctionCallHelperStarList,
-            getFunctionCallHelperPosKeywordsStarDict,
-            getFunctionCallHelperPosStarDict,
-            getFunctionCallHelperKeywordsStarDict,
-            getFunctionCallHelperStarDict,
-            getFunctionCallHelperPosKeywordsStarListStarDict,
-            getFunctionCallHelperPosStarListStarDict,
-            getFunctionCallHelperKeywordsStarListStarDict,
-            getFunctionCallHelperStarListStarDict,
-        )
-
-        table = {
-            (  True,   True,  True, False ) :
-                getFunctionCallHelperPosKeywordsStarList,
-            (  True,  False,  True, False ) :
-                getFunctionCallHelperPosStarList,
-            ( False,   True,  True, False ) :
-                getFunctionCallHelperKeywordsStarList,
-            ( False,  False,  True, False ) :
-                getFunctionCallHelperStarList,
-            (  True,   True, False,  True ) :
-                getFunctionCallHelperPosKeywordsStarDict,
-            (  True,  False, False,  True ) :
-                getFunctionCallHelperPosStarDict,
-            ( False,   True, False,  True ) :
-                getFunctionCallHelperKeywordsStarDict,
-            ( False,  False, False,  True ) :
-                getFunctionCallHelperStarDict,
-            (  True,   True,  True,  True ) :
-                getFunctionCallHelperPosKeywordsStarListStarDict,
-            (  True,  False,  True,  True ) :
-                getFunctionCallHelperPosStarListStarDict,
-            ( False,   True,  True,  True ) :
-                getFunctionCallHelperKeywordsStarListStarDict,
-            ( False,  False,  True,  True ) :
-                getFunctionCallHelperStarListStarDict,
-        }
-
-        get_helper = table[ key ]
-
-        helper_args = [ called ]
-
+        # Complex calls merge the star arguments into the positional and
+        # keyword arguments at run time, see developer manual.
         if positional_args:
-            helper_args.append(
-                makeSequenceCreationOrConstant(
-                    sequence_kind = "tuple",
-                    elements      = positional_args,
-                    source_ref    = source_ref
-                )
+            args = makeSequenceCreationOrConstant(
+                sequence_kind = "tuple",
+                elements      = positional_args,
+                source_ref    = source_ref
             )
+        else:
+            args = None
 
         if keys:
-            helper_args.append(
-                makeDictCreationOrConstant(
-                    keys       = keys,
-                    values     = values,
-                    lazy_order = True,
-                    source_ref = source_ref
-                )
+            kw = makeDictCreationOrConstant(
+                keys       = keys,
+                values     = values,
+                lazy_order = True,
+                source_ref = source_ref
             )
-
-        if list_star_arg is not None:
-            helper_args.append( list_star_arg )
-
-        if dict_star_arg is not None:
-            helper_args.append( dict_star_arg )
-
-        return ExpressionFunctionCall(
-            function   = ExpressionFunctionCreation(
-                function_ref = ExpressionFunctionRef(
-                    function_body = get_helper(),
-                    source_ref    = source_ref
-                ),
-                defaults     = (),
-                kw_defaults  = None,
-                annotations  = None,
-                source_ref   = source_ref
-            ),
-            values     = helper_args,
-            source_ref = source_ref,
+        else:
+            kw = None
+
+        return ExpressionCallComplex(
+            called        = called,
+            args          = args,
+            kw            = kw,
+            list_star_arg = list_star_arg,
+            dict_star_arg = dict_star_arg,
+            source_ref    = source_ref
         )
@@ -16,6 +16,8 @@
 #     limitations under the License.
 #
 
+import operator
+
 from nuitka import Utils
 
 from nuitka.nodes.ParameterSpecs import ParameterSpec
@@ -80,6 +82,286 @@ from .Helpers import (
     getKind
 )
 
+# Operations that compile time simulation of contractions may perform. Powers
+# and left shifts are not included, they too easily create huge values, and
+# the result of division depends on future flags.
+_simulation_binary_operations = {
+    "Add"      : operator.add,
+    "Sub"      : operator.sub,
+    "Mult"     : operator.mul,
+    "FloorDiv" : operator.floordiv,
+    "Mod"      : operator.mod,
+    "RShift"   : operator.rshift,
+    "BitAnd"   : operator.and_,
+    "BitOr"    : operator.or_,
+    "BitXor"   : operator.xor,
+}
+
+_simulation_unary_operations = {
+    "UAdd"   : operator.pos,
+    "USub"   : operator.neg,
+    "Invert" : operator.invert,
+    "Not"    : operator.not_,
+}
+
+# Identity comparisons are not included, the identity of constants is not
+# something the compiled program can be expected to share.
+_simulation_comparisons = {
+    "Eq"    : operator.eq,
+    "NotEq" : operator.ne,
+    "Lt"    : operator.lt,
+    "LtE"   : operator.le,
+    "Gt"    : operator.gt,
+    "GtE"   : operator.ge,
+    "In"    : lambda value, container: value in container,
+    "NotIn" : lambda value, container: value not in container,
+}
+
+# Limit for the number of iterations and sizes of sequences created during
+# simulation, same as for other constant folding.
+_simulation_limit = 256
+
+if Utils.python_version < 300:
+    _simulation_index_types = (int, long)
+else:
+    _simulation_index_types = (int,)
+
+
+class _SimulationFailed(Exception):
+    pass
+
+
+def _getTargetNames(target):
+    kind = getKind(target)
+
+    if kind == "Name":
+        return (target.id,)
+    elif kind in ("Tuple", "List"):
+        result = ()
+
+        for element in target.elts:
+            element_names = _getTargetNames(element)
+
+            if element_names is None:
+                return None
+
+            result += element_names
+
+        return result
+    else:
+        return None
+
+
+def _isSimulatable(node, names):
+    kind = getKind(node)
+
+    if kind in ("Num", "Str", "Bytes"):
+        return True
+    elif kind == "Name":
+        return node.id in names
+    elif kind in ("Tuple", "List"):
+        for element in node.elts:
+            if not _isSimulatable(element, names):
+                return False
+
+        return True
+    elif kind == "BinOp":
+        return getKind(node.op) in _simulation_binary_operations and \
+               _isSimulatable(node.left, names) and \
+               _isSimulatable(node.right, names)
+    elif kind == "UnaryOp":
+        return getKind(node.op) in _simulation_unary_operations and \
+               _isSimulatable(node.operand, names)
+    elif kind == "Compare":
+        for op in node.ops:
+            if getKind(op) not in _simulation_comparisons:
+                return False
+
+        for value in [node.left] + node.comparators:
+            if not _isSimulatable(value, names):
+                return False
+
+        return True
+    elif kind == "BoolOp":
+        for value in node.values:
+            if not _isSimulatable(value, names):
+                return False
+
+        return True
+    elif kind == "IfExp":
+        return _isSimulatable(node.test, names) and \
+               _isSimulatable(node.body, names) and \
+               _isSimulatable(node.orelse, names)
+    elif kind == "Subscript":
+        return getKind(node.slice) == "Index" and \
+               _isSimulatable(node.value, names) and \
+               _isSimulatable(node.slice.value, names)
+    else:
+        return False
+
+
+def _simulateMult(left, right):
+    # Do not let sequence repetition create huge constants.
+    for sequence, count in ((left, right), (right, left)):
+        if type(count) in _simulation_index_types and \
+           hasattr(sequence, "__len__") and \
+           len(sequence) * count > _simulation_limit:
+            raise _SimulationFailed
+
+    return left * right
+
+
+def _simulate(node, values):
+    # Dispatching on the AST kind, pylint: disable=R0911,R0912
+    kind = getKind(node)
+
+    if kind == "Num":
+        return node.n
+    elif kind in ("Str", "Bytes"):
+        return node.s
+    elif kind == "Name":
+        return values[node.id]
+    elif kind == "Tuple":
+        return tuple(_simulate(element, values) for element in node.elts)
+    elif kind == "List":
+        return [_simulate(element, values) for element in node.elts]
+    elif kind == "BinOp":
+        left = _simulate(node.left, values)
+        right = _simulate(node.right, values)
+
+        if getKind(node.op) == "Mult":
+            return _simulateMult(left, right)
+        else:
+            return _simulation_binary_operations[getKind(node.op)](left, right)
+    elif kind == "UnaryOp":
+        return _simulation_unary_operations[getKind(node.op)](
+            _simulate(node.operand, values)
+        )
+    elif kind == "Compare":
+        left = _simulate(node.left, values)
+
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _simulate(comparator, values)
+
+            if not _simulation_comparisons[getKind(op)](left, right):
+                return False
+
+            left = right
+
+        return True
+    elif kind == "BoolOp":
+        is_and = getKind(node.op) == "And"
+
+        for value in node.values:
+            result = _simulate(value, values)
+
+            if bool(result) is not is_and:
+                break
+
+        return result
+    elif kind == "IfExp":
+        if _simulate(node.test, values):
+            return _simulate(node.body, values)
+        else:
+            return _simulate(node.orelse, values)
+    elif kind == "Subscript":
+        return _simulate(node.value, values)[
+            _simulate(node.slice.value, values)
+        ]
+    else:
+        assert False, kind
+
+
+def _assignSimulatedTarget(target, value, values):
+    if getKind(target) == "Name":
+        values[target.id] = value
+    else:
+        value = tuple(value)
+
+        if len(value) != len(target.elts):
+            raise _SimulationFailed
+
+        for element, element_value in zip(target.elts, value):
+            _assignSimulatedTarget(element, element_value, values)
+
+
+def _makeContractionSimulator(node, emit_class, assign_provider):
+    """ Create a simulator for a contraction, if it's pure.
+
+        A contraction with a single loop, whose conditions and values only
+        use constants, the loop variables, and simple operations on them, can
+        be computed at compile time, once the iterated value is known to be a
+        constant. The simulator returns the result and the values assigned to
+        the loop variables in the outer scope, or None if that is not possible.
+    """
+
+    if len(node.generators) != 1:
+        return None
+
+    qual = node.generators[0]
+    target_names = _getTargetNames(qual.target)
+
+    if target_names is None:
+        return None
+
+    if emit_class is ExpressionDictOperationSet:
+        emitted = (node.key, node.value)
+    else:
+        emitted = (node.elt,)
+
+    for value in emitted + tuple(qual.ifs):
+        if not _isSimulatable(value, target_names):
+            return None
+
+    def simulator(iterated):
+        # Every problem is a reason to not do it at compile time, and leave it
+        # to run time to do the real thing, pylint: disable=W0703
+        try:
+            iterated = tuple(iterated)
+
+            if len(iterated) > _simulation_limit:
+                return None
+
+            values = {}
+
+            if emit_class is ExpressionDictOperationSet:
+                result = {}
+            elif emit_class is ExpressionSetOperationAdd:
+                result = set()
+            else:
+                result = []
+
+            for value in iterated:
+                _assignSimulatedTarget(qual.target, value, values)
+
+                for condition in qual.ifs:
+                    if not _simulate(condition, values):
+                        break
+                else:
+                    if emit_class is ExpressionDictOperationSet:
+                        result[_simulate(node.key, values)] = \
+                          _simulate(node.value, values)
+                    elif emit_class is ExpressionSetOperationAdd:
+                        result.add(_simulate(node.elt, values))
+                    else:
+                        result.append(_simulate(node.elt, values))
+        except Exception:
+            return None
+
+        if assign_provider and iterated:
+            assignments = tuple(
+                (target_name, values[target_name])
+                for target_name in
+                target_names
+            )
+        else:
+            assignments = ()
+
+        return result, assignments
+
+    return simulator
+
+
 def buildListContractionNode(provider, node, source_ref):
     # List contractions are dealt with by general code.
 
@@ -166,6 +448,19 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
         source_ref = source_ref
     )
 
+    # Module level contractions are executed only once, during module
+    # initialization. When they are pure, they can become constants instead.
+    if provider.isPythonModule() and \
+       emit_class is not ExpressionYield and \
+       not source_ref.isExecReference():
+        function_body.setContractionSimulator(
+            _makeContractionSimulator(
+                node            = node,
+                emit_class      = emit_class,
+                assign_provider = assign_provider
+            )
+        )
+
     if start_value is not None:
         container_tmp = function_body.allocateTempVariable(
             temp_scope = None,
@@ -267,6 +562,7 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
                 ),
                 source_ref = source_ref
             )
+            value_iterator.markAsLoopOnly()
 
             tmp_iter_variable = function_body.allocateTempVariable(
                 temp_scope = None,
@@ -439,6 +735,17 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
         )
     )
 
+    # The iterator is given to the function as an argument only.
+    iter_source = ExpressionBuiltinIter1(
+        value      = buildNode(
+            provider   = provider,
+            node       = node.generators[0].iter,
+            source_ref = source_ref
+        ),
+        source_ref = source_ref
+    )
+    iter_source.markAsLoopOnly()
+
     return ExpressionFunctionCall(
         function   = ExpressionFunctionCreation(
             function_ref = ExpressionFunctionRef(
@@ -451,14 +758,7 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
             source_ref   = source_ref
         ),
         values     = (
-            ExpressionBuiltinIter1(
-                value      = buildNode(
-                    provider   = provider,
-                    node       = node.generators[0].iter,
-                    source_ref = source_ref
-                ),
-                source_ref = source_ref
-            ),
+            iter_source,
         ),
         source_ref = source_ref
     )
@@ -22,6 +22,10 @@ source code comments with developer manual sections.
 
 """
 
+# pylint: disable=W0622
+from nuitka.__past__ import unicode
+# pylint: enable=W0622
+
 from nuitka.nodes.ExceptionNodes import StatementRaiseException
 from nuitka.nodes.BuiltinRefNodes import ExpressionBuiltinExceptionRef
 from nuitka.nodes.ConstantRefNodes import ExpressionConstantRef
@@ -295,6 +299,29 @@ exec: arg 1 must be a string, file, or code object""",
 
     source_code = buildNode(provider, body, source_ref)
 
+    # Constant strings cannot be files, so they need no keeper variable, and
+    # staying a constant allows them to be compiled ahead of time.
+    if source_code.isExpressionConstantRef() and \
+       type(source_code.getConstant()) in (str, unicode):
+        tried.setChild(
+            "statements",
+            tried.getStatements() + (
+                StatementExec(
+                    source_code = source_code,
+                    globals_arg = globals_ref,
+                    locals_arg  = locals_ref,
+                    source_ref  = source_ref
+                ),
+            )
+        )
+
+        return StatementTryFinally(
+            tried      = tried,
+            final      = final,
+            public_exc = False,
+            source_ref = source_ref
+        )
+
     source_variable = provider.allocateTempVariable(
         temp_scope = temp_scope,
         name       = "source"
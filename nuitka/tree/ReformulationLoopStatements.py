@@ -212,6 +212,12 @@ def buildForLoopNode(provider, node, source_ref):
         )
     )
 
+    iter_source = ExpressionBuiltinIter1(
+        value       = source,
+        source_ref  = source.getSourceReference()
+    )
+    iter_source.markAsLoopOnly()
+
     statements += [
         # First create the iterator and store it.
         StatementAssignmentVariable(
@@ -221,10 +227,7 @@ def buildForLoopNode(provider, node, source_ref):
                 ),
                 source_ref = source_ref
             ),
-            source       = ExpressionBuiltinIter1(
-                value       = source,
-                source_ref  = source.getSourceReference()
-            ),
+            source       = iter_source,
             source_ref   = source_ref
         ),
         StatementTryFinally(
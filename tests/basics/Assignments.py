@@ -251,6 +251,74 @@ def globalErrors():
         print("Del on unassigned global gives", repr(e))
 
 
+def unpackingCounts():
+    def unpackThree(value):
+        try:
+            a, b, c = value
+        except ValueError as e:
+            print("Unpacking", repr(value), "gives", repr(e))
+        else:
+            print("Unpacking", repr(value), "gives", a, b, c)
+
+    print("Unpacking sources with wrong sizes:")
+
+    for value in ((1, 2), [1, 2], (1, 2, 3, 4), [1, 2, 3, 4], (), [], "ab", "abcd"):
+        unpackThree(value)
+
+    try:
+        a, b = 1, 2, 3
+    except ValueError as e:
+        print("Unpacking too many built values gives", repr(e))
+
+    try:
+        a, b, c = [1, 2]
+    except ValueError as e:
+        print("Unpacking too few built values gives", repr(e))
+
+def unpackingMutatedList():
+    print("Unpacking a list changed by the assignment targets:")
+
+    values = [1, 2, 3]
+
+    class Target(object):
+        def __setattr__(self, name, value):
+            values.append(value)
+            del values[0]
+
+            print("Assigned", name, value, "list now", values)
+
+    target = Target()
+    target.a, target.b, c = values
+
+    print("Last value", c, "list", values)
+
+def unpackingSubclasses():
+    print("Unpacking sequence subclasses with their own iteration:")
+
+    class TupleSubclass(tuple):
+        def __iter__(self):
+            return iter(("iterated", "from", "tuple"))
+
+    class ListSubclass(list):
+        def __iter__(self):
+            return iter(["iterated", "from", "list"])
+
+    class ShortListSubclass(list):
+        def __iter__(self):
+            return iter([1])
+
+    a, b, c = TupleSubclass((1, 2, 3))
+    print(a, b, c)
+
+    a, b, c = ListSubclass([1, 2, 3])
+    print(a, b, c)
+
+    try:
+        a, b, c = ShortListSubclass([1, 2, 3])
+    except ValueError as e:
+        print("Subclass iterating fewer values gives", repr(e))
+
+
 someFunction()
 varargsFunction(1,2,3,4)
 otherFunction()
@@ -262,3 +330,6 @@ optimizeableTargets()
 complexDel()
 sliceDel()
 globalErrors()
+unpackingCounts()
+unpackingMutatedList()
+unpackingSubclasses()
@@ -300,3 +300,14 @@ try:
     open()
 except TypeError as e:
     print "Open without arguments gives", repr(e)
+
+def compileConstant():
+    return compile("1+2", "<constant>", "eval")
+
+print "Compile of constant source gives new code objects", \
+    compileConstant() is not compileConstant(), \
+    compileConstant() == compileConstant(), \
+    eval(compileConstant())
+
+code = compileConstant()
+print "Compiled code object", code.co_filename, code.co_name, code.co_consts
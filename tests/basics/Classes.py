@@ -156,3 +156,68 @@ class ClassesWithNestedClass:
             return { 'a':2 }
 
 print ClassesWithNestedClass, ClassesWithNestedClass().NestedClass, ClassesWithNestedClass().NestedClass().getDict()
+
+print "Method calls with changes after the first calls:"
+
+def callMethods(objects):
+    # Each call site is used for several objects, so its cache gets warm
+    # before the changes are seen.
+    return [ obj.method(1) for obj in objects ]
+
+class NewStyleMethods(object):
+    def method(self, x):
+        return "class method", x
+
+class OldStyleMethods:
+    def method(self, x):
+        return "old class method", x
+
+for cls in (NewStyleMethods, OldStyleMethods):
+    first = cls()
+    second = cls()
+    third = cls()
+
+    print callMethods([first, second])
+
+    # Shadowed in the instance dictionary, once the cache is warm.
+    second.__dict__["method"] = lambda x: ("instance dict", x)
+    print callMethods([first, second, first])
+
+    # Replaced in the class at run time.
+    def replacement(self, x):
+        return "replaced method", x
+
+    cls.method = replacement
+    print callMethods([first, second, third])
+
+    del second.__dict__["method"]
+    print callMethods([second, third])
+
+class WithGetattr(object):
+    def method(self, x):
+        return "found method", x
+
+    def __getattr__(self, name):
+        return lambda x: ("__getattr__", name, x)
+
+class WithGetattribute(object):
+    def method(self, x):
+        return "hidden method", x
+
+    def __getattribute__(self, name):
+        return lambda x: ("__getattribute__", name, x)
+
+class OldStyleWithGetattr:
+    def __getattr__(self, name):
+        return lambda x: ("old __getattr__", name, x)
+
+print callMethods(
+    [ NewStyleMethods(), WithGetattr(), WithGetattribute(),
+      OldStyleWithGetattr(), OldStyleMethods() ]
+)
+
+def otherName(obj):
+    return obj.other(2)
+
+print otherName(WithGetattr()), otherName(WithGetattribute()), \
+    otherName(OldStyleWithGetattr())
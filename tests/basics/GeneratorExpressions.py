@@ -225,3 +225,69 @@ def strangeLambdaGeneratorExpression():
     print list(x)
 
 strangeLambdaGeneratorExpression()
+
+def builtinConsumers():
+    print "Generator expressions consumed by built-ins:"
+
+    def noMore():
+        raise StopIteration
+
+    print "sum", sum(x for x in range(5)), sum(x for x in range(5) if x != 3 or noMore())
+    print "any", any(x > 2 for x in range(5)), any(x > 2 or noMore() for x in range(5))
+    print "all", all(x < 9 for x in range(5)), all(x < 2 or noMore() for x in range(5))
+    print "list", list(x * 2 for x in range(5)), list(x if x < 3 else noMore() for x in range(5))
+    print "set", sorted(set(x % 3 for x in range(9))), tuple(x for x in "abc")
+    print "join", "-".join(str(x) for x in range(4))
+
+    class StopAdding(object):
+        def __radd__(self, other):
+            raise StopIteration
+
+    class StopTruth(object):
+        def __nonzero__(self):
+            raise StopIteration
+
+    for consumer, values in ((sum, [1, StopAdding()]), (any, [0, StopTruth()]), (all, [1, StopTruth()])):
+        try:
+            print consumer.__name__, consumer(x for x in values)
+        except StopIteration:
+            print consumer.__name__, "raised StopIteration from consumer"
+
+    def key(value):
+        print "key", value
+        return value
+
+    def noisy(value):
+        print "produced", value
+        return value
+
+    print "max", max((noisy(x) for x in range(3)), key = key)
+    print "min", min((noisy(x) for x in range(3)), key = key)
+
+    try:
+        dict(noisy(x) for x in ((1, 2), 3, (4, 5)))
+    except TypeError as e:
+        print "dict raised", e
+
+builtinConsumers()
+
+def consumerTracebackFrames():
+    import sys
+
+    def h():
+        return sum(1 // x for x in (1, 0))
+
+    try:
+        h()
+    except ZeroDivisionError:
+        tb = sys.exc_info()[2]
+
+        names = []
+
+        while tb is not None:
+            names.append(tb.tb_frame.f_code.co_name)
+            tb = tb.tb_next
+
+        print "Traceback frames", names[1:]
+
+consumerTracebackFrames()
@@ -53,3 +53,29 @@ print "List sclice inplace [y:]", h
 h[:] += (5,5,5)
 
 print "List sclice inplace [:]", h
+
+def numberOperations(a, b):
+    r = a
+    r += b
+    s = a
+    s -= b
+    m = a
+    m *= b
+
+    return a + b, a - b, a * b, r, s, m
+
+import sys
+
+print "Int overflow to long:"
+print numberOperations(sys.maxint, 1)
+print numberOperations(-sys.maxint - 1, 1)
+print numberOperations(sys.maxint, sys.maxint)
+print numberOperations(2**31, 2**31)
+print numberOperations(-2**32, 2**32 + 1)
+
+print "Float and int mixed:"
+print numberOperations(1.5, 2)
+print numberOperations(2, 1.5)
+print numberOperations(sys.maxint, 0.5)
+print numberOperations(-3, -0.25)
+print numberOperations(1e308, 10)
@@ -145,3 +145,37 @@ def loopingFunction(a = 1*2):
         print "Executed else branch of while loop without break"
 
 loopingFunction()
+
+def rangeIterators(count):
+    # Loops over ranges may use a special iterator, explicit ones must not.
+    x = iter( range( count ) )
+    print "Explicit range iterator", type( x ), x.__length_hint__(), list( x )
+
+    for x in range( count ):
+        print "Range loop", x,
+    print
+
+    for x in xrange( 1, count, 2 ):
+        print "Xrange loop", x,
+    print
+
+rangeIterators( 5 )
+
+def rangeArgumentErrors():
+    # The errors for bad arguments must be those of CPython.
+    try:
+        xrange()
+    except TypeError as e:
+        print "xrange without arguments", repr( e )
+
+    try:
+        xrange( 1, 2, 3, 4 )
+    except TypeError as e:
+        print "xrange with four arguments", repr( e )
+
+    try:
+        xrange( stop = 2 )
+    except TypeError as e:
+        print "xrange with keyword argument", repr( e )
+
+rangeArgumentErrors()
@@ -275,3 +275,55 @@ try:
     functionwithTwoArgsOneDefaulted(b=12)
 except TypeError, e:
     print repr(e)
+
+print "Call function with many parameters using keyword names not given as constants:"
+
+def functionWithManyParameters(aa, bb, cc, ddd, eeee = 5):
+    return aa, bb, cc, ddd, eeee
+
+def makeName(*parts):
+    return "".join(parts)
+
+print "Same length names:", functionWithManyParameters(
+    **{
+        makeName("c", "c") : 3,
+        makeName("a", "a") : 1,
+        makeName("b", "b") : 2,
+        makeName("d", "dd") : 4
+    }
+)
+
+try:
+    functionWithManyParameters(
+        1, 2, 3, 4,
+        **{makeName("z", "z") : 5}
+    )
+except TypeError, e:
+    print "Unknown name of used length:", repr(e)
+
+try:
+    functionWithManyParameters(
+        1, 2, 3, 4,
+        **{makeName("unknown", "_name") : 5}
+    )
+except TypeError, e:
+    print "Unknown name of unused length:", repr(e)
+
+class StrSubclass(str):
+    pass
+
+print "String subclass names:", functionWithManyParameters(
+    1, 2, 3,
+    **{
+        StrSubclass("ddd") : 4,
+        StrSubclass(makeName("ee", "ee")) : 6
+    }
+)
+
+try:
+    functionWithManyParameters(
+        1, 2, 3, 4,
+        **{StrSubclass("ff") : 5}
+    )
+except TypeError, e:
+    print "Unknown string subclass name:", repr(e)
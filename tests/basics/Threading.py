@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#     Copyright 2014, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+import threading, time
+
+result = None
+
+def setResult():
+    global result
+    result = "set by thread"
+
+def waitCallFree():
+    # Loops without calls must give other threads their turn too.
+    thread = threading.Thread(target = setResult)
+    thread.start()
+
+    while result is None:
+        pass
+
+    thread.join()
+
+    print "Call free loop saw:", result
+
+waitCallFree()
+
+def watchdog():
+    global result
+
+    time.sleep(0.1)
+    result = "set by watchdog"
+
+def waitWatchdog():
+    global result
+    result = None
+
+    # The watchdog is idle at first, and only later waits for its turn.
+    thread = threading.Thread(target = watchdog)
+    thread.start()
+
+    count = 0
+    while result is None:
+        count += 1
+
+    thread.join()
+
+    print "Counting loop saw:", result, count > 0
+
+waitWatchdog()
+
+def countThreads(count):
+    totals = []
+
+    def worker(n):
+        total = 0
+        for i in range(n):
+            total += i
+
+        totals.append(total)
+
+    threads = [
+        threading.Thread(target = worker, args = (count,))
+        for _i in range(4)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    print "Threads computed:", totals
+
+countThreads(100000)
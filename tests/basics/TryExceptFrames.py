@@ -43,4 +43,34 @@ def catcher():
 
 catcher()
 
+def lookup(d, key):
+    try:
+        return d[ key ]
+    except KeyError:
+        return None
+
+def lookupMismatch(d, key):
+    try:
+        value = d[ key ]
+
+        return value
+    except (IndexError, TypeError):
+        return None
+
+def quietHandlers():
+    try:
+        raise ValueError
+    except ValueError:
+        print "Lookups", lookup( {}, 1 ), lookup( { 1 : 2 }, 1 )
+        print "Current exception is kept", sys.exc_info()[0]
+
+    try:
+        lookupMismatch( {}, 1 )
+    except KeyError:
+        tb = sys.exc_info()[2]
+
+        print "Re-raised from line", tb.tb_next.tb_lineno - lookupMismatch.func_code.co_firstlineno
+
+quietHandlers()
+
 print "Good bye."
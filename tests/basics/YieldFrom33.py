@@ -120,3 +120,39 @@ def gen_compiled():
     yield from range(7)
 
 print( list( gen_compiled() ) )
+
+class ThrowingIterator:
+    def __init__(self, mode):
+        self.mode = mode
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return "next value"
+
+    def throw(self, *args):
+        if self.mode == "stop":
+            raise StopIteration("stop value")
+        elif self.mode == "raise":
+            raise ValueError("raised by throw")
+        else:
+            return "throw value"
+
+def delegatingGenerator(mode):
+    result = yield from ThrowingIterator(mode)
+    print("Yield from gave", result)
+    yield "after yield from"
+
+def test_throw_into_iterator():
+    for mode in ("stop", "raise", "value"):
+        g = delegatingGenerator(mode)
+        print(next(g))
+
+        try:
+            print("Throw gave", g.throw(KeyError("thrown")))
+            print("Next gave", next(g))
+        except Exception as e:
+            print("Throw raised", repr(e))
+
+test_throw_into_iterator()
@@ -17,7 +17,7 @@
 #     limitations under the License.
 #
 
-import os, sys
+import os, sys, json
 
 # Find common code relative in file system. Not using packages for test stuff.
 sys.path.insert(
@@ -34,7 +34,8 @@ from test_common import (
     setup,
     decideFilenameVersionSkip,
     compareWithCPython,
-    hasDebugPython
+    hasDebugPython,
+    getTempDir
 )
 
 python_version = setup(needs_io_encoding = True)
@@ -55,6 +56,20 @@ if not os.path.exists( "BigConstants.py" ):
         output.write( "# Automatically generated test, not part of releases or git.\n\n" )
         output.write( "print( '%s' )\n" % ( "1234" * 17000 ) )
 
+# Code generation options that are not the default, these tests exercise them,
+# and are run again with each of them.
+option_tests = {
+    "HelloWorld.py"           : ("--trace-startup",),
+    "GeneratorExpressions.py" : ("--stackless-generators",
+                                 "--generator-stack-size=64"),
+    "TryYieldFinally.py"      : ("--stackless-generators",),
+    "TryExceptFrames.py"      : ("--code-gen-error-lines",),
+    "ExceptionRaising.py"     : ("--code-gen-error-lines",),
+    "Threading.py"            : ("--call-free-loop-ticks=4",),
+}
+
+extra_options = os.environ.get("NUITKA_EXTRA_OPTIONS", "")
+
 # Now run all the tests in this directory.
 for filename in sorted(os.listdir(".")):
     if not filename.endswith(".py"):
@@ -105,5 +120,48 @@ for filename in sorted(os.listdir(".")):
             search_mode = search_mode,
             needs_2to3  = needs_2to3
         )
+
+        for option in option_tests.get(filename, ()):
+            my_print("Again with option", option)
+
+            os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + " " + option
+
+            # Make the startup trace actually record something.
+            if option == "--trace-startup":
+                os.environ["NUITKA_STARTUP_TRACE"] = os.path.join(
+                    getTempDir(),
+                    "startup.json"
+                )
+
+            compareWithCPython(
+                path        = path,
+                extra_flags = extra_flags,
+                search_mode = search_mode,
+                needs_2to3  = needs_2to3
+            )
+
+            if "NUITKA_STARTUP_TRACE" in os.environ:
+                trace_filename = os.environ.pop("NUITKA_STARTUP_TRACE")
+
+                if not os.path.exists(trace_filename):
+                    sys.exit(
+                        "Error, no startup trace written to '%s'." % trace_filename
+                    )
+
+                # Trace viewers need it to be valid JSON.
+                try:
+                    with open(trace_filename) as trace_file:
+                        json.load(trace_file)
+                except ValueError as e:
+                    sys.exit(
+                        "Error, startup trace '%s' is not JSON: %s" % (
+                            trace_filename,
+                            e
+                        )
+                    )
+
+                os.unlink(trace_filename)
+
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
     else:
         my_print("Skipping", filename)
@@ -98,5 +98,19 @@ Error, no package in dir '%s' found, incomplete test case.""" % filename
             search_mode = search_mode,
             needs_2to3  = False
         )
+
+        # Again as a module using the shared run time library. Imports are not
+        # followed then, the package code is used from source.
+        my_print( "Again with shared run time:", path )
+
+        os.environ[ "NUITKA_EXTRA_OPTIONS" ] = \
+          "--shared-runtime --output-dir=%s" % getTempDir()
+
+        compareWithCPython(
+            path        = os.path.join( filename, filename_main ),
+            extra_flags = extra_flags,
+            search_mode = search_mode,
+            needs_2to3  = False
+        )
     else:
         my_print( "Skipping", filename )